@@ -3,36 +3,98 @@ FastAPI Dependencies for Yetria Career Guidance Platform
 JWT token validation and user authentication dependencies
 """
 
-from fastapi import Depends, HTTPException, status
+import hmac
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from ..core.database import get_db
-from ..core.security import verify_token
+from ..core.config import settings
+from ..core.database import get_db, SessionLocal
+from ..core.security import decode_token
+from ..crud.revoked_token_crud import is_access_token_revoked
 from ..crud.user_crud import get_user_by_email
 from ..models import User as UserModel
+from ..services.model_manager import model_manager
+from ..services.user_cache import user_cache
+from .schemas import TokenClaims
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> UserModel:
+def _bearer_token(credentials: HTTPAuthorizationCredentials) -> str:
+    # Clean token - remove Bearer prefix if present
+    token = credentials.credentials
+    if token.startswith("Bearer "):
+        token = token[7:]  # Remove "Bearer " prefix
+    return token
+
+
+def get_current_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
     """
-    Get current authenticated user from JWT token
+    Get the raw bearer token of the request (e.g. to revoke it)
     
     Args:
         credentials: HTTP Bearer token credentials
-        db: Database session
         
     Returns:
-        User: Authenticated user object
+        str: JWT access token
+    """
+    return _bearer_token(credentials)
+
+
+def _revoked_in_database(tokenid: str) -> bool:
+    """Checks revocations made by any worker; runs once per token and process (token cache miss)."""
+    db = SessionLocal()
+    try:
+        return is_access_token_revoked(db, tokenid)
+    finally:
+        db.close()
+
+
+def _claims_from_payload(payload: dict) -> Optional[TokenClaims]:
+    """
+    Builds the caller's claims from a decoded token payload
+
+    Tokens issued before claims were added only carry the email (sub);
+    those are resolved with one lookup until they expire.
+    """
+    if payload.get("uid") is not None:
+        return TokenClaims(
+            userid=payload["uid"], email=payload["sub"], name=payload.get("name"), usertypeid=payload.get("utype")
+        )
+
+    db = SessionLocal()
+    try:
+        user = get_user_by_email(db, email=payload["sub"])
+        if user is None:
+            return None
+        return TokenClaims(userid=user.userid, email=user.email, name=user.name, usertypeid=user.usertypeid)
+    finally:
+        db.close()
+
+
+def get_current_claims(
+    token: str = Depends(get_current_token)
+) -> TokenClaims:
+    """
+    Get the identity of the caller from the JWT token, without a database lookup
+    
+    Claims reflect the user as of token issue; routes that need the current
+    profile should depend on get_current_user instead.
+    
+    Args:
+        token: JWT access token
+        
+    Returns:
+        TokenClaims: Authenticated user's id, email, name and user type
         
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,22 +102,44 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    # Clean token - remove Bearer prefix if present
-    token = credentials.credentials
-    if token.startswith("Bearer "):
-        token = token[7:]  # Remove "Bearer " prefix
-    
-    # Verify the JWT token
-    email = verify_token(token)
+    # Verify the JWT token (cached after the first request; revoked tokens fail)
+    payload = decode_token(token, is_revoked=_revoked_in_database)
+    if payload is None:
+        raise credentials_exception
     
-    if email is None:
+    claims = _claims_from_payload(payload)
+    if claims is None:
         raise credentials_exception
     
-    # Get user from database
-    user = get_user_by_email(db, email=email)
+    return claims
+
+
+def get_current_user(
+    claims: TokenClaims = Depends(get_current_claims),
+    db: Session = Depends(get_db)
+) -> UserModel:
+    """
+    Get current authenticated user from JWT token
+    
+    Args:
+        claims: Identity from the access token
+        db: Database session
+        
+    Returns:
+        User: Authenticated user object (a cached, detached copy; read only)
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    # Get user from the user cache, loading it from the database on a miss
+    user = user_cache.get(db, claims.userid)
     
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
     return user
 
@@ -112,11 +196,50 @@ def get_optional_current_user(
         return None
     
     try:
-        email = verify_token(credentials.credentials)
-        if email is None:
+        payload = decode_token(_bearer_token(credentials), is_revoked=_revoked_in_database)
+        if payload is None:
             return None
         
-        user = get_user_by_email(db, email=email)
-        return user  # All users are considered active
+        claims = _claims_from_payload(payload)
+        if claims is None:
+            return None
+        return user_cache.get(db, claims.userid)  # All users are considered active
     except:
-        return None
\ No newline at end of file
+        return None
+
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(default=None)
+) -> None:
+    """
+    Guard for operational endpoints (model reload, status)
+    
+    Args:
+        x_admin_token: Value of the X-Admin-Token header
+        
+    Raises:
+        HTTPException: If admin endpoints are disabled or the token does not match
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled"
+        )
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_API_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token"
+        )
+
+def require_model_ready() -> None:
+    """
+    Guard for routes that need the prediction model
+    
+    Raises:
+        HTTPException: 503 with Retry-After while the model is still loading
+    """
+    if not model_manager.is_ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Prediction model is warming up, please retry shortly",
+            headers={"Retry-After": "5"}
+        )
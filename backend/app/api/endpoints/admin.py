@@ -0,0 +1,37 @@
+"""
+Admin endpoints for Yetria Career Guidance Platform
+Operational endpoints: model status and zero-downtime model reload
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from ...api.dependencies import require_admin_token
+from ...services.model_manager import model_manager
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/model")
+def get_model_status():
+    """
+    Active model version and last reload timing
+    """
+    return model_manager.status()
+
+
+@router.post("/model/reload", status_code=status.HTTP_202_ACCEPTED)
+def reload_model(version: Optional[str] = None):
+    """
+    Load an artifact version in the background and swap it in once warmed up.
+    Requests already being scored finish on the previous model.
+    
+    Args:
+        version: Registered artifact version (defaults to artifacts/CURRENT)
+    """
+    if not model_manager.reload_in_background(version):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A model reload is already in progress"
+        )
+    return model_manager.status()
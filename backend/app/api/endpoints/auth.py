@@ -4,23 +4,82 @@ User registration and login endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
+from typing import Optional
 
 from ...core.database import get_db
-from ...core.security import create_access_token
+from ...core.security import create_access_token, user_token_claims
 from ...core.config import settings
-from ...crud.user_crud import create_user, get_user_by_email, authenticate_user
-from ...api.schemas import UserCreate, User as UserSchema, Token, UserLogin
-from ...api.dependencies import get_current_user
+from ...crud.revoked_token_crud import revoke_access_token
+from ...crud.user_crud import create_user, get_user_by_email, update_password_hash
+from ...services.auth_executor import auth_executor, AuthPoolSaturated
+from ...api.schemas import UserCreate, User as UserSchema, Token, UserLogin, TokenClaims
+from ...api.dependencies import get_current_claims, get_current_token
 from ...models import User as UserModel
 
 router = APIRouter()
 
+# Seconds clients are asked to wait when the password hashing pool is full
+AUTH_RETRY_AFTER_SECONDS = 1
+
+
+def auth_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": str(AUTH_RETRY_AFTER_SECONDS)},
+    )
+
+
+def find_user_and_release(db: Session, email: str) -> Optional[UserModel]:
+    """
+    Look up a user by email, then end the read transaction so the database
+    connection goes back to the pool while the password is hashed or verified
+    (the returned user is detached but keeps its loaded columns)
+    """
+    user = get_user_by_email(db, email)
+    if user is not None:
+        db.expunge(user)
+    db.rollback()
+    return user
+
+
+async def authenticate(db: Session, email: str, password: str) -> Optional[UserModel]:
+    """
+    Authenticate user with email and password, verifying the hash on the auth pool
+    and storing an upgraded hash when its scheme or cost is outdated
+    
+    Args:
+        db: Database session
+        email: User email
+        password: User password
+        
+    Returns:
+        Optional[UserModel]: User object if authentication successful, None otherwise
+        
+    Raises:
+        HTTPException: 429 if the auth pool is saturated
+    """
+    user = await run_in_threadpool(find_user_and_release, db, email)
+    if not user:
+        return None
+    try:
+        verified, new_hash = await auth_executor.verify_and_update(password, user.passwordhash)
+    except AuthPoolSaturated:
+        raise auth_pool_busy()
+    if not verified:
+        return None
+    if new_hash is not None:
+        await run_in_threadpool(update_password_hash, db, user.userid, new_hash)
+        user.passwordhash = new_hash
+    return user
+
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     user_create: UserCreate,
     db: Session = Depends(get_db)
 ):
@@ -35,30 +94,34 @@ def register_user(
         Token: JWT access token for the newly created user
         
     Raises:
-        HTTPException: If email already exists
+        HTTPException: If email already exists, or 429 if the auth pool is saturated
     """
     # Check if user already exists
-    existing_user = get_user_by_email(db, email=user_create.email)
+    existing_user = await run_in_threadpool(find_user_and_release, db, user_create.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Create new user
-    user = create_user(db=db, user_create=user_create)
+    # Hash on the auth pool, then create the new user
+    try:
+        hashed_password = await auth_executor.hash_password(user_create.password)
+    except AuthPoolSaturated:
+        raise auth_pool_busy()
+    user = await run_in_threadpool(create_user, db, user_create, hashed_password)
     
     # Generate access token for the new user
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=user_token_claims(user), expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -73,9 +136,9 @@ def login_for_access_token(
         Token: JWT access token
         
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid, or 429 if the auth pool is saturated
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -85,14 +148,14 @@ def login_for_access_token(
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=user_token_claims(user), expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/login", response_model=Token)
-def login_user(
+async def login_user(
     user_login: UserLogin,
     db: Session = Depends(get_db)
 ):
@@ -107,9 +170,9 @@ def login_user(
         Token: JWT access token
         
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid, or 429 if the auth pool is saturated
     """
-    user = authenticate_user(db, user_login.email, user_login.password)
+    user = await authenticate(db, user_login.email, user_login.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,7 +182,7 @@ def login_user(
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=user_token_claims(user), expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
@@ -127,15 +190,23 @@ def login_user(
 
 @router.post("/logout")
 def logout_user(
-    current_user: UserModel = Depends(get_current_user)
+    current_user: TokenClaims = Depends(get_current_claims),
+    token: str = Depends(get_current_token),
+    db: Session = Depends(get_db)
 ):
     """
-    Logout user (client-side token removal)
+    Logout user: revoke the access token until it expires
+    
+    The token is rejected at once by this worker; other workers reject it
+    once it leaves their verified-token cache (TOKEN_CACHE_TTL_SECONDS).
     
     Args:
         current_user: Current authenticated user
+        token: Access token of the request
+        db: Database session
         
     Returns:
         dict: Logout confirmation message
     """
-    return {"message": "Successfully logged out"}
\ No newline at end of file
+    revoke_access_token(db, token)
+    return {"message": "Successfully logged out"}
@@ -4,9 +4,10 @@ Course API endpoints for Yetria Career Guidance Platform
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ...core.database import get_db
+from ...core.database import get_db, get_async_db
 from ...crud.course_crud import (
     get_all_courses,
     get_course_by_id,
@@ -39,9 +40,9 @@ def get_course_by_id_endpoint(course_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/courses/recommendations", response_model=List[CourseSchema])
-def get_course_recommendations(
+async def get_course_recommendations(
     request: CourseRecommendationRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get course recommendations based on competency keywords
@@ -53,9 +54,9 @@ def get_course_recommendations(
     # Use limit from request or default to 7
     limit = request.limit if request.limit else 7
     
-    courses = get_courses_by_competency_keywords(
-        db, 
-        request.competency_keywords, 
+    courses = await db.run_sync(
+        get_courses_by_competency_keywords,
+        request.competency_keywords,
         limit
     )
     
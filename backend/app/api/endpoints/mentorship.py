@@ -2,18 +2,19 @@
 Mentorship endpoints: recommend mentors and manage mentorship requests
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
-from typing import List
+from typing import List, Optional
 
-from ...core.database import get_db
-from ...api.dependencies import get_current_active_user
+from ...core.database import get_db, get_async_db
+from ...api.dependencies import get_current_claims
+from ...crud.mentorship_crud import list_student_requests
+from ...crud.competency_aggregate_crud import get_user_competency_averages
+from ...services.mentor_cache import mentor_cache
 from ...models import (
-    User as UserModel,
-    MentorProfile,
     MatchStatus,
-    Occupation,
     MentorMatch,
 )
 from ...api.schemas import (
@@ -21,68 +22,72 @@ from ...api.schemas import (
     MentorshipRequestCreate,
     MentorshipRequestSchema,
     MentorshipRequestDetailSchema,
+    TokenClaims,
 )
 
 router = APIRouter()
 
 
+def rank_occupation_mentors(db: Session, occupation_title: str, user_id: int) -> List[dict]:
+    """Mentors of the occupation, ordered by fit to the user's competency scores once they have any."""
+    occupation_id = mentor_cache.get_occupation_id(db, occupation_title)
+    if occupation_id is None:
+        return []
+
+    # No status filtering - mentorprofile has no statusid column
+    # Mentor profiles joined with User for username, cached per occupation
+    mentors = mentor_cache.get_mentors(db, occupation_id)
+    averages = get_user_competency_averages(db, user_id)
+    if averages and mentors:
+        ranker = mentor_cache.get_ranker(db)
+        mentors = ranker.rank(mentors, ranker.student_vector(averages))
+    return mentors
+
+
 @router.get("/mentors/recommend", response_model=List[MentorProfileSchema])
-def recommend_mentors(
+async def recommend_mentors(
     occupation_title: str,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    limit: Optional[int] = Query(default=None, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
-    Return all mentors for the given occupation title.
+    Return all mentors for the given occupation title (a page of them with limit/offset).
+    Mentors are ordered by fit to the user's competency scores (matchscore, 0-100)
+    once the user has answered scenarios.
     Note: mentorprofile table has NO statusid - all mentors are shown.
     """
-    occupation = db.query(Occupation).filter(Occupation.title == occupation_title).first()
-    if not occupation:
-        return []
-
-    # No status filtering - mentorprofile has no statusid column
-    mentors = db.query(MentorProfile).filter(
-        MentorProfile.occupationid == occupation.occupationid
-    ).all()
-    
-    # enrich with username from User table
-    result = []
-    for m in mentors:
-        item = {
-            "mentorprofileid": m.mentorprofileid,
-            "userid": m.userid,
-            "occupationid": m.occupationid,
-            "statusid": None,  # No statusid in mentorprofile table
-            "company": m.company,
-            "title": m.title,
-            "photourl": m.photourl,
-            "bio": m.bio,
-            "supporttopics": m.supporttopics,
-            "quote": m.quote,
-            "username": db.query(UserModel.name).filter(UserModel.userid == m.userid).scalar()
-        }
-        result.append(item)
-    return result
+    mentors = await db.run_sync(rank_occupation_mentors, occupation_title, current_user.userid)
+    end = offset + limit if limit is not None else None
+    return mentors[offset:end]
 
 
 @router.post("/mentorship/requests", response_model=MentorshipRequestSchema)
 def create_mentorship_request(
     body: MentorshipRequestCreate,
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Create a mentorship request (mentormatch) for the current user.
-    Default status is 'Talep Gönderildi' (id=1), matchscore is 0.0
+    Default status is 'Talep Gönderildi' (id=1), matchscore is the mentor's fit
+    to the user's competency scores (0.0 before any answers)
     """
     pending_status = db.query(MatchStatus).filter(MatchStatus.statusname.ilike('%Talep%')).first()
     status_id = pending_status.matchstatusid if pending_status else 1
 
+    match_score = None
+    averages = get_user_competency_averages(db, current_user.userid)
+    if averages:
+        ranker = mentor_cache.get_ranker(db)
+        match_score = ranker.mentor_score(ranker.student_vector(averages), body.mentorprofileid)
+
     req = MentorMatch(
         studentuserid=current_user.userid,
         mentorprofileid=body.mentorprofileid,
         matchstatusid=status_id,
-        matchscore=0.0,  # Default matchscore for new requests
+        matchscore=match_score if match_score is not None else 0.0,
         requestdate=func.now()
     )
     db.add(req)
@@ -93,50 +98,21 @@ def create_mentorship_request(
 
 @router.get("/mentorship/requests", response_model=List[MentorshipRequestDetailSchema])
 def list_my_mentorship_requests(
+    response: Response,
+    limit: Optional[int] = Query(default=None, ge=1, le=100),
+    cursor: Optional[int] = None,
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     List all mentorship requests (mentormatch) for the current user with detailed info
     Includes mentor name, company, title, photo and status name
+    With limit, returns one page; X-Next-Cursor holds the cursor of the next page
     """
-    # Query mentormatch table with JOIN to get mentor and status info
-    requests = db.query(MentorMatch).filter(
-        MentorMatch.studentuserid == current_user.userid
-    ).all()
-    
-    result = []
-    for req in requests:
-        # Get mentor profile
-        mentor_profile = db.query(MentorProfile).filter(
-            MentorProfile.mentorprofileid == req.mentorprofileid
-        ).first()
-        
-        # Get mentor user info
-        mentor_user = None
-        if mentor_profile:
-            mentor_user = db.query(UserModel).filter(
-                UserModel.userid == mentor_profile.userid
-            ).first()
-        
-        # Get status name
-        status = db.query(MatchStatus).filter(
-            MatchStatus.matchstatusid == req.matchstatusid
-        ).first()
-        
-        # Build detailed response (keeping old field names for frontend compatibility)
-        detail = {
-            "mentorshiprequestid": req.mentormatchid,
-            "userid": req.studentuserid,
-            "mentorprofileid": req.mentorprofileid,
-            "statusid": req.matchstatusid,
-            "createdat": req.requestdate,
-            "mentor_name": mentor_user.name if mentor_user else None,
-            "mentor_company": mentor_profile.company if mentor_profile else None,
-            "mentor_title": mentor_profile.title if mentor_profile else None,
-            "mentor_photourl": mentor_profile.photourl if mentor_profile else None,
-            "status_name": status.statusname if status else None
-        }
-        result.append(detail)
-    
-    return result
\ No newline at end of file
+    # Single query joining mentor profile, mentor user and status
+    requests, next_cursor = list_student_requests(
+        db, current_user.userid, limit=limit, after_id=cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return requests
@@ -4,30 +4,62 @@ User response submission and prediction endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
 
-from ...core.database import get_db
-from ...crud.response_crud import save_user_responses, get_user_response_count
-from ...crud.assessment_result_crud import save_user_assessment_result, get_user_assessment_result_as_dict
+from ...core.database import get_db, get_async_db, SessionLocal
+from ...crud.response_crud import save_user_responses, get_user_stage_progress
+from ...crud.scenario_crud import STAGE_COUNT
+from ...crud.competency_aggregate_crud import get_user_competency_totals
+from ...crud.assessment_result_crud import (
+    save_user_assessment_result, get_user_assessment_result_as_dict,
+    compute_response_fingerprint, get_result_snapshot, save_result_snapshot
+)
 from ...services.transformation_service import transform_responses_to_scores
-from ...services.prediction_service import PredictionService
-from ...api.schemas import ResponseIn, PredictionResultSchema
-from ...api.dependencies import get_current_active_user
-from ...models import User as UserModel
-from ... import models
+from ...services.model_manager import model_manager
+from ...services.prediction_batcher import PredictionBatcher
+from ...services.result_writer import AssessmentResultWriter
+from ...core.config import settings
+from ...core.metrics import metrics
+from ...api.schemas import ResponseIn, PredictionResultSchema, TokenClaims
+from ...api.dependencies import get_current_claims, require_model_ready
 
 router = APIRouter()
 
-# Initialize prediction service
-prediction_service = PredictionService()
+result_snapshot_hits_total = metrics.counter("result_snapshot_hits_total", "/responses/result served from the stored snapshot")
+result_snapshot_misses_total = metrics.counter("result_snapshot_misses_total", "/responses/result recomputed with the model")
 
+# Coalesce concurrent predictions into batched model calls
+prediction_batcher = PredictionBatcher(
+    model_manager,
+    window_ms=settings.PREDICTION_BATCH_WINDOW_MS,
+    max_batch_size=settings.PREDICTION_BATCH_MAX_SIZE,
+    workers=settings.PREDICTION_BATCH_WORKERS
+)
 
-@router.post("/responses", response_model=PredictionResultSchema)
-def submit_responses_and_predict(
+# Persist assessment results after the response has been sent
+result_writer = AssessmentResultWriter(
+    SessionLocal,
+    max_queue_size=settings.ASSESSMENT_RESULT_QUEUE_SIZE,
+    workers=settings.ASSESSMENT_RESULT_WRITERS,
+    max_retries=settings.ASSESSMENT_RESULT_WRITE_RETRIES
+)
+
+
+async def predict_user_scores(user_scores: dict) -> dict:
+    """Runs a prediction through the batcher when batching is enabled, otherwise on a worker thread."""
+    if settings.PREDICTION_BATCHING_ENABLED:
+        return await prediction_batcher.predict_and_analyze(user_scores)
+    return await run_in_threadpool(model_manager.predict_and_analyze, user_scores)
+
+
+@router.post("/responses", response_model=PredictionResultSchema, dependencies=[Depends(require_model_ready)])
+async def submit_responses_and_predict(
     responses: List[ResponseIn],
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Submit user responses to scenarios and get career prediction
@@ -42,38 +74,25 @@ def submit_responses_and_predict(
     """
     try:
         # 1. Save responses to database
-        saved_count = save_user_responses(db=db, responses=responses, user_id=current_user.userid)
+        saved_count = await db.run_sync(save_user_responses, responses, current_user.userid)
         
-        # 2. Get ALL user responses from database (not just current stage)
-        # Query all responses for this user from database
-        q = db.query(
-            models.ScenarioOption.score,
-            models.Competency.name,
-            models.Scenario.scenarioid,
-            models.ScenarioOption.scenariooptionid
-        ).join(
-            models.UserResponse, models.UserResponse.scenariooptionid == models.ScenarioOption.scenariooptionid
-        ).join(
-            models.Scenario, models.Scenario.scenarioid == models.ScenarioOption.scenarioid
-        ).join(
-            models.Competency, models.Competency.competencyid == models.Scenario.competencyid
-        ).filter(models.UserResponse.userid == current_user.userid)
-        
-        rows = q.all()
+        # 2. Get per-competency totals over ALL user responses (not just current stage),
+        # maintained incrementally by save_user_responses
+        rows = await db.run_sync(get_user_competency_totals, current_user.userid)
         
         # Calculate competency scores from ALL responses
         totals = {}
         counts = {}
-        for score, comp_name, scenario_id, option_id in rows:
+        for comp_name, total, count in rows:
             # Clean competency name (remove extra spaces, quotes, etc.)
             comp_name_clean = str(comp_name).strip().replace("'", "").replace('"', '')
-            totals[comp_name_clean] = totals.get(comp_name_clean, 0) + float(score)
-            counts[comp_name_clean] = counts.get(comp_name_clean, 0) + 1
+            totals[comp_name_clean] = totals.get(comp_name_clean, 0) + float(total)
+            counts[comp_name_clean] = counts.get(comp_name_clean, 0) + count
         
         user_scores = {k: round(totals[k] / counts[k], 1) for k in totals}
         
         # 3. Get prediction from ML model
-        prediction_result = prediction_service.predict_and_analyze(user_scores)
+        prediction_result = await predict_user_scores(user_scores)
         
         # 4. Check for errors in prediction
         if "error" in prediction_result:
@@ -82,9 +101,11 @@ def submit_responses_and_predict(
                 detail=prediction_result["error"]
             )
         
-        # 5. Save complete assessment result to database
+        # 5. Save complete assessment result to database (in the background unless the queue is full)
+        if settings.ASSESSMENT_RESULT_ASYNC_WRITES and result_writer.submit(current_user.userid, prediction_result):
+            return prediction_result
         try:
-            save_user_assessment_result(db=db, user_id=current_user.userid, prediction_result=prediction_result)
+            await db.run_sync(save_user_assessment_result, current_user.userid, prediction_result)
         except Exception as save_error:
             print(f"Warning: Could not save assessment result: {str(save_error)}")
             # Don't fail the request if saving result fails
@@ -103,24 +124,21 @@ def submit_responses_and_predict(
 @router.get("/responses/progress")
 def get_user_progress(
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Return user's assessment progress.
-    total_responses: toplam verilen cevap sayısı
-    current_stage: sıradaki aşama (1-4, hepsi bitti ise 4)
-    completed_stages: biten aşamaların dizisi
+    total_responses: cevaplanan farklı senaryo sayısı
+    current_stage: sıradaki aşama (ilk tamamlanmamış aşama, hepsi bitti ise son aşama)
+    completed_stages: tüm senaryoları cevaplanmış aşamalar
     """
     try:
-        total = get_user_response_count(db, current_user.userid)
-        # Each stage has 4 scenarios
-        completed = total // 4
-        if completed > 4:
-            completed = 4
-        current_stage = completed + 1 if completed < 4 else 4
-        completed_stages = list(range(1, completed + 1))
+        progress = get_user_stage_progress(db, current_user.userid)
+        completed_stages = [stage for stage, (answered, size) in progress.items() if size and answered >= size]
+        remaining = [stage for stage in progress if stage not in completed_stages]
+        current_stage = remaining[0] if remaining else STAGE_COUNT
         return {
-            "total_responses": total,
+            "total_responses": sum(answered for answered, _ in progress.values()),
             "current_stage": current_stage,
             "completed_stages": completed_stages
         }
@@ -131,43 +149,49 @@ def get_user_progress(
         )
 
 
-@router.get("/responses/result", response_model=PredictionResultSchema)
-def get_result_from_saved_responses(
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+@router.get("/responses/result", response_model=PredictionResultSchema, dependencies=[Depends(require_model_ready)])
+async def get_result_from_saved_responses(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Compute prediction result using the user's saved responses in DB.
+    The stored snapshot is returned while the model version and the user's
+    responses are unchanged.
     """
     try:
-        # Join UserResponse -> ScenarioOption -> Scenario -> Competency to compute scores
-        q = db.query(
-            models.ScenarioOption.score,
-            models.Competency.name
-        ).join(
-            models.UserResponse, models.UserResponse.scenariooptionid == models.ScenarioOption.scenariooptionid
-        ).join(
-            models.Scenario, models.Scenario.scenarioid == models.ScenarioOption.scenarioid
-        ).join(
-            models.Competency, models.Competency.competencyid == models.Scenario.competencyid
-        ).filter(models.UserResponse.userid == current_user.userid)
-
-        rows = q.all()
+        # Per-competency totals maintained by save_user_responses
+        rows = await db.run_sync(get_user_competency_totals, current_user.userid)
         if not rows:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No responses found for user")
 
+        model_version = model_manager.version
+        fingerprint = compute_response_fingerprint(rows)
+        if settings.RESULT_SNAPSHOTS_ENABLED:
+            snapshot = await db.run_sync(get_result_snapshot, current_user.userid, model_version, fingerprint)
+            if snapshot is not None:
+                result_snapshot_hits_total.inc()
+                return snapshot
+            result_snapshot_misses_total.inc()
+
         # Average score per competency
         totals = {}
         counts = {}
-        for score, comp_name in rows:
-            totals[comp_name] = totals.get(comp_name, 0) + float(score)
-            counts[comp_name] = counts.get(comp_name, 0) + 1
+        for comp_name, total, count in rows:
+            totals[comp_name] = totals.get(comp_name, 0) + float(total)
+            counts[comp_name] = counts.get(comp_name, 0) + count
 
         user_scores = {k: totals[k] / counts[k] for k in totals}
 
-        prediction_result = prediction_service.predict_and_analyze(user_scores)
+        prediction_result = await predict_user_scores(user_scores)
         if "error" in prediction_result:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=prediction_result["error"])
+
+        if settings.RESULT_SNAPSHOTS_ENABLED:
+            try:
+                await db.run_sync(save_result_snapshot, current_user.userid, model_version, fingerprint, prediction_result)
+            except Exception as save_error:
+                print(f"Warning: Could not save result snapshot: {str(save_error)}")
         return prediction_result
     except HTTPException:
         raise
@@ -178,7 +202,7 @@ def get_result_from_saved_responses(
 @router.get("/assessment-result")
 def get_user_assessment_result(
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Get user's saved assessment result from database
@@ -207,7 +231,7 @@ def get_user_assessment_result(
 @router.get("/assessment-status")
 def get_assessment_status(
     db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: TokenClaims = Depends(get_current_claims)
 ):
     """
     Check if user has completed assessment and can view results
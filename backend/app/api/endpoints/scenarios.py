@@ -3,58 +3,66 @@ Scenarios endpoints for Yetria Career Guidance Platform
 Scenario listing and management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
-from ...core.database import get_db
-from ...crud.scenario_crud import get_all_scenarios
-from ...api.schemas import Scenario
-from ...api.dependencies import get_current_active_user
-from ...models import User as UserModel
+from ...core.database import get_async_db
+from ...crud.scenario_crud import STAGE_COUNT
+from ...services.scenario_catalogue import scenario_catalogue
+from ...api.schemas import Scenario, TokenClaims
+from ...api.dependencies import get_current_claims
 
 router = APIRouter()
 
+# Clients may keep the catalogue but must revalidate it with If-None-Match
+CATALOGUE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
 
 @router.get("/scenarios", response_model=List[Scenario])
-def get_scenarios(
+async def get_scenarios(
     stage: int = None,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenClaims = Depends(get_current_claims),
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """
     Get scenarios with their options and competency information.
     If stage is provided, returns scenarios for that specific stage.
     Only authenticated users can access this endpoint.
-    
+    Responses carry an ETag; a matching If-None-Match returns 304.
+
     Args:
         stage: Optional stage number (1-4) to filter scenarios
         db: Database session
         current_user: Current authenticated user
-        
+        if_none_match: ETag(s) of the client's cached copy
+
     Returns:
         List[Scenario]: List of scenarios with options
     """
     try:
-        scenarios = get_all_scenarios(db=db)
-        
-        # If stage is provided, filter scenarios by stage
-        if stage is not None:
-            if stage < 1 or stage > 4:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Stage must be between 1 and 4"
-                )
-            
-            # Calculate scenario range for the stage
-            # Each stage has 4 scenarios
-            start_index = (stage - 1) * 4
-            end_index = start_index + 4
-            
-            # Return only scenarios for this stage
-            return scenarios[start_index:end_index]
-        
-        return scenarios
+        if stage is not None and (stage < 1 or stage > STAGE_COUNT):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Stage must be between 1 and 4"
+            )
+
+        # Pre-rendered body for the stage (or all scenarios)
+        snapshot = await db.run_sync(scenario_catalogue.get)
+        body, etag = snapshot.get(stage)
+        headers = {"ETag": etag, "Cache-Control": CATALOGUE_CACHE_CONTROL}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
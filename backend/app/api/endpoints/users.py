@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from ...core.database import get_db
+from ...crud.revoked_token_crud import revoke_access_token
 from ...crud.user_crud import (
     get_user_by_id, 
     update_user, 
@@ -15,8 +16,8 @@ from ...crud.user_crud import (
     get_active_users,
     verify_user_email
 )
-from ...api.schemas import User as UserSchema, UserUpdate
-from ...api.dependencies import get_current_user, get_current_active_user
+from ...api.schemas import User as UserSchema, UserUpdate, TokenClaims
+from ...api.dependencies import get_current_user, get_current_claims, get_current_token
 from ...models import User as UserModel
 
 router = APIRouter()
@@ -41,7 +42,7 @@ def get_current_user_profile(
 @router.put("/me", response_model=UserSchema)
 def update_current_user_profile(
     user_update: UserUpdate,
-    current_user: UserModel = Depends(get_current_user),
+    current_user: TokenClaims = Depends(get_current_claims),
     db: Session = Depends(get_db)
 ):
     """
@@ -58,7 +59,7 @@ def update_current_user_profile(
     Raises:
         HTTPException: If update fails
     """
-    updated_user = update_user(db, current_user.id, user_update)
+    updated_user = update_user(db, current_user.userid, user_update)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,25 +70,28 @@ def update_current_user_profile(
 
 @router.delete("/me")
 def delete_current_user(
-    current_user: UserModel = Depends(get_current_user),
+    current_user: TokenClaims = Depends(get_current_claims),
+    token: str = Depends(get_current_token),
     db: Session = Depends(get_db)
 ):
     """
-    Delete current user account (soft delete)
+    Delete current user account and revoke the access token used
     
     Args:
         current_user: Current authenticated user
+        token: Access token of the request
         db: Database session
         
     Returns:
         dict: Deletion confirmation message
     """
-    success = delete_user(db, current_user.id)
+    success = delete_user(db, current_user.userid)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    revoke_access_token(db, token)
     
     return {"message": "User account deleted successfully"}
 
@@ -95,7 +99,7 @@ def delete_current_user(
 @router.get("/{user_id}", response_model=UserSchema)
 def get_user_by_id_endpoint(
     user_id: int,
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: TokenClaims = Depends(get_current_claims),
     db: Session = Depends(get_db)
 ):
     """
@@ -125,7 +129,7 @@ def get_user_by_id_endpoint(
 def get_users_list(
     skip: int = 0,
     limit: int = 100,
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: TokenClaims = Depends(get_current_claims),
     db: Session = Depends(get_db)
 ):
     """
@@ -147,7 +151,7 @@ def get_users_list(
 @router.post("/verify-email/{user_id}")
 def verify_user_email_endpoint(
     user_id: int,
-    current_user: UserModel = Depends(get_current_active_user),
+    current_user: TokenClaims = Depends(get_current_claims),
     db: Session = Depends(get_db)
 ):
     """
@@ -58,6 +58,14 @@ class TokenData(BaseModel):
     email: Optional[str] = None
 
 
+class TokenClaims(BaseModel):
+    """Identity carried by an access token (as of token issue, no database lookup)"""
+    userid: int
+    email: str
+    name: Optional[str] = None
+    usertypeid: Optional[int] = None
+
+
 class UserLogin(BaseModel):
     """Schema for user login"""
     email: EmailStr
@@ -107,6 +115,7 @@ class MentorProfileSchema(BaseModel):
     bio: Optional[str] = None
     supporttopics: Optional[str] = None
     quote: Optional[str] = None
+    matchscore: Optional[float] = None  # Fit to the student's competencies (0-100)
 
     class Config:
         from_attributes = True
@@ -0,0 +1,279 @@
+"""
+In-process caches for Yetria Career Guidance Platform
+Thread-safe LRU cache with optional per-entry time-to-live, snapshot
+caches rebuilt in the background, and change tracking for both
+
+Invalidation contract of every cache of database rows: track_model_changes
+calls the cache back after a commit in this process that inserted, updated
+or deleted rows of the models it depends on (rolled back changes are
+ignored). Changes made by other processes, such as seed scripts or other
+workers, are not seen; they are picked up when entries expire, so each of
+these caches has a *_TTL_SECONDS setting that bounds how stale it can be.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry; entries expire after ttl_seconds"""
+
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SnapshotCache(Generic[T]):
+    """
+    Holds one immutable snapshot built from the database by build().
+
+    invalidate() and ttl_seconds mark the snapshot stale. A stale snapshot
+    keeps being served while one background thread builds its replacement
+    and swaps it in; only a get() with no snapshot at all builds inline.
+    Callers therefore never wait for a rebuild, and concurrent requests
+    never build copies of their own.
+
+    The lock only guards the swap and is never held across a query: async
+    routes call get() on the event loop thread (AsyncSession.run_sync),
+    where waiting for a lock held across another request's query would
+    block that query from ever finishing.
+    """
+
+    name = "snapshot"
+
+    def __init__(self, ttl_seconds: float = 0):
+        """
+        Args:
+            ttl_seconds: Age after which the snapshot is rebuilt (0 = only when invalidated)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._version = 0
+        self._snapshot: Optional[T] = None
+        self._snapshot_version = -1
+        self._built_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def build(self, db: Session, version: int) -> T:
+        """Builds the snapshot for data version `version`."""
+        raise NotImplementedError
+
+    def invalidate(self) -> None:
+        """Marks the snapshot stale; the next get() starts a background rebuild."""
+        with self._lock:
+            self._version += 1
+
+    def get(self, db: Session) -> T:
+        """Returns the current snapshot, building it with db only if there is none yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.rebuild(db)
+        if self._is_stale():
+            self.refresh_in_background()
+        return snapshot
+
+    def rebuild(self, db: Session) -> T:
+        """Builds a snapshot with db now and publishes it."""
+        version = self.version
+        snapshot = self.build(db, version)
+        self._publish(snapshot, version)
+        return snapshot
+
+    def refresh_in_background(self) -> Optional[threading.Thread]:
+        """Rebuilds the snapshot on a daemon thread unless a rebuild is already running."""
+        with self._lock:
+            if self._refreshing:
+                return None
+            self._refreshing = True
+
+        def refresh():
+            db = SessionLocal()
+            try:
+                self.rebuild(db)
+            except Exception as e:
+                logger.warning(f"{self.name} rebuild failed, serving the previous snapshot: {e}")
+            finally:
+                db.close()
+                with self._lock:
+                    self._refreshing = False
+
+        thread = threading.Thread(target=refresh, name=f"{self.name}-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    def _publish(self, snapshot: T, version: int) -> None:
+        with self._lock:
+            # A rebuild that finished late must not replace a newer snapshot
+            if version >= self._snapshot_version:
+                self._snapshot = snapshot
+                self._snapshot_version = version
+                self._built_at = time.monotonic()
+
+    def _is_stale(self) -> bool:
+        if self._snapshot_version != self.version:
+            return True
+        return self.ttl_seconds > 0 and time.monotonic() - self._built_at > self.ttl_seconds
+
+
+class _ChangeTracker:
+    def __init__(self, model_classes, on_commit, where, key, before_commit):
+        self.model_classes = model_classes
+        self.on_commit = on_commit
+        self.where = where
+        self.key = key
+        self.before_commit = before_commit
+
+    def matches(self, instance, state: str) -> bool:
+        return isinstance(instance, self.model_classes) and (self.where is None or self.where(instance, state))
+
+    def record(self, changes: Dict["_ChangeTracker", Optional[set]], instance=None) -> None:
+        """Adds the instance's key to the pending changes; no instance (or no key function) means every row."""
+        if instance is None or self.key is None:
+            changes[self] = None
+        else:
+            keys = changes.setdefault(self, set())
+            if keys is not None:
+                keys.add(self.key(instance))
+
+    def notify(self, keys: Optional[set], session: Optional[Session] = None) -> None:
+        args = (session,) if self.before_commit else ()
+        if self.key is not None:
+            args += (keys,)
+        self.on_commit(*args)
+
+
+_CHANGES_KEY = "tracked_model_changes"
+_trackers: List[_ChangeTracker] = []
+_tracked_classes: Tuple[type, ...] = ()
+_trackers_lock = threading.Lock()
+
+
+def track_model_changes(
+    model_classes: Sequence[type],
+    on_commit: Callable[..., None],
+    where: Optional[Callable[[Any, str], bool]] = None,
+    key: Optional[Callable[[Any], Hashable]] = None,
+    before_commit: bool = False
+) -> None:
+    """
+    Calls on_commit when a commit changed rows of model_classes.
+
+    Changes are collected per session from flushes and from ORM bulk
+    insert/update/delete statements, and dropped on rollback. One set of
+    session event listeners serves every registered tracker.
+
+    Args:
+        model_classes: Models whose changes matter
+        on_commit: Called once per commit with changes. Without key it gets no
+            arguments; with key it gets the set of changed keys, or None when
+            a bulk statement may have changed any row
+        where: Filter (instance, "new" | "dirty" | "deleted") -> bool
+        key: Maps a changed instance to the key passed to on_commit
+        before_commit: Call on_commit(session, ...) just before the transaction
+            commits instead, so it can write in the same transaction
+    """
+    global _tracked_classes
+    with _trackers_lock:
+        if not _trackers:
+            event.listen(Session, "after_flush", _record_flush)
+            event.listen(Session, "do_orm_execute", _record_bulk_statement)
+            event.listen(Session, "before_commit", _notify_before_commit)
+            event.listen(Session, "after_commit", _notify_after_commit)
+            event.listen(Session, "after_rollback", _discard_changes)
+        _trackers.append(_ChangeTracker(tuple(model_classes), on_commit, where, key, before_commit))
+        _tracked_classes = tuple({cls for tracker in _trackers for cls in tracker.model_classes})
+
+
+def _record_flush(session, flush_context):
+    for state, instances in (("new", session.new), ("dirty", session.dirty), ("deleted", session.deleted)):
+        for instance in instances:
+            if not isinstance(instance, _tracked_classes):
+                continue
+            for tracker in _trackers:
+                if tracker.matches(instance, state):
+                    tracker.record(session.info.setdefault(_CHANGES_KEY, {}), instance)
+
+
+def _record_bulk_statement(orm_execute_state):
+    # query.update() / query.delete() and insert(Model) bypass the flush
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is None or not issubclass(mapper.class_, _tracked_classes):
+            return
+        for tracker in _trackers:
+            if issubclass(mapper.class_, tracker.model_classes):
+                tracker.record(orm_execute_state.session.info.setdefault(_CHANGES_KEY, {}))
+
+
+def _notify_before_commit(session):
+    if not any(tracker.before_commit for tracker in _trackers):
+        return
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    changes = session.info.get(_CHANGES_KEY)
+    for tracker in [tracker for tracker in (changes or ()) if tracker.before_commit]:
+        tracker.notify(changes.pop(tracker), session)
+
+
+def _notify_after_commit(session):
+    for tracker, keys in session.info.pop(_CHANGES_KEY, {}).items():
+        if not tracker.before_commit:
+            tracker.notify(keys)
+
+
+def _discard_changes(session):
+    session.info.pop(_CHANGES_KEY, None)
@@ -17,6 +17,15 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     ALGORITHM: str = "HS256"
     
+    # Verified access tokens kept in memory (0 disables); the TTL bounds how long
+    # a worker accepts a token another worker has revoked
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+    TOKEN_CACHE_TTL_SECONDS: float = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+    
+    # Users loaded for routes that need the full profile (0 disables), dropped when the user row changes
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", "1024"))
+    USER_CACHE_TTL_SECONDS: float = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    
     # Database - Using SQLite for development
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./yetria.db")
     
@@ -38,6 +47,59 @@ class Settings:
     
     # Security
     BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    
+    # Password schemes, comma separated: the first hashes new passwords, the rest are verified and
+    # rehashed on login (as are hashes whose cost differs from BCRYPT_ROUNDS)
+    PASSWORD_SCHEMES: list = [s.strip() for s in os.getenv("PASSWORD_SCHEMES", "bcrypt").split(",") if s.strip()]
+    
+    # Successful password checks remembered (as keyed HMACs) so repeated logins skip the hash (0 disables)
+    PASSWORD_VERIFY_CACHE_SIZE: int = int(os.getenv("PASSWORD_VERIFY_CACHE_SIZE", "10000"))
+    PASSWORD_VERIFY_CACHE_TTL_SECONDS: float = float(os.getenv("PASSWORD_VERIFY_CACHE_TTL_SECONDS", "30"))
+    
+    # Password hashing pool: worker threads, and operations admitted (running + queued) before auth answers 429
+    AUTH_HASH_WORKERS: int = int(os.getenv("AUTH_HASH_WORKERS", "2"))
+    AUTH_HASH_MAX_PENDING: int = int(os.getenv("AUTH_HASH_MAX_PENDING", "16"))
+    
+    # Prediction batching
+    PREDICTION_BATCHING_ENABLED: bool = os.getenv("PREDICTION_BATCHING_ENABLED", "True").lower() == "true"
+    PREDICTION_BATCH_WINDOW_MS: float = float(os.getenv("PREDICTION_BATCH_WINDOW_MS", "2"))
+    PREDICTION_BATCH_MAX_SIZE: int = int(os.getenv("PREDICTION_BATCH_MAX_SIZE", "64"))
+    PREDICTION_BATCH_WORKERS: int = int(os.getenv("PREDICTION_BATCH_WORKERS", "1"))
+    
+    # Model loading: "pickle" (joblib artifacts) or "compact" (memory-mapped export shared by workers)
+    MODEL_LOAD_MODE: str = os.getenv("MODEL_LOAD_MODE", "pickle")
+    
+    # Inference engine: "native" (LightGBM predict_proba) or "numpy" (compiled tree arrays, faster for small batches)
+    PREDICTION_ENGINE: str = os.getenv("PREDICTION_ENGINE", "native")
+    
+    # Probability cache keyed by the exact score vector (0 disables), cleared on model reload
+    PREDICTION_CACHE_SIZE: int = int(os.getenv("PREDICTION_CACHE_SIZE", "4096"))
+    PREDICTION_CACHE_TTL_SECONDS: float = float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "3600"))
+    
+    # Write assessment results on background threads instead of before the POST /responses reply
+    ASSESSMENT_RESULT_ASYNC_WRITES: bool = os.getenv("ASSESSMENT_RESULT_ASYNC_WRITES", "True").lower() == "true"
+    ASSESSMENT_RESULT_QUEUE_SIZE: int = int(os.getenv("ASSESSMENT_RESULT_QUEUE_SIZE", "1000"))
+    ASSESSMENT_RESULT_WRITERS: int = int(os.getenv("ASSESSMENT_RESULT_WRITERS", "2"))
+    ASSESSMENT_RESULT_WRITE_RETRIES: int = int(os.getenv("ASSESSMENT_RESULT_WRITE_RETRIES", "3"))
+    
+    # Serve /responses/result from user_result_snapshot while model version and responses are unchanged
+    RESULT_SNAPSHOTS_ENABLED: bool = os.getenv("RESULT_SNAPSHOTS_ENABLED", "True").lower() == "true"
+    
+    # Per-occupation mentor list cache (0 disables), cleared when mentor profiles, mentor names or occupations change
+    MENTOR_CACHE_SIZE: int = int(os.getenv("MENTOR_CACHE_SIZE", "256"))
+    MENTOR_CACHE_TTL_SECONDS: float = float(os.getenv("MENTOR_CACHE_TTL_SECONDS", "300"))
+    
+    # Course recommendation index: rebuilt after course commits in this process, and at least this often (0 = never)
+    COURSE_INDEX_TTL_SECONDS: float = float(os.getenv("COURSE_INDEX_TTL_SECONDS", "600"))
+    
+    # Scenario index snapshot: rebuilt after scenario commits in this process, and at least this often (0 = never)
+    SCENARIO_INDEX_TTL_SECONDS: float = float(os.getenv("SCENARIO_INDEX_TTL_SECONDS", "300"))
+    
+    # Model hot reload (0 disables watching artifacts/CURRENT)
+    MODEL_WATCH_INTERVAL_SECONDS: float = float(os.getenv("MODEL_WATCH_INTERVAL_SECONDS", "0"))
+    
+    # Admin endpoints are disabled unless a token is configured
+    ADMIN_API_TOKEN: str = os.getenv("ADMIN_API_TOKEN", "")
 
 
 # Global settings instance
@@ -2,10 +2,15 @@
 Database configuration and session management for Yetria Career Guidance Platform
 """
 
-from sqlalchemy import create_engine
+import threading
+
+from sqlalchemy import Table, create_engine, inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
-from typing import Generator
+from typing import AsyncGenerator, Generator, Iterable, Optional
 from .config import settings
 
 # Create database engine
@@ -17,6 +22,16 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory, bound to the async engine when a session is opened.
+# Sessions keep loaded attributes after commit: async code cannot lazy-load them.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+# Async driver per database backend
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_engine_lock = threading.Lock()
+
 # Create declarative base
 Base = declarative_base()
 
@@ -35,6 +50,60 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def async_database_url(database_url: str) -> str:
+    """
+    Same database through its async driver (asyncpg for PostgreSQL, aiosqlite for SQLite)
+    
+    Args:
+        database_url: Sync SQLAlchemy URL, e.g. postgresql://... or sqlite:///./yetria.db
+        
+    Returns:
+        str: URL for create_async_engine
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Async engine for DATABASE_URL, created on first use so scripts that only
+    use the sync engine do not need the async drivers installed
+    """
+    global _async_engine
+    if _async_engine is None:
+        with _async_engine_lock:
+            if _async_engine is None:
+                _async_engine = create_async_engine(async_database_url(settings.DATABASE_URL))
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """
+    Close the async engine's pooled connections (application shutdown)
+    """
+    global _async_engine
+    async_engine, _async_engine = _async_engine, None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session
+    
+    Sync CRUD functions run on it through AsyncSession.run_sync, which
+    executes them on the event loop with non-blocking database I/O.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
+
+
 def create_tables():
     """
     Create all database tables
@@ -43,6 +112,22 @@ def create_tables():
     Base.metadata.create_all(bind=engine)
 
 
+def create_missing_tables(tables: Iterable[Table]) -> None:
+    """
+    Create the given tables on an existing database if they do not exist yet
+    
+    Args:
+        tables: Tables added after the database was created
+    """
+    for table in tables:
+        try:
+            table.create(bind=engine, checkfirst=True)
+        except SQLAlchemyError:
+            # Another worker created it between the check and CREATE TABLE
+            if not inspect(engine).has_table(table.name):
+                raise
+
+
 def drop_tables():
     """
     Drop all database tables
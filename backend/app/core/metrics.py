@@ -0,0 +1,134 @@
+"""
+In-process metrics for Yetria Career Guidance Platform
+Thread-safe counters, gauges and histograms exposed as JSON on /api/v1/metrics
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Optional, Sequence
+
+# Latency buckets in seconds (upper bounds)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """Monotonically increasing value"""
+
+    def __init__(self, description: str = ""):
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": "counter", "description": self.description, "value": self._value}
+
+
+class Gauge:
+    """Value that can go up and down (or hold a label such as a version string)"""
+
+    def __init__(self, description: str = ""):
+        self.description = description
+        self._value: Any = None
+        self._lock = threading.Lock()
+
+    def set(self, value: Any) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value = (self._value or 0) + amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": "gauge", "description": self.description, "value": self._value}
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets"""
+
+    def __init__(self, description: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._count += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip(list(self.buckets) + ["+Inf"], self._counts):
+                cumulative += bucket_count
+                buckets[str(bound)] = cumulative
+            return {
+                "type": "histogram",
+                "description": self.description,
+                "count": self._count,
+                "sum": self._sum,
+                "mean": self._sum / self._count if self._count else None,
+                "buckets": buckets
+            }
+
+
+class MetricsRegistry:
+    """Named collection of metrics; get-or-create so modules can register at import time"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory, kind):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            elif not isinstance(metric, kind):
+                raise ValueError(f"Metric '{name}' already registered as {type(metric).__name__}")
+            return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(name, lambda: Counter(description), Counter)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(description), Gauge)
+
+    def histogram(self, name: str, description: str = "", buckets: Optional[Sequence[float]] = None) -> Histogram:
+        return self._get_or_create(
+            name, lambda: Histogram(description, buckets or DEFAULT_BUCKETS), Histogram
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {name: metric.snapshot() for name, metric in sorted(metrics.items())}
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
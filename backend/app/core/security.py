@@ -3,21 +3,143 @@ Security utilities for Yetria Career Guidance Platform
 Handles password hashing, JWT token creation and validation
 """
 
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from .cache import LRUCache
 from .config import settings
+from .metrics import metrics
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: new hashes use the first scheme at BCRYPT_ROUNDS;
+# other schemes and other bcrypt costs are deprecated and upgraded on login
+pwd_context = CryptContext(schemes=settings.PASSWORD_SCHEMES, deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+password_rehashes_total = metrics.counter("password_rehashes_total", "Password hashes upgraded on login")
+password_verify_cache_hits_total = metrics.counter("password_verify_cache_hits_total", "Logins verified from the verify cache")
+
+
+class PasswordVerifyCache:
+    """
+    Remembers recent successful password checks for ttl_seconds.
+
+    Entries are HMAC-SHA256(per-process random key, stored hash + password),
+    so neither passwords nor anything that can be checked offline against
+    the stored hash is kept in memory. The stored hash is part of the key,
+    so a password change or rehash never matches an older entry.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.enabled = max_size > 0 and ttl_seconds > 0
+        self._key = os.urandom(32)
+        self._entries = LRUCache(max_size, ttl_seconds)
+
+    def _digest(self, plain_password: str, hashed_password: str) -> bytes:
+        message = hashed_password.encode("utf-8") + b"\0" + plain_password.encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def contains(self, plain_password: str, hashed_password: str) -> bool:
+        if not self.enabled:
+            return False
+        if self._entries.get(self._digest(plain_password, hashed_password)):
+            password_verify_cache_hits_total.inc()
+            return True
+        return False
+
+    def add(self, plain_password: str, hashed_password: str) -> None:
+        if self.enabled:
+            self._entries.set(self._digest(plain_password, hashed_password), True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+password_verify_cache = PasswordVerifyCache(
+    settings.PASSWORD_VERIFY_CACHE_SIZE, settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS
+)
 
 # JWT settings from config
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+token_cache_hits_total = metrics.counter("token_cache_hits_total", "Access tokens accepted from the verified-token cache")
+token_cache_misses_total = metrics.counter("token_cache_misses_total", "Access tokens verified with jwt.decode")
+token_cache_hit_ratio = metrics.gauge("token_cache_hit_ratio", "Share of token verifications served from the cache")
+token_revoked_rejections_total = metrics.counter("token_revoked_rejections_total", "Revoked access tokens presented again")
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """
+    Verified access tokens and revoked tokens, keyed by SHA-256 of the token.
+
+    A bearer token is reused for its whole lifetime, so after the first
+    jwt.decode its payload is served from a bounded LRU until the token's
+    own exp or ttl_seconds, whichever comes first. Revoked tokens are
+    remembered until their exp, after which the signature check rejects
+    them anyway. Both are per process: revocations made by other workers
+    are seen on the next cache miss (see decode_token), so ttl_seconds
+    bounds how long another worker keeps accepting a revoked token.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float = 0):
+        """
+        Args:
+            max_size: Verified tokens kept (0 disables caching; revocation still applies)
+            ttl_seconds: Lifetime of a verified entry (0 = until the token's exp)
+        """
+        self._verified = LRUCache(max_size, ttl_seconds)
+        self._revoked: Dict[bytes, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        """Returns the cached payload, or None if the token is unknown or past its exp."""
+        entry = self._verified.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if expires_at <= time.time():
+            self._verified.pop(key)
+            return None
+        return payload
+
+    def add(self, key: bytes, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            self._verified.set(key, (payload, expires_at))
+
+    def is_revoked(self, key: bytes) -> bool:
+        return key in self._revoked
+
+    def revoke(self, key: bytes, expires_at: float) -> None:
+        now = time.time()
+        with self._lock:
+            # Tokens past their exp are rejected by jwt.decode; no need to keep them
+            for revoked_key in [k for k, exp in self._revoked.items() if exp <= now]:
+                del self._revoked[revoked_key]
+            self._revoked[key] = expires_at
+        self._verified.pop(key)
+
+    def clear(self) -> None:
+        """Drops every verified and revoked token (secret rotation)."""
+        with self._lock:
+            self._revoked.clear()
+        self._verified.clear()
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_TTL_SECONDS)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -30,12 +152,49 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    verified, _ = _timed_verify(plain_password, hashed_password, update=False)
+    return verified
+
+
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a plain password and rehash it if its scheme or cost is outdated
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password from database
+        
+    Returns:
+        Tuple[bool, Optional[str]]: (password matches, new hash to store or None)
+    """
+    if password_verify_cache.contains(plain_password, hashed_password):
+        return True, None
+    verified, new_hash = _timed_verify(plain_password, hashed_password, update=True)
+    if new_hash is not None:
+        password_rehashes_total.inc()
+        password_verify_cache.add(plain_password, new_hash)
+    elif verified:
+        password_verify_cache.add(plain_password, hashed_password)
+    return verified, new_hash
+
+
+def _timed_verify(plain_password: str, hashed_password: str, update: bool) -> Tuple[bool, Optional[str]]:
+    """Runs the verification and records its latency in password_verify_seconds_<scheme>."""
+    scheme = pwd_context.identify(hashed_password) or "unknown"
+    started = time.perf_counter()
+    try:
+        if update:
+            return pwd_context.verify_and_update(plain_password, hashed_password)
+        return pwd_context.verify(plain_password, hashed_password), None
+    finally:
+        metrics.histogram(
+            f"password_verify_seconds_{scheme}", f"Time to verify a {scheme} password hash"
+        ).observe(time.perf_counter() - started)
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password with the default scheme (bcrypt at BCRYPT_ROUNDS)
     
     Args:
         password: The plain text password
@@ -63,29 +222,131 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # jti keeps tokens issued in the same second distinct, so revoking one never revokes a newer login
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(12)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[str]:
+def user_token_claims(user) -> dict:
+    """
+    Claims identifying a user in an access token
+    
+    Besides the email (sub), tokens carry the user id, name and user type so
+    authenticated routes can identify the caller without a database lookup.
+    
+    Args:
+        user: User model instance
+        
+    Returns:
+        dict: Data for create_access_token
+    """
+    return {"sub": user.email, "uid": user.userid, "name": user.name, "utype": user.usertypeid}
+
+
+def token_id(token: str, payload: dict) -> str:
+    """
+    Identifier of an access token for revocation: its jti claim, or the
+    SHA-256 of the token for tokens issued without one
+    """
+    return payload.get("jti") or _token_key(token).hex()
+
+
+def decode_token(token: str, is_revoked: Optional[Callable[[str], bool]] = None) -> Optional[dict]:
     """
     Verify and decode a JWT token
     
+    Tokens verified before are served from token_cache; tokens revoked in
+    this process are rejected. On a cache miss is_revoked, if given, is
+    asked about revocations made elsewhere (other workers).
+    
     Args:
         token: The JWT token to verify
+        is_revoked: Called with token_id() of a freshly verified token
         
     Returns:
-        Optional[str]: The email from the token if valid, None otherwise
+        Optional[dict]: The token payload if valid and it names a user (sub), None otherwise
     """
+    key = _token_key(token)
+    if token_cache.is_revoked(key):
+        token_revoked_rejections_total.inc()
+        return None
+    
+    payload = token_cache.get(key)
+    if payload is not None:
+        token_cache_hits_total.inc()
+        _update_token_hit_ratio()
+        return payload
+    
+    token_cache_misses_total.inc()
+    _update_token_hit_ratio()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return email
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    if is_revoked is not None and is_revoked(token_id(token, payload)):
+        token_cache.revoke(key, payload["exp"])
+        token_revoked_rejections_total.inc()
+        return None
+    token_cache.add(key, payload)
+    return payload
+
+
+def _update_token_hit_ratio() -> None:
+    hits, misses = token_cache_hits_total.value, token_cache_misses_total.value
+    token_cache_hit_ratio.set(round(hits / (hits + misses), 4))
+
+
+def revoke_token(token: str) -> Optional[dict]:
+    """
+    Revoke an access token in this process until it expires
+    
+    Other workers only learn about it from the database; see
+    revoked_token_crud.revoke_access_token.
+    
+    Args:
+        token: The JWT token to revoke
+        
+    Returns:
+        Optional[dict]: Payload of the revoked token, None if it was not valid
+    """
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    token_cache.revoke(_token_key(token), payload["exp"])
+    return payload
+
+
+def rotate_secret_key(secret_key: str) -> None:
+    """
+    Sign and verify tokens with a new secret from now on
+    
+    Every token signed with the previous secret becomes invalid, so the
+    verified-token cache and the revocation set are dropped.
+    
+    Args:
+        secret_key: New JWT signing secret
+    """
+    global SECRET_KEY
+    SECRET_KEY = secret_key
+    settings.SECRET_KEY = secret_key
+    token_cache.clear()
+
+
+def verify_token(token: str) -> Optional[str]:
+    """
+    Verify and decode a JWT token
+    
+    Args:
+        token: The JWT token to verify
+        
+    Returns:
+        Optional[str]: The email from the token if valid, None otherwise
+    """
+    payload = decode_token(token)
+    return payload["sub"] if payload else None
 
 
 # Note: authenticate_user and get_current_user functions are now in:
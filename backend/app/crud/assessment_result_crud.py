@@ -3,8 +3,10 @@ CRUD operations for UserAssessmentResult
 Handles saving and retrieving user assessment results
 """
 
+import hashlib
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from .. import models
@@ -216,4 +218,90 @@ def update_recommendations(
     except Exception as e:
         db.rollback()
         print(f"Error updating recommendations: {str(e)}")
-        raise e
\ No newline at end of file
+        raise e
+
+
+def compute_response_fingerprint(competency_totals: Sequence[Tuple[str, float, int]]) -> str:
+    """
+    Fingerprint of the inputs a prediction is computed from
+    
+    Args:
+        competency_totals: (competency name, score total, answer count) rows
+            as returned by get_user_competency_totals
+        
+    Returns:
+        str: SHA-256 hex digest; changes whenever a competency average changes
+    """
+    canonical = ";".join(
+        f"{name}:{round(float(total), 6)!r}:{int(count)}"
+        for name, total, count in sorted(competency_totals, key=lambda row: str(row[0]))
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_result_snapshot(
+    db: Session,
+    user_id: int,
+    model_version: str,
+    fingerprint: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the stored prediction result if it was computed from the same inputs
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        model_version: Active model version
+        fingerprint: Current response fingerprint
+        
+    Returns:
+        Stored prediction result or None if missing or stale
+    """
+    try:
+        snapshot = db.get(models.UserResultSnapshot, user_id)
+        if (snapshot is None or snapshot.model_version != model_version
+                or snapshot.response_fingerprint != fingerprint):
+            return None
+        return json.loads(snapshot.payload)
+    except Exception as e:
+        print(f"Error retrieving result snapshot: {str(e)}")
+        raise e
+
+
+def save_result_snapshot(
+    db: Session,
+    user_id: int,
+    model_version: str,
+    fingerprint: str,
+    prediction_result: Dict[str, Any]
+) -> None:
+    """
+    Store (or replace) the user's prediction result with its model version and fingerprint
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        model_version: Model version the result was computed with
+        fingerprint: Response fingerprint the result was computed from
+        prediction_result: Prediction result to serve until either changes
+    """
+    try:
+        values = {
+            "model_version": model_version,
+            "response_fingerprint": fingerprint,
+            "payload": json.dumps(prediction_result, ensure_ascii=False)
+        }
+        snapshot = db.get(models.UserResultSnapshot, user_id)
+        if snapshot is None:
+            db.add(models.UserResultSnapshot(userid=user_id, **values))
+        else:
+            for key, value in values.items():
+                setattr(snapshot, key, value)
+        db.commit()
+    except IntegrityError:
+        # A concurrent request stored a snapshot first; later requests revalidate it
+        db.rollback()
+    except Exception as e:
+        db.rollback()
+        print(f"Error saving result snapshot: {str(e)}")
+        raise e
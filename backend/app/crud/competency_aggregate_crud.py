@@ -0,0 +1,268 @@
+"""
+Competency aggregate CRUD operations for Yetria Career Guidance Platform
+Per-user, per-competency running totals of selected option scores
+
+Deltas use the option scores stored at submit time. Commits that change an
+option's score or scenario, or move a scenario to another competency,
+rebuild the aggregates of every user who answered those scenarios in the
+same transaction (for changes made through the ORM in a process that
+imported this module; scripts/db/competency_aggregates.py check catches
+the rest).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import Select, delete, func, inspect, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.cache import track_model_changes
+
+Aggregate = models.UserCompetencyAggregate
+
+
+def _has_aggregates(db: Session, user_id: int) -> bool:
+    return db.query(Aggregate.userid).filter(Aggregate.userid == user_id).first() is not None
+
+
+def _aggregates_from_responses():
+    """SELECT userid, competencyid, SUM(score), COUNT(*) over the full response history."""
+    return select(
+        models.UserResponse.userid,
+        models.Scenario.competencyid,
+        func.sum(models.ScenarioOption.score),
+        func.count()
+    ).join(
+        models.ScenarioOption, models.ScenarioOption.scenariooptionid == models.UserResponse.scenariooptionid
+    ).join(
+        models.Scenario, models.Scenario.scenarioid == models.ScenarioOption.scenarioid
+    ).group_by(models.UserResponse.userid, models.Scenario.competencyid)
+
+
+def _upsert_deltas(db: Session, rows: List[dict]) -> None:
+    """Adds total/count deltas to existing rows, inserting missing ones, in one statement where supported."""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(Aggregate).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[Aggregate.userid, Aggregate.competencyid],
+            set_={
+                "total": Aggregate.total + stmt.excluded.total,
+                "count": Aggregate.count + stmt.excluded.count
+            }
+        ))
+        return
+
+    for row in rows:
+        existing = db.get(Aggregate, (row["userid"], row["competencyid"]))
+        if existing is None:
+            db.add(Aggregate(**row))
+        else:
+            existing.total += row["total"]
+            existing.count += row["count"]
+    db.flush()
+
+
+def rebuild_user_aggregates(db: Session, user_ids: Optional[Union[Iterable[int], Select]] = None) -> None:
+    """
+    Recomputes aggregates from scenarioresponse (all users when user_ids is None)
+
+    Rows written by a concurrent rebuild of the same user are overwritten
+    instead of failing on the primary key, where the dialect supports it.
+
+    Args:
+        db: Database session (not committed)
+        user_ids: Users to rebuild, or a SELECT of their ids
+    """
+    source = _aggregates_from_responses()
+    clear = delete(Aggregate)
+    if user_ids is not None:
+        if not isinstance(user_ids, Select):
+            user_ids = list(user_ids)
+        source = source.where(models.UserResponse.userid.in_(user_ids))
+        clear = clear.where(Aggregate.userid.in_(user_ids))
+    db.execute(clear)
+
+    columns = [Aggregate.userid, Aggregate.competencyid, Aggregate.total, Aggregate.count]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(Aggregate).from_select(columns, source)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[Aggregate.userid, Aggregate.competencyid],
+            set_={"total": stmt.excluded.total, "count": stmt.excluded.count}
+        ))
+        return
+    db.execute(insert(Aggregate).from_select(columns, source))
+
+
+def apply_response_changes(
+    db: Session,
+    user_id: int,
+    removed_option_ids: List[int],
+    added_option_ids: List[int]
+) -> None:
+    """
+    Applies the score deltas of replaced answers to the user's aggregates
+
+    Runs inside the caller's transaction; option scores and competencies
+    are read in that transaction (one query by primary key). Users without
+    aggregate rows yet (answers saved before the table existed) and
+    options that no longer exist are rebuilt from the response history
+    instead.
+
+    Args:
+        db: Database session (not committed)
+        user_id: User ID
+        removed_option_ids: scenariooptionids of deleted responses
+        added_option_ids: scenariooptionids of inserted responses
+    """
+    if not _has_aggregates(db, user_id):
+        rebuild_user_aggregates(db, [user_id])
+        return
+
+    option_ids = set(removed_option_ids) | set(added_option_ids)
+    if not option_ids:
+        return
+    options = {
+        option_id: (competencyid, score)
+        for option_id, competencyid, score in db.query(
+            models.ScenarioOption.scenariooptionid, models.Scenario.competencyid, models.ScenarioOption.score
+        ).join(
+            models.Scenario, models.Scenario.scenarioid == models.ScenarioOption.scenarioid
+        ).filter(models.ScenarioOption.scenariooptionid.in_(option_ids))
+    }
+
+    deltas: Dict[int, List] = {}
+    for option_ids, sign in ((removed_option_ids, -1), (added_option_ids, 1)):
+        for option_id in option_ids:
+            if option_id not in options:
+                rebuild_user_aggregates(db, [user_id])
+                return
+            competencyid, score = options[option_id]
+            delta = deltas.setdefault(competencyid, [0.0, 0])
+            delta[0] += sign * score
+            delta[1] += sign
+
+    rows = [
+        {"userid": user_id, "competencyid": competencyid, "total": total, "count": count}
+        for competencyid, (total, count) in deltas.items()
+        if total or count
+    ]
+    if rows:
+        _upsert_deltas(db, rows)
+
+
+def get_user_competency_totals(db: Session, user_id: int) -> List[Tuple[str, float, int]]:
+    """
+    Return (competency name, score total, answer count) for each answered competency
+
+    Falls back to rebuilding the user's aggregates from the response history
+    when they have responses but no aggregate rows.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        List of (competency name, total, count) ordered by competency
+    """
+    def read():
+        return db.query(models.Competency.name, Aggregate.total, Aggregate.count).join(
+            Aggregate, Aggregate.competencyid == models.Competency.competencyid
+        ).filter(
+            Aggregate.userid == user_id, Aggregate.count > 0
+        ).order_by(Aggregate.competencyid).all()
+
+    rows = read()
+    if rows or _has_aggregates(db, user_id):
+        return rows
+
+    has_responses = db.query(models.UserResponse.scenarioresponseid).filter(
+        models.UserResponse.userid == user_id
+    ).first() is not None
+    if not has_responses:
+        return rows
+    try:
+        rebuild_user_aggregates(db, [user_id])
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"Error rebuilding competency aggregates: {str(e)}")
+        raise e
+    return read()
+
+
+def get_user_competency_averages(db: Session, user_id: int) -> Dict[int, float]:
+    """
+    Return the user's average option score per answered competency
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Dict mapping competencyid to average score
+    """
+    rows = db.query(Aggregate.competencyid, Aggregate.total, Aggregate.count).filter(
+        Aggregate.userid == user_id, Aggregate.count > 0
+    ).all()
+    return {competencyid: float(total) / count for competencyid, total, count in rows}
+
+
+def find_inconsistent_users(db: Session, tolerance: float = 1e-9) -> List[int]:
+    """
+    Compare stored aggregates with the response history
+
+    Args:
+        db: Database session
+        tolerance: Allowed absolute difference of score totals
+
+    Returns:
+        Sorted user IDs whose aggregates do not match
+    """
+    expected = {
+        (userid, competencyid): (float(total), int(count))
+        for userid, competencyid, total, count in db.execute(_aggregates_from_responses())
+    }
+    stored = {
+        (row.userid, row.competencyid): (float(row.total), int(row.count))
+        for row in db.query(Aggregate).filter(Aggregate.count != 0)
+    }
+
+    bad_users = set()
+    for key in expected.keys() | stored.keys():
+        expected_total, expected_count = expected.get(key, (0.0, 0))
+        stored_total, stored_count = stored.get(key, (0.0, 0))
+        if expected_count != stored_count or abs(expected_total - stored_total) > tolerance:
+            bad_users.add(key[0])
+    return sorted(bad_users)
+
+
+def _changes_option_contributions(instance, state: str) -> bool:
+    if state == "new":
+        return False  # No answers yet
+    if state == "deleted":
+        return True
+    changed = ("score", "scenarioid") if isinstance(instance, models.ScenarioOption) else ("competencyid",)
+    attrs = inspect(instance).attrs
+    return any(attrs[name].history.has_changes() for name in changed)
+
+
+def _rebuild_answerers(db: Session, scenario_ids: Optional[set]) -> None:
+    """Rebuilds users who answered the scenarios (every user when scenario_ids is None)."""
+    if scenario_ids is None:
+        rebuild_user_aggregates(db)
+        return
+    answerers = select(models.UserResponse.userid).join(
+        models.ScenarioOption, models.ScenarioOption.scenariooptionid == models.UserResponse.scenariooptionid
+    ).where(models.ScenarioOption.scenarioid.in_(scenario_ids)).distinct()
+    rebuild_user_aggregates(db, answerers)
+
+
+track_model_changes(
+    [models.ScenarioOption, models.Scenario], _rebuild_answerers,
+    where=_changes_option_contributions, key=lambda instance: instance.scenarioid, before_commit=True
+)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from ..models import Course
+from ..services.course_index import course_index
 
 
 def get_all_courses(db: Session) -> List[Course]:
@@ -53,50 +54,15 @@ def get_courses_by_competency_keywords(db: Session, competency_keywords: List[st
     """
     Get courses that match competency keywords
     This is the main function for course recommendations based on development areas
+    Courses are ranked through the in-memory course index (see services.course_index)
     """
     if not competency_keywords:
         return []
     
-    # Define competency to course mapping
-    competency_course_mapping = {
-        # Sayısal Zeka
-        "numerical": ["matematik", "mathematical", "sayısal", "hesaplama"],
-        "analytical": ["analitik", "analytical", "eleştirel", "critical", "düşünme", "thinking"],
-        "stress_management": ["stres", "stress", "duygu", "emotion", "yönetim", "management"],
-        "empathy": ["empati", "empathy", "anlayış", "understanding"],
-        "teamwork": ["takım", "team", "ekip", "işbirliği", "collaboration"],
-        "decision_making": ["problem", "karar", "decision", "çözme", "solving"],
-        "resilience": ["dayanıklılık", "resilience", "direnç", "resistance"]
-    }
-    
-    # Get all courses first
-    all_courses = get_all_courses(db)
-    
-    # Score courses based on keyword matches
-    course_scores = {}
-    
-    for course in all_courses:
-        score = 0
-        course_text = f"{course.title} {course.description or ''}".lower()
-        
-        for competency in competency_keywords:
-            if competency in competency_course_mapping:
-                keywords = competency_course_mapping[competency]
-                for keyword in keywords:
-                    if keyword.lower() in course_text:
-                        score += 1
-        
-        if score > 0:
-            course_scores[course.courseid] = {
-                'course': course,
-                'score': score
-            }
-    
-    # Sort by score and return top courses
-    sorted_courses = sorted(
-        course_scores.values(), 
-        key=lambda x: x['score'], 
-        reverse=True
-    )
+    course_ids = course_index.get(db).top_course_ids(competency_keywords, limit)
+    if not course_ids:
+        return []
     
-    return [item['course'] for item in sorted_courses[:limit]]
\ No newline at end of file
+    # Fetch the selected courses and keep the ranking order
+    courses = {course.courseid: course for course in db.query(Course).filter(Course.courseid.in_(course_ids))}
+    return [courses[course_id] for course_id in course_ids if course_id in courses]
@@ -0,0 +1,132 @@
+"""
+Mentorship CRUD operations for Yetria Career Guidance Platform
+"""
+
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import models
+
+
+def list_student_requests(
+    db: Session,
+    student_user_id: int,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Get a student's mentorship requests with mentor and status details in one query
+
+    Requests are ordered by mentormatchid; pages continue after the last
+    returned id (keyset pagination), so deep pages cost the same as the first.
+
+    Args:
+        db: Database session
+        student_user_id: Student's user ID
+        limit: Page size (all requests when None)
+        after_id: Only return requests with a larger mentormatchid
+
+    Returns:
+        (request detail rows, cursor for the next page or None)
+    """
+    query = db.query(
+        models.MentorMatch.mentormatchid,
+        models.MentorMatch.studentuserid,
+        models.MentorMatch.mentorprofileid,
+        models.MentorMatch.matchstatusid,
+        models.MentorMatch.requestdate,
+        models.User.name,
+        models.MentorProfile.company,
+        models.MentorProfile.title,
+        models.MentorProfile.photourl,
+        models.MatchStatus.statusname
+    ).outerjoin(
+        models.MentorProfile, models.MentorProfile.mentorprofileid == models.MentorMatch.mentorprofileid
+    ).outerjoin(
+        models.User, models.User.userid == models.MentorProfile.userid
+    ).outerjoin(
+        models.MatchStatus, models.MatchStatus.matchstatusid == models.MentorMatch.matchstatusid
+    ).filter(
+        models.MentorMatch.studentuserid == student_user_id
+    )
+    if after_id is not None:
+        query = query.filter(models.MentorMatch.mentormatchid > after_id)
+    query = query.order_by(models.MentorMatch.mentormatchid)
+    if limit is not None:
+        # One extra row tells whether another page exists
+        query = query.limit(limit + 1)
+    rows = query.all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].mentormatchid
+
+    # Keeping old field names for frontend compatibility
+    details = [
+        {
+            "mentorshiprequestid": row.mentormatchid,
+            "userid": row.studentuserid,
+            "mentorprofileid": row.mentorprofileid,
+            "statusid": row.matchstatusid,
+            "createdat": row.requestdate,
+            "mentor_name": row.name,
+            "mentor_company": row.company,
+            "mentor_title": row.title,
+            "mentor_photourl": row.photourl,
+            "status_name": row.statusname
+        }
+        for row in rows
+    ]
+    return details, next_cursor
+
+
+def get_occupation_id_by_title(db: Session, occupation_title: str) -> Optional[int]:
+    """
+    Look up an occupation by exact title (uses the occupation.title index)
+
+    Args:
+        db: Database session
+        occupation_title: Occupation title
+
+    Returns:
+        occupationid or None if not found
+    """
+    return db.query(models.Occupation.occupationid).filter(
+        models.Occupation.title == occupation_title
+    ).order_by(models.Occupation.occupationid).limit(1).scalar()
+
+
+def list_occupation_mentors(db: Session, occupation_id: int) -> List[Dict[str, Any]]:
+    """
+    Get an occupation's mentor profiles with the mentor's name in one query
+
+    Args:
+        db: Database session
+        occupation_id: Occupation ID
+
+    Returns:
+        Mentor rows (MentorProfileSchema fields) ordered by mentorprofileid
+    """
+    rows = db.query(models.MentorProfile, models.User.name).outerjoin(
+        models.User, models.User.userid == models.MentorProfile.userid
+    ).filter(
+        models.MentorProfile.occupationid == occupation_id
+    ).order_by(models.MentorProfile.mentorprofileid).all()
+
+    return [
+        {
+            "mentorprofileid": m.mentorprofileid,
+            "userid": m.userid,
+            "occupationid": m.occupationid,
+            "statusid": None,  # No statusid in mentorprofile table
+            "company": m.company,
+            "title": m.title,
+            "photourl": m.photourl,
+            "bio": m.bio,
+            "supporttopics": m.supporttopics,
+            "quote": m.quote,
+            "username": username
+        }
+        for m, username in rows
+    ]
@@ -2,11 +2,35 @@
 Response CRUD operations for Yetria Career Guidance Platform
 """
 
+from collections import Counter
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Tuple
 
 from .. import models
 from ..api import schemas
+from ..services.scenario_index import ScenarioIndex, scenario_index
+from .competency_aggregate_crud import apply_response_changes
+from .scenario_crud import STAGE_COUNT, get_stage_scenario_ids
+
+
+def _resolve_option_id(index: ScenarioIndex, scenario_id: int, option_letter: str) -> int:
+    """Maps a (scenario, letter) pair to its scenariooptionid using the scenario index."""
+    option_ids = index.option_ids_by_scenario.get(scenario_id)
+    if not option_ids:
+        raise ValueError(f"No options found for scenario {scenario_id}")
+
+    # Normalize letter and convert to 0-based index
+    if not option_letter or len(option_letter) != 1:
+        raise ValueError(f"Invalid option letter: {option_letter}")
+    letter = option_letter.upper()
+    option_index = ord(letter) - ord('A')  # A->0, B->1, ...
+
+    if option_index < 0 or option_index >= len(option_ids):
+        raise ValueError(f"Option letter {letter} out of range for scenario {scenario_id}")
+
+    return option_ids[option_index]
 
 
 def convert_option_letter_to_scenariooptionid(db: Session, scenario_id: int, option_letter: str) -> int:
@@ -21,30 +45,33 @@ def convert_option_letter_to_scenariooptionid(db: Session, scenario_id: int, opt
     Returns:
         int: ScenarioOption ID
     """
-    # Get all options for this scenario ordered by scenariooptionid
-    options = db.query(models.ScenarioOption).filter(
-        models.ScenarioOption.scenarioid == scenario_id
-    ).order_by(models.ScenarioOption.scenariooptionid).all()
-    
-    if not options:
-        raise ValueError(f"No options found for scenario {scenario_id}")
-    
-    # Normalize letter and convert to 0-based index
-    if not option_letter or len(option_letter) != 1:
-        raise ValueError(f"Invalid option letter: {option_letter}")
-    letter = option_letter.upper()
-    option_index = ord(letter) - ord('A')  # A->0, B->1, ...
-    
-    if option_index < 0 or option_index >= len(options):
-        raise ValueError(f"Option letter {letter} out of range for scenario {scenario_id}")
-    
-    return options[option_index].scenariooptionid
+    return _resolve_option_id(scenario_index.get(db), scenario_id, option_letter)
+
+
+def _insert_ignoring_duplicates(db: Session, rows: List[dict]):
+    """Multi-row INSERT that skips rows already covered by _user_scenariooption_uc."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(models.UserResponse).values(rows).on_conflict_do_nothing(
+            index_elements=["userid", "scenariooptionid"]
+        )
+    if dialect == "sqlite":
+        return sqlite.insert(models.UserResponse).values(rows).on_conflict_do_nothing(
+            index_elements=["userid", "scenariooptionid"]
+        )
+    return insert(models.UserResponse).values(rows)
 
 
 def save_user_responses(db: Session, responses: List[schemas.ResponseIn], user_id: int) -> int:
     """
     Save user responses to database
     
+    Replaces the user's answers for the submitted scenarios only (stage-based),
+    keeping previously answered scenarios intact. Runs as one DELETE and one
+    multi-row INSERT; letters are resolved from the cached scenario index.
+    The user's competency aggregates are updated with the resulting deltas
+    in the same transaction.
+    
     Args:
         db: Database session
         responses: List of user responses
@@ -59,36 +86,49 @@ def save_user_responses(db: Session, responses: List[schemas.ResponseIn], user_i
         for response in responses:
             unique_responses[response.scenario_id] = response
 
-        # For each scenario in the payload, delete any existing response of this user
-        # This way, we only replace the scenarios being submitted (stage-based),
-        # and keep previously answered scenarios intact.
-        for scenario_id in unique_responses.keys():
-            option_ids_for_scenario = db.query(models.ScenarioOption.scenariooptionid).\
-                filter(models.ScenarioOption.scenarioid == scenario_id).all()
-            option_ids_for_scenario = [row[0] for row in option_ids_for_scenario]
-            if option_ids_for_scenario:
-                db.query(models.UserResponse).\
-                    filter(
-                        models.UserResponse.userid == user_id,
-                        models.UserResponse.scenariooptionid.in_(option_ids_for_scenario)
-                    ).delete(synchronize_session=False)
-
-        # Insert new/updated responses
-        db_responses = []
-        for response in unique_responses.values():
-            scenariooptionid = convert_option_letter_to_scenariooptionid(
-                db, response.scenario_id, response.option_letter
+        index = scenario_index.get(db)
+        new_option_ids = [
+            _resolve_option_id(index, response.scenario_id, response.option_letter)
+            for response in unique_responses.values()
+        ]
+
+        # Delete this user's existing answers to every submitted scenario in one statement
+        replaced_option_ids = [
+            option_id
+            for scenario_id in unique_responses
+            for option_id in index.option_ids_by_scenario.get(scenario_id, ())
+        ]
+        dialect = db.get_bind().dialect
+        removed_option_ids = []
+        if replaced_option_ids:
+            replaced = (models.UserResponse.userid == user_id,
+                        models.UserResponse.scenariooptionid.in_(replaced_option_ids))
+            if dialect.delete_returning:
+                removed_option_ids = list(db.execute(
+                    delete(models.UserResponse).where(*replaced).returning(models.UserResponse.scenariooptionid)
+                ).scalars())
+            else:
+                removed_option_ids = list(db.execute(
+                    select(models.UserResponse.scenariooptionid).where(*replaced)
+                ).scalars())
+                db.execute(delete(models.UserResponse).where(*replaced))
+
+        # Insert new/updated responses; a concurrent submit of the same answers is skipped, not an error
+        added_option_ids = []
+        if new_option_ids:
+            stmt = _insert_ignoring_duplicates(
+                db, [{"userid": user_id, "scenariooptionid": option_id} for option_id in new_option_ids]
             )
-            db_responses.append(models.UserResponse(
-                userid=user_id,
-                scenariooptionid=scenariooptionid
-            ))
+            if dialect.insert_returning:
+                added_option_ids = list(db.execute(stmt.returning(models.UserResponse.scenariooptionid)).scalars())
+            else:
+                db.execute(stmt)
+                added_option_ids = new_option_ids
 
-        if db_responses:
-            db.add_all(db_responses)
+        apply_response_changes(db, user_id, removed_option_ids, added_option_ids)
         db.commit()
 
-        return len(db_responses)
+        return len(new_option_ids)
 
     except Exception as e:
         db.rollback()
@@ -100,4 +140,39 @@ def get_user_response_count(db: Session, user_id: int) -> int:
     """
     Return total number of responses saved for the given user.
     """
-    return db.query(models.UserResponse).filter(models.UserResponse.userid == user_id).count()
\ No newline at end of file
+    return db.query(models.UserResponse).filter(models.UserResponse.userid == user_id).count()
+
+
+def get_user_stage_progress(db: Session, user_id: int) -> Dict[int, Tuple[int, int]]:
+    """
+    Count the distinct scenarios a user has answered in each stage
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Dict mapping stage number (1..STAGE_COUNT) to (answered scenarios, scenarios in stage)
+    """
+    Stage = models.ScenarioStage
+    sizes = dict(db.query(Stage.stage, func.count()).group_by(Stage.stage).all())
+    if sizes:
+        answered = dict(db.query(
+            Stage.stage, func.count(func.distinct(models.ScenarioOption.scenarioid))
+        ).select_from(models.UserResponse).join(
+            models.ScenarioOption, models.ScenarioOption.scenariooptionid == models.UserResponse.scenariooptionid
+        ).join(
+            Stage, Stage.scenarioid == models.ScenarioOption.scenarioid
+        ).filter(
+            models.UserResponse.userid == user_id
+        ).group_by(Stage.stage).all())
+    else:
+        # scenariostage not seeded: stages are consecutive blocks of scenarios
+        stage_of = get_stage_scenario_ids(db)
+        sizes = Counter(stage_of.values())
+        answered_ids = db.query(models.ScenarioOption.scenarioid).join(
+            models.UserResponse, models.UserResponse.scenariooptionid == models.ScenarioOption.scenariooptionid
+        ).filter(models.UserResponse.userid == user_id).distinct().all()
+        answered = Counter(stage_of[sid] for (sid,) in answered_ids if sid in stage_of)
+
+    return {stage: (answered.get(stage, 0), sizes.get(stage, 0)) for stage in range(1, STAGE_COUNT + 1)}
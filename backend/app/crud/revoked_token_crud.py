@@ -0,0 +1,57 @@
+"""
+Revoked access token CRUD operations for Yetria Career Guidance Platform
+Revocations are stored in the database so every worker rejects the token
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.security import revoke_token, token_id
+
+RevokedToken = models.RevokedToken
+
+
+def revoke_access_token(db: Session, token: str) -> bool:
+    """
+    Revoke an access token in this process and for every other worker
+    until it expires; expired revocations are purged
+
+    Args:
+        db: Database session
+        token: The JWT token to revoke
+
+    Returns:
+        bool: True if the token was valid and is now revoked, False otherwise
+    """
+    payload = revoke_token(token)
+    if payload is None:
+        return False
+
+    try:
+        db.query(RevokedToken).filter(RevokedToken.expiresat <= datetime.utcnow()).delete(synchronize_session=False)
+        db.merge(RevokedToken(
+            tokenid=token_id(token, payload),
+            expiresat=datetime.utcfromtimestamp(payload["exp"])
+        ))
+        db.commit()
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"Error revoking access token: {str(e)}")
+        raise e
+
+
+def is_access_token_revoked(db: Session, tokenid: str) -> bool:
+    """
+    Check whether an access token was revoked by any worker
+
+    Args:
+        db: Database session
+        tokenid: Token id (see security.token_id)
+
+    Returns:
+        bool: True if the token is revoked
+    """
+    return db.query(RevokedToken.tokenid).filter(RevokedToken.tokenid == tokenid).first() is not None
@@ -3,45 +3,97 @@ Scenario CRUD operations for Yetria Career Guidance Platform
 """
 
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import Dict, List, Optional
 from .. import models
 from ..api import schemas
 
+STAGE_COUNT = 4
+# Used to slice the scenario list when scenariostage has not been seeded
+SCENARIOS_PER_STAGE = 4
 
-def get_all_scenarios(db: Session) -> List[schemas.Scenario]:
+
+def _scenario_to_dict(s: models.Scenario) -> dict:
+    # Generate letters for options (A, B, C, D, etc.)
+    options_with_letters = []
+    for i, option in enumerate(sorted(s.options, key=lambda x: x.scenariooptionid)):
+        letter = chr(65 + i)  # A=65, B=66, C=67, D=68
+        options_with_letters.append({
+            "letter": letter,
+            "text": option.optiontext
+        })
+
+    return {
+        "id": s.scenarioid,
+        "text": s.description,  # Use description as the main text
+        "competency_name": s.competency.name,
+        "options": options_with_letters
+    }
+
+
+def has_stage_assignments(db: Session) -> bool:
+    """
+    Check whether scenariostage has been seeded
+
+    Args:
+        db: Database session
+
+    Returns:
+        bool: True if at least one scenario is assigned to a stage
+    """
+    return db.query(models.ScenarioStage.scenarioid).first() is not None
+
+
+def get_all_scenarios(db: Session, stage: Optional[int] = None) -> List[schemas.Scenario]:
     """
     Get all scenarios with their options and competency information
-    
+
     Args:
         db: Database session
-        
+        stage: Only return this stage's scenarios, in stage order
+
     Returns:
         List[Scenario]: List of scenarios with options
     """
     # This query efficiently loads scenarios with their related options and competency
-    scenarios_db = db.query(models.Scenario).options(
+    query = db.query(models.Scenario).options(
         joinedload(models.Scenario.options),
         joinedload(models.Scenario.competency)
-    ).order_by(models.Scenario.scenarioid).all()
-    
+    )
+
+    if stage is None:
+        scenarios_db = query.order_by(models.Scenario.scenarioid).all()
+    elif has_stage_assignments(db):
+        # One query on the (stage, position) index
+        scenarios_db = query.join(
+            models.ScenarioStage, models.ScenarioStage.scenarioid == models.Scenario.scenarioid
+        ).filter(
+            models.ScenarioStage.stage == stage
+        ).order_by(models.ScenarioStage.position, models.Scenario.scenarioid).all()
+    else:
+        start_index = (stage - 1) * SCENARIOS_PER_STAGE
+        scenarios_db = query.order_by(models.Scenario.scenarioid).all()[start_index:start_index + SCENARIOS_PER_STAGE]
+
     # Convert database objects to Pydantic schema format
-    results = []
-    for s in scenarios_db:
-        # Generate letters for options (A, B, C, D, etc.)
-        options_with_letters = []
-        for i, option in enumerate(sorted(s.options, key=lambda x: x.scenariooptionid)):
-            letter = chr(65 + i)  # A=65, B=66, C=67, D=68
-            options_with_letters.append({
-                "letter": letter,
-                "text": option.optiontext
-            })
-        
-        scenario_data = {
-            "id": s.scenarioid,
-            "text": s.description,  # Use description as the main text
-            "competency_name": s.competency.name,
-            "options": options_with_letters
-        }
-        results.append(scenario_data)
-    
-    return results
+    return [_scenario_to_dict(s) for s in scenarios_db]
+
+
+def get_stage_scenario_ids(db: Session) -> Dict[int, int]:
+    """
+    Map each staged scenario to its stage
+
+    Falls back to consecutive blocks of SCENARIOS_PER_STAGE scenarios in
+    scenarioid order when scenariostage has not been seeded.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict mapping scenarioid to stage number
+    """
+    rows = db.query(models.ScenarioStage.scenarioid, models.ScenarioStage.stage).all()
+    if rows:
+        return dict(rows)
+
+    scenario_ids = [sid for (sid,) in db.query(models.Scenario.scenarioid).order_by(models.Scenario.scenarioid).
+                    limit(STAGE_COUNT * SCENARIOS_PER_STAGE).all()]
+    return {sid: i // SCENARIOS_PER_STAGE + 1 for i, sid in enumerate(scenario_ids)}
@@ -9,7 +9,7 @@ from fastapi import HTTPException, status
 
 from ..models import User
 from ..api.schemas import UserCreate, UserUpdate
-from ..core.security import get_password_hash, verify_password
+from ..core.security import get_password_hash, verify_and_update
 
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
@@ -40,13 +40,14 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
 
-def create_user(db: Session, user_create: UserCreate) -> User:
+def create_user(db: Session, user_create: UserCreate, hashed_password: Optional[str] = None) -> User:
     """
     Create a new user
     
     Args:
         db: Database session
         user_create: User creation schema
+        hashed_password: Password hash computed by the caller (hashed here when None)
         
     Returns:
         User: Created user object
@@ -63,7 +64,8 @@ def create_user(db: Session, user_create: UserCreate) -> User:
         )
     
     # Hash the password
-    hashed_password = get_password_hash(user_create.password)
+    if hashed_password is None:
+        hashed_password = get_password_hash(user_create.password)
     
     # Create user object
     db_user = User(
@@ -132,6 +134,27 @@ def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[
         )
 
 
+def update_password_hash(db: Session, user_id: int, passwordhash: str) -> None:
+    """
+    Store an upgraded password hash (rehash on login)
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        passwordhash: New hash of the same password
+    """
+    db_user = get_user_by_id(db, user_id)
+    if not db_user:
+        return
+    try:
+        db_user.passwordhash = passwordhash
+        db.commit()
+    except Exception as e:
+        print(f"Error updating password hash: {e}")
+        db.rollback()
+        raise
+
+
 def delete_user(db: Session, user_id: int) -> bool:
     """
     Delete user from database
@@ -157,7 +180,7 @@ def delete_user(db: Session, user_id: int) -> bool:
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """
-    Authenticate user with email and password
+    Authenticate user with email and password, upgrading an outdated password hash
     
     Args:
         db: Database session
@@ -170,8 +193,11 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     user = get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.passwordhash):
+    verified, new_hash = verify_and_update(password, user.passwordhash)
+    if not verified:
         return None
+    if new_hash is not None:
+        update_password_hash(db, user.userid, new_hash)
     # Note: is_active field doesn't exist in current table
     # All users are considered active
     return user
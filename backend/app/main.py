@@ -2,12 +2,21 @@
 Main FastAPI application for Yetria Career Guidance Platform
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from dotenv import load_dotenv
 
-from .api.endpoints import auth, users, scenarios, responses, mentorship, courses
+from . import models
+from .api.endpoints import auth, users, scenarios, responses, mentorship, courses, admin
+from .core.config import settings
+from .core.database import create_missing_tables, dispose_async_engine
+from .core.metrics import metrics
+from .services.model_manager import model_manager
+from .services.course_index import course_index
+from .services.mentor_cache import mentor_cache
+from .services.auth_executor import auth_executor
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +37,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Add trusted host middleware for production
@@ -51,15 +61,88 @@ async def root():
 @app.get("/api/v1/health")
 async def health_check():
     """
-    Health check endpoint
+    Liveness probe - answers as soon as the process serves HTTP
     """
     return {"status": "healthy", "message": "API is running"}
 
 
+@app.get("/api/v1/ready")
+async def readiness_check():
+    """
+    Readiness probe - 503 until the prediction model is loaded and warmed up
+    """
+    model_status = model_manager.status()
+    if not model_status["ready"]:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "model": model_status}
+        )
+    return {"status": "ready", "model": model_status}
+
+
+@app.get("/api/v1/metrics")
+async def get_metrics():
+    """
+    In-process metrics (counters, gauges, histograms) of this worker
+    """
+    return metrics.snapshot()
+
+
+@app.on_event("startup")
+def create_derived_tables():
+    """
+    Create tables added after the initial schema on databases that predate
+    them. They start empty: user competency aggregates are rebuilt per user
+    from the response history on first use, result snapshots are saved on
+    the next result request, an unseeded scenariostage falls back to
+    slicing the scenario list into stages and revoked_token fills on logout.
+    """
+    create_missing_tables([
+        models.UserCompetencyAggregate.__table__,
+        models.UserResultSnapshot.__table__,
+        models.ScenarioStage.__table__,
+        models.RevokedToken.__table__,
+    ])
+
+
+@app.on_event("startup")
+def start_model_loading():
+    """
+    Load the model in the background, then watch artifacts/CURRENT and
+    hot-reload it when it changes. Non-ML routes are served meanwhile.
+    The course recommendation index and the mentor ranker are built in the
+    background as well.
+    """
+    model_manager.reload_in_background()
+    model_manager.start_watcher(settings.MODEL_WATCH_INTERVAL_SECONDS)
+    course_index.refresh_in_background()
+    mentor_cache.ranker.refresh_in_background()
+
+
+@app.on_event("shutdown")
+def stop_background_workers():
+    """
+    Stop background threads started by services
+    """
+    model_manager.stop_watcher()
+    responses.prediction_batcher.shutdown()
+    responses.result_writer.shutdown()
+    auth_executor.shutdown()
+
+
+@app.on_event("shutdown")
+async def close_async_database():
+    """
+    Close the async engine's pooled database connections
+    """
+    await dispose_async_engine()
+
+
 # Include API routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
 app.include_router(scenarios.router, prefix="/api/v1", tags=["scenarios"])
 app.include_router(responses.router, prefix="/api/v1", tags=["responses"])
 app.include_router(mentorship.router, prefix="/api/v1", tags=["mentorship"])
-app.include_router(courses.router, prefix="/api/v1", tags=["courses"])
\ No newline at end of file
+app.include_router(courses.router, prefix="/api/v1", tags=["courses"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
\ No newline at end of file
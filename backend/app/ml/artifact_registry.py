@@ -0,0 +1,241 @@
+"""
+Yetria Career Guidance Platform - Artifact Registry
+
+This module pins the files that make up one servable model version
+(model, label encoder, scaler and group averages) in a versioned manifest
+built on the model_metadata_*.json written by gridsearch_optimization.
+
+Layout inside artifacts/:
+- manifest_<version>.json: file names, sizes and SHA-256 hashes of one version
+- CURRENT: name of the active version (single small read at startup)
+
+Scaler and group averages are not timestamped by the training scripts, so
+registration snapshots them as scaler_<version>.joblib and
+grup_ortalamalari_<version>.joblib to keep every version self-contained.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PREFIX = "manifest_"
+CURRENT_POINTER = "CURRENT"
+ARTIFACT_ROLES = ("model", "encoder", "scaler", "group_means")
+
+
+class ArtifactRegistryError(Exception):
+    """Raised when a manifest is missing, malformed or does not match the files on disk."""
+
+
+def file_sha256(path: Path) -> str:
+    """Returns the hex SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactRegistry:
+    """Reads and writes versioned artifact manifests and the CURRENT pointer."""
+
+    def __init__(self, artifacts_path: Path):
+        self.artifacts_path = Path(artifacts_path)
+
+    def manifest_path(self, version: str) -> Path:
+        return self.artifacts_path / f"{MANIFEST_PREFIX}{version}.json"
+
+    def current_version(self) -> Optional[str]:
+        """Returns the active version from the CURRENT pointer, or None if not set."""
+        pointer = self.artifacts_path / CURRENT_POINTER
+        try:
+            version = pointer.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+
+    def load_manifest(self, version: Optional[str] = None) -> Dict[str, Any]:
+        """Loads the manifest of the given version (defaults to CURRENT)."""
+        if version is None:
+            version = self.current_version()
+            if version is None:
+                raise ArtifactRegistryError(f"No {CURRENT_POINTER} pointer in {self.artifacts_path}")
+        try:
+            with open(self.manifest_path(version), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise ArtifactRegistryError(f"Manifest for version '{version}' not found")
+        except json.JSONDecodeError as e:
+            raise ArtifactRegistryError(f"Manifest for version '{version}' is not valid JSON: {e}")
+
+        missing_roles = [role for role in ARTIFACT_ROLES if role not in manifest.get("artifacts", {})]
+        if missing_roles:
+            raise ArtifactRegistryError(f"Manifest '{version}' is missing artifacts: {missing_roles}")
+        return manifest
+
+    def resolve(self, version: Optional[str] = None, verify: bool = True) -> Dict[str, Any]:
+        """
+        Resolves a version to absolute artifact paths.
+
+        Args:
+            version: Version to resolve (defaults to CURRENT)
+            verify: Check every file against the SHA-256 recorded in the manifest
+
+        Returns:
+            Dict with 'version', 'manifest' and a 'paths' dict keyed by artifact role
+        """
+        manifest = self.load_manifest(version)
+        paths = {}
+        for role in ARTIFACT_ROLES:
+            entry = manifest["artifacts"][role]
+            path = self.artifacts_path / entry["file"]
+            if not path.exists():
+                raise ArtifactRegistryError(f"Artifact '{entry['file']}' of version '{manifest['version']}' not found")
+            if verify and file_sha256(path) != entry["sha256"]:
+                raise ArtifactRegistryError(
+                    f"Artifact '{entry['file']}' does not match the hash pinned in version '{manifest['version']}'"
+                )
+            paths[role] = path
+        return {"version": manifest["version"], "manifest": manifest, "paths": paths}
+
+    def register_from_metadata(
+        self,
+        metadata_path: Path,
+        model_type: str = "lightgbm",
+        scaler_path: Optional[Path] = None,
+        group_means_path: Optional[Path] = None,
+        activate: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Builds and writes the manifest for a training run described by model_metadata_<version>.json.
+
+        Args:
+            metadata_path: Metadata file written by gridsearch_optimization.save_results
+            model_type: Which model of the run to serve ('lightgbm' or 'catboost')
+            scaler_path: Scaler to pin (defaults to artifacts/scaler.joblib)
+            group_means_path: Group averages to pin (defaults to artifacts/grup_ortalamalari.joblib)
+            activate: Point CURRENT at the new version
+
+        Returns:
+            The written manifest
+        """
+        metadata_path = Path(metadata_path)
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        version = metadata["timestamp"]
+        if model_type not in metadata:
+            raise ArtifactRegistryError(f"Metadata '{metadata_path.name}' has no '{model_type}' model")
+
+        scaler_path = Path(scaler_path) if scaler_path else self.artifacts_path / "scaler.joblib"
+        group_means_path = Path(group_means_path) if group_means_path else self.artifacts_path / "grup_ortalamalari.joblib"
+
+        files = {
+            "model": self.artifacts_path / metadata[model_type]["model_file"],
+            "encoder": self.artifacts_path / metadata["encoder_file"],
+            "scaler": self._snapshot(scaler_path, f"scaler_{version}.joblib"),
+            "group_means": self._snapshot(group_means_path, f"grup_ortalamalari_{version}.joblib"),
+        }
+        for role, path in files.items():
+            if not path.exists():
+                raise ArtifactRegistryError(f"Cannot register version '{version}': {role} file '{path.name}' not found")
+
+        manifest = {
+            "version": version,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "model_type": model_type,
+            "metadata_file": metadata_path.name,
+            "n_classes": metadata.get("n_classes"),
+            "test_score": metadata[model_type].get("test_score"),
+            "artifacts": {
+                role: {"file": path.name, "sha256": file_sha256(path), "size": path.stat().st_size}
+                for role, path in files.items()
+            }
+        }
+        self._write_atomic(self.manifest_path(version), json.dumps(manifest, indent=2, ensure_ascii=False))
+        logger.info(f"Registered artifact version {version} ({model_type})")
+
+        if activate:
+            self.activate(version)
+        return manifest
+
+    def activate(self, version: str) -> None:
+        """Atomically points CURRENT at an already registered version."""
+        self.load_manifest(version)
+        self._write_atomic(self.artifacts_path / CURRENT_POINTER, version + "\n")
+        logger.info(f"Activated artifact version {version}")
+
+    def list_versions(self) -> List[str]:
+        """Lists registered versions, oldest first (scans the directory; not used on the serving path)."""
+        return sorted(
+            path.name[len(MANIFEST_PREFIX):-len(".json")]
+            for path in self.artifacts_path.glob(f"{MANIFEST_PREFIX}*.json")
+        )
+
+    def prune(self, keep: int = 3, dry_run: bool = False) -> List[Path]:
+        """
+        Removes artifacts of old versions, always keeping CURRENT and the newest `keep` versions.
+
+        Timestamped model/encoder files that no kept manifest references are removed too.
+
+        Returns:
+            List of removed (or, with dry_run, removable) files
+        """
+        versions = self.list_versions()
+        current = self.current_version()
+        kept = set(versions[-keep:] if keep > 0 else [])
+        if current:
+            kept.add(current)
+
+        referenced = {CURRENT_POINTER}
+        for version in kept:
+            manifest = self.load_manifest(version)
+            referenced.add(self.manifest_path(version).name)
+            referenced.update(entry["file"] for entry in manifest["artifacts"].values())
+            metadata_path = self.artifacts_path / manifest.get("metadata_file", "")
+            if metadata_path.is_file():
+                # Keep every model of the training run (evaluation scripts load both)
+                referenced.add(metadata_path.name)
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    metadata = json.load(f)
+                referenced.update(
+                    metadata[model_type]["model_file"] for model_type in ("catboost", "lightgbm")
+                    if model_type in metadata
+                )
+
+        patterns = (
+            f"{MANIFEST_PREFIX}*.json", "model_metadata_*.json", "*_optimized_*.pkl",
+            "label_encoder_*.pkl", "scaler_*.joblib", "grup_ortalamalari_*.joblib"
+        )
+        removable = sorted({
+            path for pattern in patterns for path in self.artifacts_path.glob(pattern)
+            if path.name not in referenced
+        })
+        if not dry_run:
+            for path in removable:
+                path.unlink()
+                logger.info(f"Pruned artifact {path.name}")
+        return removable
+
+    def _snapshot(self, source: Path, target_name: str) -> Path:
+        """Copies a non-versioned artifact under a versioned name (no-op if already there)."""
+        target = self.artifacts_path / target_name
+        if source.exists() and source.resolve() != target.resolve():
+            shutil.copy2(source, target)
+        return target
+
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """Writes a file via a temporary sibling and os.replace so readers never see partial content."""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
@@ -0,0 +1,174 @@
+"""
+Yetria Career Guidance Platform - Compact Model Export
+
+This module exports a registered artifact version into a compact on-disk
+form that worker processes can load without unpickling sklearn objects:
+
+- model.txt: LightGBM model in its native text format
+- scaler_mean.npy / scaler_scale.npy: StandardScaler parameters
+- group_means.npy: (n_classes, n_features) group averages
+- classes.npy: label encoder classes
+- tree_*.npy: trees compiled for the NumPy engine (see tree_ensemble.py)
+- compact.json: version, feature names and file list
+
+NumPy arrays are opened with mmap_mode='r', so every worker maps the same
+page-cache pages instead of holding a private copy. With the NumPy engine
+the LightGBM booster is not loaded at all.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from .artifact_registry import ArtifactRegistry, file_sha256
+from .tree_ensemble import NODE_ARRAYS, TreeEnsemble
+
+logger = logging.getLogger(__name__)
+
+COMPACT_PREFIX = "compact_"
+COMPACT_MANIFEST = "compact.json"
+
+
+class ArrayScaler:
+    """StandardScaler.transform over memory-mapped mean/scale arrays."""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        # Same operation order as StandardScaler: subtract mean, then divide by scale
+        X = np.array(X, dtype=np.float64)
+        X -= self.mean_
+        X /= self.scale_
+        return X
+
+
+class ArrayLabelEncoder:
+    """Minimal LabelEncoder stand-in exposing classes_."""
+
+    def __init__(self, classes: np.ndarray):
+        self.classes_ = classes
+
+
+class BoosterClassifier:
+    """LGBMClassifier.predict_proba over a raw lightgbm.Booster."""
+
+    def __init__(self, booster, n_classes: int):
+        self.booster_ = booster
+        self.n_classes = n_classes
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        result = self.booster_.predict(X)
+        if self.n_classes == 2:
+            return np.vstack((1.0 - result, result)).transpose()
+        return result
+
+
+def compact_dir(artifacts_path: Path, version: str) -> Path:
+    return Path(artifacts_path) / f"{COMPACT_PREFIX}{version}"
+
+
+def export_compact_model(artifacts_path: Path, version: Optional[str] = None) -> Path:
+    """
+    Writes the compact form of a registered version (CURRENT by default).
+
+    Args:
+        artifacts_path: Artifacts directory holding the registry
+        version: Registered version to export
+
+    Returns:
+        Path of the compact_<version>/ directory
+    """
+    import joblib
+
+    resolved = ArtifactRegistry(artifacts_path).resolve(version)
+    paths = resolved["paths"]
+    if resolved["manifest"].get("model_type") != "lightgbm":
+        raise ValueError("Compact export supports LightGBM models only")
+
+    model = joblib.load(paths["model"])
+    label_encoder = joblib.load(paths["encoder"])
+    scaler = joblib.load(paths["scaler"])
+    grup_ortalamalari = joblib.load(paths["group_means"])
+
+    feature_names = list(list(grup_ortalamalari.values())[0].keys())
+    classes = np.asarray([str(c) for c in label_encoder.classes_])
+    group_means = np.array(
+        [[float(grup_ortalamalari[c].get(f, 0.5)) if c in grup_ortalamalari else np.nan for f in feature_names]
+         for c in classes],
+        dtype=np.float64
+    )
+
+    target = compact_dir(artifacts_path, resolved["version"])
+    target.mkdir(exist_ok=True)
+    model.booster_.save_model(str(target / "model.txt"))
+    np.save(target / "scaler_mean.npy", np.asarray(scaler.mean_, dtype=np.float64))
+    np.save(target / "scaler_scale.npy", np.asarray(scaler.scale_, dtype=np.float64))
+    np.save(target / "group_means.npy", group_means)
+    np.save(target / "classes.npy", classes)
+
+    files = ["model.txt", "scaler_mean.npy", "scaler_scale.npy", "group_means.npy", "classes.npy"]
+    manifest = {
+        "version": resolved["version"],
+        "feature_names": feature_names,
+        "n_classes": int(len(classes))
+    }
+    try:
+        manifest["tree_ensemble"] = TreeEnsemble.from_lightgbm(model.booster_, scaler).save(target)
+        files += [f"tree_{name}.npy" for name in NODE_ARRAYS]
+    except ValueError as e:
+        logger.warning(f"Model cannot be compiled for the NumPy engine, skipping tree arrays: {e}")
+    manifest["files"] = {name: file_sha256(target / name) for name in files}
+    with open(target / COMPACT_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    logger.info(f"Exported compact model for version {resolved['version']} to {target.name}/")
+    return target
+
+
+def load_compact_model(path: Path, load_booster: bool = True) -> Dict[str, Any]:
+    """
+    Loads a compact export with read-only memory-mapped arrays.
+
+    Args:
+        path: compact_<version>/ directory
+        load_booster: Load the LightGBM booster; when False and tree arrays
+            exist, LightGBM is not imported and model is None
+
+    Returns:
+        Dict with model, tree_ensemble, le, scaler, grup_ortalamalari,
+        feature_names and version
+    """
+    path = Path(path)
+    with open(path / COMPACT_MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    classes = np.load(path / "classes.npy", mmap_mode="r")
+    group_means = np.load(path / "group_means.npy", mmap_mode="r")
+    feature_names = manifest["feature_names"]
+    grup_ortalamalari = {
+        str(class_name): dict(zip(feature_names, row.tolist()))
+        for class_name, row in zip(classes, group_means)
+        if not np.isnan(row).any()
+    }
+
+    tree_ensemble = TreeEnsemble.load(path, manifest["tree_ensemble"]) if "tree_ensemble" in manifest else None
+    model = None
+    if load_booster or tree_ensemble is None:
+        import lightgbm as lgb
+        model = BoosterClassifier(lgb.Booster(model_file=str(path / "model.txt")), manifest["n_classes"])
+
+    return {
+        "version": manifest["version"],
+        "feature_names": feature_names,
+        "model": model,
+        "tree_ensemble": tree_ensemble,
+        "le": ArrayLabelEncoder(classes),
+        "scaler": ArrayScaler(
+            np.load(path / "scaler_mean.npy", mmap_mode="r"),
+            np.load(path / "scaler_scale.npy", mmap_mode="r")
+        ),
+        "grup_ortalamalari": grup_ortalamalari
+    }
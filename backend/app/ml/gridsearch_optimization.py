@@ -30,6 +30,9 @@ from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+from .artifact_registry import ArtifactRegistry, ArtifactRegistryError
+from .compact_model import export_compact_model
+
 
 class OptimizationConfig:
     """Optimization configuration."""
@@ -596,6 +599,15 @@ def save_results(catboost_model, lightgbm_model, label_encoder,
     print(f"  - {encoder_path.name}")
     print(f"  - {metadata_path.name}")
     
+    # Pin model + encoder + scaler + group averages of this run as one servable version
+    try:
+        ArtifactRegistry(artifacts_dir).register_from_metadata(metadata_path, model_type="lightgbm")
+        print(f"✓ Artifact version registered and activated: {timestamp}")
+        export_compact_model(artifacts_dir, timestamp)
+        print(f"✓ Compact model exported: compact_{timestamp}/")
+    except ArtifactRegistryError as e:
+        print(f"⚠ Artifact version could not be registered: {e}")
+    
     # Rapor oluştur
     reports_dir = backend_path / "reports"
     reports_dir.mkdir(exist_ok=True)
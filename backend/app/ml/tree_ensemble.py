@@ -0,0 +1,191 @@
+"""
+Yetria Career Guidance Platform - NumPy Tree Ensemble
+
+This module compiles a trained LightGBM model into flat NumPy node arrays
+and evaluates it without calling into LightGBM. For single rows the native
+predict_proba spends most of its time in wrapper and call setup; walking
+all trees at once with array indexing skips that overhead.
+
+Node layout (one entry per node, all trees concatenated):
+
+- feature: split feature index (0 for leaves)
+- threshold: go left when x[feature] <= threshold; the StandardScaler is
+  folded in, so thresholds are in raw score space
+- children: [left, right] child indices of node i at 2*i and 2*i + 1;
+  leaves point to themselves
+- value: leaf output (0 for internal nodes)
+- roots: index of each tree's root node
+- nan_fill: per-feature raw value that reproduces LightGBM's NaN -> 0.0
+  substitution in scaled space (the scaler mean)
+
+Evaluation costs one NumPy pass per tree level regardless of row count,
+so it wins for small batches (about 8x for a single row) and loses to
+LightGBM's native multithreaded loop for large ones.
+"""
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NODE_ARRAYS = ("feature", "threshold", "children", "value", "roots", "nan_fill")
+
+
+class TreeEnsemble:
+    """Vectorized evaluator for a compiled gradient-boosted tree ensemble."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], objective: str, num_class: int,
+                 sigmoid: float = 1.0, max_depth: int = 0):
+        """
+        Args:
+            arrays: Node arrays named as in NODE_ARRAYS
+            objective: 'binary' or 'multiclass'
+            num_class: Number of classes (1 raw score per class for multiclass)
+            sigmoid: Sigmoid scale of the binary objective
+            max_depth: Deepest leaf, bounds the number of descent steps
+        """
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.children = arrays["children"]
+        self.value = arrays["value"]
+        self.roots = arrays["roots"]
+        self.nan_fill = arrays["nan_fill"]
+        self.objective = objective
+        self.num_class = num_class
+        self.sigmoid = sigmoid
+        self.max_depth = max_depth
+        self._is_leaf = self.children[::2] == np.arange(len(self.feature))
+
+    @classmethod
+    def from_lightgbm(cls, booster, scaler=None) -> "TreeEnsemble":
+        """
+        Compiles a lightgbm.Booster (or LGBMClassifier.booster_).
+
+        Args:
+            booster: Trained LightGBM booster
+            scaler: StandardScaler applied before the model; folded into thresholds
+
+        Raises:
+            ValueError: For objectives, categorical splits or missing-value
+                handling the evaluator does not reproduce
+        """
+        dump = booster.dump_model()
+        objective_parts = dump["objective"].split()
+        objective = objective_parts[0]
+        if objective not in ("binary", "multiclass"):
+            raise ValueError(f"Unsupported LightGBM objective: {dump['objective']}")
+        if dump.get("average_output"):
+            raise ValueError("Averaged (random forest) LightGBM models are not supported")
+        sigmoid = 1.0
+        for part in objective_parts[1:]:
+            if part.startswith("sigmoid:"):
+                sigmoid = float(part.split(":", 1)[1])
+
+        feature, threshold, children, value, roots = [], [], [], [], []
+        max_depth = 0
+
+        def add_node(node: Dict[str, Any], depth: int) -> int:
+            nonlocal max_depth
+            index = len(feature)
+            feature.append(0)
+            threshold.append(0.0)
+            children.extend((index, index))
+            value.append(0.0)
+            if "split_feature" not in node:
+                value[index] = float(node["leaf_value"])
+                max_depth = max(max_depth, depth)
+                return index
+
+            if node["decision_type"] != "<=":
+                raise ValueError("Categorical splits are not supported")
+            if node["missing_type"] != "None":
+                raise ValueError(f"Missing-value splits ({node['missing_type']}) are not supported")
+            feature[index] = int(node["split_feature"])
+            threshold[index] = float(node["threshold"])
+            children[2 * index] = add_node(node["left_child"], depth + 1)
+            children[2 * index + 1] = add_node(node["right_child"], depth + 1)
+            return index
+
+        for tree in dump["tree_info"]:
+            roots.append(add_node(tree["tree_structure"], 0))
+
+        n_features = dump["max_feature_idx"] + 1
+        arrays = {
+            # Index arrays are stored as intp so fancy indexing needs no conversion
+            "feature": np.asarray(feature, dtype=np.intp),
+            "threshold": np.asarray(threshold, dtype=np.float64),
+            "children": np.asarray(children, dtype=np.intp),
+            "value": np.asarray(value, dtype=np.float64),
+            "roots": np.asarray(roots, dtype=np.intp),
+            "nan_fill": np.zeros(n_features, dtype=np.float64),
+        }
+        if scaler is not None:
+            # x_scaled <= t  <=>  x <= t * scale + mean  (scale > 0)
+            mean = scaler.mean_ if getattr(scaler, "mean_", None) is not None else np.zeros(n_features)
+            scale = scaler.scale_ if getattr(scaler, "scale_", None) is not None else np.ones(n_features)
+            mean, scale = np.asarray(mean, dtype=np.float64), np.asarray(scale, dtype=np.float64)
+            internal = arrays["children"][::2] != np.arange(len(feature))
+            split_features = arrays["feature"][internal]
+            arrays["threshold"][internal] = arrays["threshold"][internal] * scale[split_features] + mean[split_features]
+            arrays["nan_fill"] = mean.copy()
+
+        num_class = int(dump["num_class"])
+        return cls(arrays, objective, num_class if objective != "binary" else 2, sigmoid, max_depth)
+
+    def predict_raw(self, X: np.ndarray) -> np.ndarray:
+        """Raw margin per row: (n_rows,) for binary, (n_rows, num_class) otherwise."""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        if np.isnan(X).any():
+            X = np.where(np.isnan(X), self.nan_fill, X)
+        flat_x = X.ravel()
+        row_offsets = np.arange(X.shape[0])[:, None] * X.shape[1]
+        nodes = np.tile(self.roots, (X.shape[0], 1))
+        for depth in range(1, self.max_depth + 1):
+            # Right child when x > threshold (LightGBM goes left on <=)
+            go_right = flat_x[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_right]
+            # Leaves loop on themselves, so checking only now and then is safe
+            if depth % 4 == 0 and self._is_leaf[nodes].all():
+                break
+
+        leaf_values = self.value[nodes]
+        if self.objective == "binary":
+            return leaf_values.sum(axis=1)
+        # Trees are interleaved by class: tree i scores class i % num_class
+        return leaf_values.reshape(X.shape[0], -1, self.num_class).sum(axis=1)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities with the same layout as LGBMClassifier.predict_proba."""
+        raw = self.predict_raw(X)
+        if self.objective == "binary":
+            positive = 1.0 / (1.0 + np.exp(-self.sigmoid * raw))
+            return np.vstack((1.0 - positive, positive)).transpose()
+        raw = raw - raw.max(axis=1, keepdims=True)
+        exp = np.exp(raw)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "objective": self.objective,
+            "num_class": self.num_class,
+            "sigmoid": self.sigmoid,
+            "max_depth": self.max_depth,
+            "n_trees": int(len(self.roots)),
+            "n_nodes": int(len(self.feature))
+        }
+
+    def save(self, directory: Path) -> Dict[str, Any]:
+        """Writes tree_<name>.npy files and returns the metadata to store alongside."""
+        directory = Path(directory)
+        for name in NODE_ARRAYS:
+            np.save(directory / f"tree_{name}.npy", getattr(self, name))
+        return self.metadata()
+
+    @classmethod
+    def load(cls, directory: Path, metadata: Dict[str, Any], mmap_mode: Optional[str] = "r") -> "TreeEnsemble":
+        """Opens node arrays written by save(), memory-mapped by default."""
+        directory = Path(directory)
+        arrays = {name: np.load(directory / f"tree_{name}.npy", mmap_mode=mmap_mode) for name in NODE_ARRAYS}
+        return cls(arrays, metadata["objective"], metadata["num_class"], metadata["sigmoid"], metadata["max_depth"])
@@ -3,7 +3,7 @@ ORM Models for Yetria Career Guidance Platform
 Maps to existing database tables
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -107,7 +107,7 @@ class Occupation(Base):
     __tablename__ = "occupation"
 
     occupationid = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False)
+    title = Column(String(255), nullable=False, index=True)
 
 
 class MatchStatus(Base):
@@ -160,6 +160,9 @@ class MentorMatch(Base):
     status = relationship("MatchStatus")
     mentor = relationship("MentorProfile")
 
+    # Student request listing (keyset pages by mentormatchid)
+    __table_args__ = (Index('ix_mentormatch_student_request', 'studentuserid', 'mentormatchid'),)
+
 
 class Course(Base):
     """
@@ -216,4 +219,55 @@ class UserAssessmentResult(Base):
     # Relationships
     user = relationship("User")
     
-    __table_args__ = (UniqueConstraint('userid', name='unique_user_assessment_result'),)
\ No newline at end of file
+    __table_args__ = (UniqueConstraint('userid', name='unique_user_assessment_result'),)
+
+class UserCompetencyAggregate(Base):
+    """
+    Running per-user, per-competency score totals
+    Maintained with deltas by save_user_responses; rebuilt from scenarioresponse
+    by scripts/db/competency_aggregates.py
+    """
+    __tablename__ = 'user_competency_aggregate'
+    
+    userid = Column(Integer, ForeignKey('User.userid'), primary_key=True)
+    competencyid = Column(Integer, ForeignKey('competency.competencyid'), primary_key=True)
+    total = Column(Float, nullable=False, default=0.0)   # Sum of selected option scores
+    count = Column(Integer, nullable=False, default=0)   # Number of answered scenarios
+
+class UserResultSnapshot(Base):
+    """
+    Materialized /responses/result payload per user
+    Valid while model_version and the fingerprint of the user's competency
+    aggregates still match; recomputed otherwise
+    """
+    __tablename__ = 'user_result_snapshot'
+    
+    userid = Column(Integer, ForeignKey('User.userid'), primary_key=True)
+    model_version = Column(String(64), nullable=False)
+    response_fingerprint = Column(String(64), nullable=False)  # SHA-256 of per-competency totals
+    payload = Column(String, nullable=False)                   # PredictionResultSchema as JSON
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class ScenarioStage(Base):
+    """
+    Assessment stage and position of each scenario
+    Seeded by scripts/db/scenario_stages.py; scenarios without a row are not
+    part of any stage
+    """
+    __tablename__ = 'scenariostage'
+    
+    scenarioid = Column(Integer, ForeignKey('scenario.scenarioid'), primary_key=True)
+    stage = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)  # Order within the stage
+    
+    __table_args__ = (Index('ix_scenariostage_stage_position', 'stage', 'position'),)
+
+class RevokedToken(Base):
+    """
+    Access tokens revoked before their exp (logout, account deletion)
+    Shared by every worker; rows are purged once the token has expired
+    """
+    __tablename__ = 'revoked_token'
+    
+    tokenid = Column(String(64), primary_key=True)           # jti claim, or SHA-256 of tokens without one
+    expiresat = Column(DateTime, nullable=False, index=True)  # Token exp (UTC)
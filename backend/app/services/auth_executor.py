@@ -0,0 +1,121 @@
+"""
+Yetria Career Guidance Platform - Auth Executor
+
+This module runs password hashing and verification (bcrypt, hundreds of
+milliseconds each at the configured cost) on a small dedicated thread
+pool, so that signup and login waves neither block the event loop nor
+occupy the threadpool that serves every other sync route.
+
+bcrypt releases the GIL while hashing, so AUTH_HASH_WORKERS threads hash
+in parallel on as many cores. At most AUTH_HASH_MAX_PENDING operations
+are admitted (running plus queued); beyond that callers get
+AuthPoolSaturated immediately, which the auth endpoints answer with
+429 Too Many Requests and a Retry-After header instead of letting the
+queue, and every client's latency, grow without bound.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
+from ..core import security
+from ..core.config import settings
+from ..core.metrics import metrics
+
+T = TypeVar("T")
+
+auth_pool_pending = metrics.gauge("auth_pool_pending", "Password hash/verify operations running or queued")
+auth_pool_rejections_total = metrics.counter("auth_pool_rejections_total", "Password operations refused because the pool was full")
+auth_pool_wait_seconds = metrics.histogram("auth_pool_wait_seconds", "Time password operations waited for a worker")
+auth_pool_run_seconds = metrics.histogram("auth_pool_run_seconds", "Time spent hashing or verifying a password")
+
+
+class AuthPoolSaturated(Exception):
+    """Raised when the auth pool already holds max_pending operations."""
+
+
+class AuthExecutor:
+    """Bounded thread pool for password hashing and verification."""
+
+    def __init__(self, workers: int = 2, max_pending: int = 16):
+        """
+        Args:
+            workers: Threads hashing passwords concurrently
+            max_pending: Operations admitted at once (running plus queued) before refusing
+        """
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        auth_pool_pending.set(0)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash_password(self, password: str) -> str:
+        return await self.run(security.get_password_hash, password)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(security.verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """security.verify_and_update on the pool; verify cache hits are answered without queueing."""
+        if security.password_verify_cache.contains(plain_password, hashed_password):
+            return True, None
+        return await self.run(security.verify_and_update, plain_password, hashed_password)
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Runs func(*args) on the pool and waits for it.
+
+        Raises:
+            AuthPoolSaturated: If max_pending operations are already admitted
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                auth_pool_rejections_total.inc()
+                raise AuthPoolSaturated(f"{self._pending} password operations pending")
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="auth-hash")
+            executor = self._executor
+        auth_pool_pending.inc()
+
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            auth_pool_wait_seconds.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                auth_pool_run_seconds.observe(time.perf_counter() - started)
+
+        try:
+            future = executor.submit(timed)
+        except RuntimeError:
+            self._release()
+            raise
+        # Released when the operation finishes or is cancelled before starting,
+        # so a disconnected client does not free a slot its hash still holds
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+        auth_pool_pending.dec()
+
+    def shutdown(self) -> None:
+        """Stops the worker threads once queued operations have finished."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Process-wide auth pool
+auth_executor = AuthExecutor(workers=settings.AUTH_HASH_WORKERS, max_pending=settings.AUTH_HASH_MAX_PENDING)
@@ -0,0 +1,118 @@
+"""
+Yetria Career Guidance Platform - Course Index
+
+This module keeps an in-memory inverted index of the course catalogue for
+competency-based course recommendations.
+
+Each competency maps to a fixed list of search keywords. A course matches
+a keyword when the keyword occurs anywhere in its lowercased title and
+description (substring match, so "yönetim" also matches "yönetimi").
+Those checks run once per course when the index is built; the index then
+stores, per competency, a posting list of (courseid, weight) where the
+weight is the number of that competency's keywords the course matches.
+
+A recommendation merges the posting lists of the requested competencies
+and selects the top k by score with a heap, ties broken by courseid.
+
+The index is rebuilt in the background when Course rows change (see
+core.cache for the invalidation contract; COURSE_INDEX_TTL_SECONDS);
+requests keep using the previous index meanwhile.
+"""
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.cache import SnapshotCache, track_model_changes
+from ..core.config import settings
+from ..core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Competency -> keywords searched in course title and description
+COMPETENCY_COURSE_KEYWORDS: Dict[str, List[str]] = {
+    # Sayısal Zeka
+    "numerical": ["matematik", "mathematical", "sayısal", "hesaplama"],
+    "analytical": ["analitik", "analytical", "eleştirel", "critical", "düşünme", "thinking"],
+    "stress_management": ["stres", "stress", "duygu", "emotion", "yönetim", "management"],
+    "empathy": ["empati", "empathy", "anlayış", "understanding"],
+    "teamwork": ["takım", "team", "ekip", "işbirliği", "collaboration"],
+    "decision_making": ["problem", "karar", "decision", "çözme", "solving"],
+    "resilience": ["dayanıklılık", "resilience", "direnç", "resistance"]
+}
+
+index_builds_total = metrics.counter("course_index_builds_total", "Course index builds")
+index_build_seconds = metrics.histogram("course_index_build_seconds", "Time to build the course index")
+
+
+class CourseIndex:
+    """Immutable competency -> weighted posting list index for one version of the course table."""
+
+    def __init__(self, version: int, courses: Sequence[Tuple[int, str, Optional[str]]],
+                 competency_keywords: Dict[str, List[str]] = COMPETENCY_COURSE_KEYWORDS):
+        """
+        Args:
+            version: Data version the index was built for
+            courses: (courseid, title, description) rows
+            competency_keywords: Competency -> keywords to search for
+        """
+        self.version = version
+        self.course_count = len(courses)
+
+        # keyword -> courseids containing it, computed once per distinct keyword
+        keywords = {keyword.lower() for words in competency_keywords.values() for keyword in words}
+        keyword_postings: Dict[str, List[int]] = {keyword: [] for keyword in keywords}
+        for courseid, title, description in courses:
+            text = f"{title} {description or ''}".lower()
+            for keyword in keywords:
+                if keyword in text:
+                    keyword_postings[keyword].append(courseid)
+
+        # competency -> [(courseid, number of its keywords matched)]
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for competency, words in competency_keywords.items():
+            weights: Dict[int, int] = {}
+            for keyword in words:
+                for courseid in keyword_postings[keyword.lower()]:
+                    weights[courseid] = weights.get(courseid, 0) + 1
+            self.postings[competency] = sorted(weights.items())
+
+    def top_course_ids(self, competencies: Sequence[str], limit: int) -> List[int]:
+        """
+        Highest scoring course ids for the competencies, best first.
+
+        A course's score is the sum of its weights over the requested
+        competencies (repeated competencies count again); unknown
+        competencies are ignored.
+        """
+        scores: Dict[int, int] = {}
+        for competency in competencies:
+            for courseid, weight in self.postings.get(competency, ()):
+                scores[courseid] = scores.get(courseid, 0) + weight
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [courseid for courseid, _ in best]
+
+
+class CourseIndexCache(SnapshotCache[CourseIndex]):
+    """Holds the current CourseIndex and rebuilds it in the background when the course table changes."""
+
+    name = "course-index"
+
+    def build(self, db: Session, version: int) -> CourseIndex:
+        started = time.perf_counter()
+        courses = db.query(models.Course.courseid, models.Course.title, models.Course.description).all()
+        index = CourseIndex(version, courses)
+
+        elapsed = time.perf_counter() - started
+        index_builds_total.inc()
+        index_build_seconds.observe(elapsed)
+        logger.info(f"Course index v{index.version} built: {index.course_count} courses ({elapsed * 1000:.1f}ms)")
+        return index
+
+
+# Process-wide course index
+course_index = CourseIndexCache(ttl_seconds=settings.COURSE_INDEX_TTL_SECONDS)
+track_model_changes([models.Course], course_index.invalidate)
@@ -0,0 +1,120 @@
+"""
+Yetria Career Guidance Platform - Mentor Cache
+
+This module caches what GET /mentors/recommend reads on every call:
+
+- occupation title -> occupationid (always on; unknown titles are cached too)
+- occupationid -> mentor rows with the mentor's name (MENTOR_CACHE_SIZE
+  occupations, 0 disables)
+- the MentorRanker matrices used to order mentors by fit (always on;
+  rebuilt in the background while the previous one keeps being served)
+
+All are cleared when a MentorProfile, Occupation or OccupationProfile
+changes or a User is renamed or deleted (see core.cache for the
+invalidation contract; MENTOR_CACHE_TTL_SECONDS).
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.cache import LRUCache, SnapshotCache, track_model_changes
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..crud.mentorship_crud import get_occupation_id_by_title, list_occupation_mentors
+from .mentor_ranking import MentorRanker, load_mentor_ranker
+
+logger = logging.getLogger(__name__)
+
+OCCUPATION_TITLE_CACHE_SIZE = 1024
+_NOT_FOUND = -1
+TRACKED_MODELS = (models.MentorProfile, models.Occupation, models.OccupationProfile)
+
+mentor_cache_hits_total = metrics.counter("mentor_cache_hits_total", "Mentor lists served from the cache")
+mentor_cache_misses_total = metrics.counter("mentor_cache_misses_total", "Mentor lists loaded from the database")
+
+
+class MentorRankerCache(SnapshotCache[MentorRanker]):
+    """Holds the current MentorRanker and rebuilds it in the background when mentor data changes."""
+
+    name = "mentor-ranker"
+
+    def build(self, db: Session, version: int) -> MentorRanker:
+        return load_mentor_ranker(db)
+
+
+class MentorCache:
+    """Occupation title lookups and per-occupation mentor lists, invalidated on mentor data changes."""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 0):
+        """
+        Args:
+            max_size: Occupations whose mentor list is kept (0 disables the mentor list cache)
+            ttl_seconds: Entry lifetime (0 = until invalidated)
+        """
+        self.max_size = max_size
+        self._occupation_ids = LRUCache(OCCUPATION_TITLE_CACHE_SIZE, ttl_seconds)
+        self._mentors = LRUCache(max_size, ttl_seconds)
+        self.ranker = MentorRankerCache(ttl_seconds)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drops every cached lookup; loads that started earlier are not stored."""
+        with self._lock:
+            self._version += 1
+            self._occupation_ids.clear()
+            self._mentors.clear()
+        self.ranker.invalidate()
+        logger.debug(f"Mentor cache invalidated (v{self._version})")
+
+    def get_occupation_id(self, db: Session, occupation_title: str) -> Optional[int]:
+        occupation_id = self._occupation_ids.get(occupation_title)
+        if occupation_id is None:
+            version = self._version
+            occupation_id = get_occupation_id_by_title(db, occupation_title)
+            occupation_id = _NOT_FOUND if occupation_id is None else occupation_id
+            self._store(self._occupation_ids, version, occupation_title, occupation_id)
+        return None if occupation_id == _NOT_FOUND else occupation_id
+
+    def get_mentors(self, db: Session, occupation_id: int) -> List[Dict[str, Any]]:
+        """Returns the occupation's mentor rows; callers must not modify them."""
+        mentors = self._mentors.get(occupation_id)
+        if mentors is not None:
+            mentor_cache_hits_total.inc()
+            return mentors
+
+        mentor_cache_misses_total.inc()
+        version = self._version
+        mentors = list_occupation_mentors(db, occupation_id)
+        self._store(self._mentors, version, occupation_id, mentors)
+        return mentors
+
+    def get_ranker(self, db: Session) -> MentorRanker:
+        return self.ranker.get(db)
+
+    def _store(self, cache: LRUCache, version: int, key, value) -> None:
+        with self._lock:
+            if version == self._version:
+                cache.set(key, value)
+
+
+# Process-wide mentor cache
+mentor_cache = MentorCache(max_size=settings.MENTOR_CACHE_SIZE, ttl_seconds=settings.MENTOR_CACHE_TTL_SECONDS)
+
+
+def _affects_mentors(instance, state: str) -> bool:
+    if isinstance(instance, TRACKED_MODELS):
+        return True
+    if isinstance(instance, models.User):
+        # New users have no mentor profile yet, and only mentor names are cached
+        if state == "deleted":
+            return True
+        return state == "dirty" and inspect(instance).attrs.name.history.has_changes()
+    return False
+
+
+track_model_changes((*TRACKED_MODELS, models.User), mentor_cache.invalidate, where=_affects_mentors)
@@ -0,0 +1,187 @@
+"""
+Yetria Career Guidance Platform - Mentor Ranking
+
+This module scores how well mentors fit a student's competency profile.
+
+Every mentor gets a competency vector: the ideal scores of their
+occupation (occupationprofile.idealscore), with the mentor's own
+assessment averages taking precedence where they have answered that
+competency. A student's fit to a mentor is
+
+    matchscore = 100 * (1 - RMS(student - mentor) / SCORE_RANGE)
+
+over the competencies both have, clipped to [0, 100]. All mentors are
+scored with a few matrix-vector products over matrices prepared at load
+time, so scoring the whole candidate set takes well under a millisecond.
+"""
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from .. import models
+
+logger = logging.getLogger(__name__)
+
+# Competency scores are on a 1-5 scale
+SCORE_RANGE = 4.0
+
+
+class ProfileMatrix:
+    """
+    Competency profiles prepared for scoring many rows against one student.
+
+    With K the known-value mask of the profiles P (NaN -> 0) and m the
+    student's mask, the squared distance over shared competencies expands to
+    (K*P^2) @ m - 2 (K*P) @ (m*s) + K @ (m*s^2), so scoring every row is
+    four matrix-vector products over precomputed matrices.
+    """
+
+    def __init__(self, profiles: np.ndarray):
+        """
+        Args:
+            profiles: (n, n_competencies) ideal/mentor scores, NaN where unknown
+        """
+        known = ~np.isnan(profiles)
+        filled = np.where(known, profiles, 0.0)
+        self.known = known.astype(np.float64)
+        self.weighted = filled
+        self.weighted_squares = filled * filled
+
+    def scores(self, student: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Scores the profiles (or the given rows) against the student vector.
+
+        Args:
+            student: (n_competencies,) student averages, NaN where unanswered
+            rows: Row indices to score (all rows when None)
+
+        Returns:
+            matchscores in [0, 100]; NaN for rows sharing no competency with the student
+        """
+        known, weighted, weighted_squares = self.known, self.weighted, self.weighted_squares
+        if rows is not None:
+            known, weighted, weighted_squares = known[rows], weighted[rows], weighted_squares[rows]
+        answered = ~np.isnan(student)
+        mask = answered.astype(np.float64)
+        values = np.where(answered, student, 0.0)
+
+        counts = known @ mask
+        squared = weighted_squares @ mask - 2.0 * (weighted @ values) + known @ (values * values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rms = np.sqrt(np.maximum(squared, 0.0) / counts)
+        return np.clip(100.0 * (1.0 - rms / SCORE_RANGE), 0.0, 100.0)
+
+
+class MentorRanker:
+    """Per-mentor competency vectors built from the occupation ideal-score matrix, scored in one pass."""
+
+    def __init__(
+        self,
+        competency_ids: List[int],
+        occupation_ids: List[int],
+        ideal_scores: np.ndarray,
+        mentor_ids: List[int],
+        mentor_scores: np.ndarray
+    ):
+        """
+        Args:
+            competency_ids: Column order of every matrix
+            occupation_ids: Row order of ideal_scores
+            ideal_scores: (n_occupations, n_competencies), NaN where no ideal score is set
+            mentor_ids: Row order of mentor_scores (mentorprofileid)
+            mentor_scores: (n_mentors, n_competencies), NaN where unknown
+        """
+        self.competency_ids = competency_ids
+        self.competency_index = {cid: i for i, cid in enumerate(competency_ids)}
+        self.occupation_ids = occupation_ids
+        self.ideal_scores = ideal_scores
+        self.mentor_ids = mentor_ids
+        self.mentor_index = {mid: i for i, mid in enumerate(mentor_ids)}
+        self.mentor_scores = mentor_scores
+        self._mentors = ProfileMatrix(mentor_scores)
+
+    def student_vector(self, averages: Dict[int, float]) -> np.ndarray:
+        """Builds the student's vector in column order from {competencyid: average}."""
+        vector = np.full(len(self.competency_ids), np.nan)
+        for competency_id, average in averages.items():
+            column = self.competency_index.get(competency_id)
+            if column is not None:
+                vector[column] = average
+        return vector
+
+    def score_mentors(self, student: np.ndarray) -> np.ndarray:
+        """Matchscore of every mentor, in mentor_ids order."""
+        return self._mentors.scores(student)
+
+    def rank(self, mentors: List[Dict], student: np.ndarray) -> List[Dict]:
+        """
+        Returns copies of the mentor rows with matchscore set, best fit first.
+
+        Mentors the ranker does not know yet (added after it was loaded) or
+        without comparable competencies keep matchscore None and go last.
+        """
+        rows = [self.mentor_index.get(mentor["mentorprofileid"]) for mentor in mentors]
+        known_rows = np.array([row for row in rows if row is not None], dtype=np.intp)
+        scores = dict(zip(known_rows.tolist(), self._mentors.scores(student, known_rows).tolist()))
+        ranked = []
+        for mentor, row in zip(mentors, rows):
+            score = scores.get(row) if row is not None else None
+            score = None if score is None or np.isnan(score) else round(score, 2)
+            ranked.append({**mentor, "matchscore": score})
+        ranked.sort(key=lambda mentor: (mentor["matchscore"] is None, -(mentor["matchscore"] or 0.0)))
+        return ranked
+
+    def mentor_score(self, student: np.ndarray, mentor_id: int) -> Optional[float]:
+        row = self.mentor_index.get(mentor_id)
+        if row is None:
+            return None
+        score = self._mentors.scores(student, np.array([row]))[0]
+        return None if np.isnan(score) else round(float(score), 2)
+
+
+def load_mentor_ranker(db: Session) -> MentorRanker:
+    """Loads competencies, ideal scores, mentors and mentors' own assessment averages (four queries)."""
+    started = time.perf_counter()
+    competency_ids = [cid for (cid,) in db.query(models.Competency.competencyid).
+                      order_by(models.Competency.competencyid).all()]
+    column = {cid: i for i, cid in enumerate(competency_ids)}
+
+    profile_rows = db.query(
+        models.OccupationProfile.occupationid,
+        models.OccupationProfile.competencyid,
+        models.OccupationProfile.idealscore
+    ).filter(models.OccupationProfile.idealscore.isnot(None)).all()
+    mentors: List[Tuple[int, int, int]] = db.query(
+        models.MentorProfile.mentorprofileid,
+        models.MentorProfile.occupationid,
+        models.MentorProfile.userid
+    ).order_by(models.MentorProfile.mentorprofileid).all()
+    mentor_averages = db.query(
+        models.MentorProfile.mentorprofileid,
+        models.UserCompetencyAggregate.competencyid,
+        models.UserCompetencyAggregate.total / models.UserCompetencyAggregate.count
+    ).join(
+        models.UserCompetencyAggregate, models.UserCompetencyAggregate.userid == models.MentorProfile.userid
+    ).filter(models.UserCompetencyAggregate.count > 0).all()
+
+    occupation_ids = sorted({occupation_id for occupation_id, _, _ in profile_rows} |
+                            {occupation_id for _, occupation_id, _ in mentors})
+    occupation_row = {oid: i for i, oid in enumerate(occupation_ids)}
+    ideal_scores = np.full((len(occupation_ids), len(competency_ids)), np.nan)
+    for occupation_id, competency_id, ideal_score in profile_rows:
+        if competency_id in column:
+            ideal_scores[occupation_row[occupation_id], column[competency_id]] = ideal_score
+
+    mentor_ids = [mentor_id for mentor_id, _, _ in mentors]
+    mentor_scores = ideal_scores[[occupation_row[occupation_id] for _, occupation_id, _ in mentors]]
+    mentor_row = {mid: i for i, mid in enumerate(mentor_ids)}
+    for mentor_id, competency_id, average in mentor_averages:
+        if competency_id in column:
+            mentor_scores[mentor_row[mentor_id], column[competency_id]] = average
+
+    logger.info(f"Mentor ranker loaded: {len(occupation_ids)} occupations x {len(competency_ids)} competencies, "
+                f"{len(mentor_ids)} mentors ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    return MentorRanker(competency_ids, occupation_ids, ideal_scores, mentor_ids, mentor_scores)
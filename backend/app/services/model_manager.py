@@ -0,0 +1,200 @@
+"""
+Yetria Career Guidance Platform - Model Manager
+
+This module provides a ModelManager class that owns the active
+PredictionService and replaces it without downtime: a new artifact version
+is loaded and warmed up next to the serving one, then swapped in with a
+single reference assignment. Calls that already hold the old service
+finish on it.
+
+Importing this module does not import NumPy, joblib or LightGBM; they are
+loaded with the first model, so the API can start answering liveness and
+non-ML routes while the model warms up in the background.
+"""
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..ml.artifact_registry import ArtifactRegistry
+
+if TYPE_CHECKING:
+    from .prediction_service import PredictionService
+
+logger = logging.getLogger(__name__)
+
+reload_seconds = metrics.histogram("model_reload_seconds", "Time to load and warm up a model version")
+reloads_total = metrics.counter("model_reloads_total", "Successful model swaps")
+reload_failures_total = metrics.counter("model_reload_failures_total", "Failed model reload attempts")
+active_version = metrics.gauge("model_active_version", "Artifact version currently serving predictions")
+
+
+class ModelNotReadyError(RuntimeError):
+    """Raised when a prediction is requested before the first model version is loaded."""
+
+
+class ModelManager:
+    """Holds the serving PredictionService and hot-swaps it on reload."""
+
+    def __init__(self, artifacts_path: Path = None, load_mode: str = "pickle", engine: str = "native",
+                 cache_size: int = 0, cache_ttl_seconds: float = 0):
+        if artifacts_path is None:
+            # Navigate to backend/artifacts from current file location
+            artifacts_path = Path(__file__).resolve().parents[2] / "artifacts"
+        self.artifacts_path = artifacts_path
+        self.load_mode = load_mode
+        self.engine = engine
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._service: Optional["PredictionService"] = None
+        self._reload_lock = threading.Lock()
+        self._reload_thread: Optional[threading.Thread] = None
+        self._watcher_thread: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self._failed_version: Optional[str] = None
+        self.last_reload_at: Optional[float] = None
+        self.last_reload_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def service(self) -> "PredictionService":
+        """The PredictionService serving requests right now."""
+        service = self._service
+        if service is None:
+            raise ModelNotReadyError("Prediction model is not loaded yet")
+        return service
+
+    @property
+    def is_ready(self) -> bool:
+        """True once a model version has been loaded and warmed up."""
+        return self._service is not None
+
+    @property
+    def version(self) -> Optional[str]:
+        service = self._service
+        return service.model_version if service is not None else None
+
+    @property
+    def is_reloading(self) -> bool:
+        return self._reload_lock.locked()
+
+    def predict_and_analyze(self, user_scores: Dict[str, float]) -> Dict[str, Any]:
+        return self.service.predict_and_analyze(user_scores)
+
+    def predict_and_analyze_batch(self, users_scores: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        return self.service.predict_and_analyze_batch(users_scores)
+
+    def load(self, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Loads and warms up a version (CURRENT by default), then swaps it in.
+
+        Runs in the calling thread; concurrent reloads are serialized.
+        Raises if the new version cannot be loaded or fails warm-up, in which
+        case the previous service keeps serving.
+        """
+        with self._reload_lock:
+            started = time.perf_counter()
+            try:
+                # Deferred so importing the API does not pull in the ML stack
+                from .prediction_service import PredictionService
+                candidate = PredictionService(
+                    self.artifacts_path, version=version, load_mode=self.load_mode, engine=self.engine,
+                    cache_size=self.cache_size, cache_ttl_seconds=self.cache_ttl_seconds
+                )
+                self._warm_up(candidate)
+            except Exception as e:
+                reload_failures_total.inc()
+                self.last_error = str(e)
+                logger.error(f"Model reload failed, keeping version {self.version}: {e}")
+                raise
+
+            previous_version = self.version
+            self._service = candidate
+            elapsed = time.perf_counter() - started
+
+            self.last_reload_at = time.time()
+            self.last_reload_seconds = elapsed
+            self.last_error = None
+            reload_seconds.observe(elapsed)
+            reloads_total.inc()
+            active_version.set(candidate.model_version)
+            logger.info(f"Model version {previous_version} -> {candidate.model_version} swapped in ({elapsed:.2f}s)")
+            return self.status()
+
+    def reload_in_background(self, version: Optional[str] = None) -> bool:
+        """Starts a reload on a daemon thread; returns False if one is already running."""
+        if self.is_reloading or (self._reload_thread is not None and self._reload_thread.is_alive()):
+            return False
+
+        def run():
+            try:
+                self.load(version)
+            except Exception:
+                pass  # Already logged and counted by load()
+
+        self._reload_thread = threading.Thread(target=run, name="model-reload", daemon=True)
+        self._reload_thread.start()
+        return True
+
+    def start_watcher(self, interval_seconds: float) -> None:
+        """Polls the registry CURRENT pointer and reloads when it names a new version."""
+        if interval_seconds <= 0 or (self._watcher_thread is not None and self._watcher_thread.is_alive()):
+            return
+        registry = ArtifactRegistry(self.artifacts_path)
+        self._watcher_stop.clear()
+
+        def watch():
+            while not self._watcher_stop.wait(interval_seconds):
+                try:
+                    current = registry.current_version()
+                except OSError as e:
+                    logger.warning(f"Could not read artifact pointer: {e}")
+                    continue
+                if self.is_reloading:
+                    continue
+                if current and current != self.version and current != self._failed_version:
+                    logger.info(f"Artifact pointer moved to {current}, reloading model")
+                    try:
+                        self.load(current)
+                        self._failed_version = None
+                    except Exception:
+                        # Do not retry a broken version on every tick
+                        self._failed_version = current
+
+        self._watcher_thread = threading.Thread(target=watch, name="model-watcher", daemon=True)
+        self._watcher_thread.start()
+        logger.info(f"Watching artifact pointer every {interval_seconds}s")
+
+    def stop_watcher(self) -> None:
+        self._watcher_stop.set()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.is_ready,
+            "active_version": self.version,
+            "engine": self._service.engine if self._service is not None else None,
+            "reloading": self.is_reloading,
+            "last_reload_at": self.last_reload_at,
+            "last_reload_seconds": self.last_reload_seconds,
+            "last_error": self.last_error
+        }
+
+    @staticmethod
+    def _warm_up(service: "PredictionService") -> None:
+        """Runs one prediction on the first class's group averages so the first real request is not cold."""
+        sample = dict(zip(service.feature_names, service._group_means_matrix[0].tolist()))
+        result = service.predict_and_analyze(sample)
+        if "error" in result:
+            raise RuntimeError(f"Warm-up prediction failed: {result['error']}")
+
+
+# Process-wide model manager
+model_manager = ModelManager(
+    load_mode=settings.MODEL_LOAD_MODE,
+    engine=settings.PREDICTION_ENGINE,
+    cache_size=settings.PREDICTION_CACHE_SIZE,
+    cache_ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS
+)
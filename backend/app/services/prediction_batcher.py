@@ -0,0 +1,90 @@
+"""
+Yetria Career Guidance Platform - Prediction Batcher
+
+This module provides a PredictionBatcher class that coalesces concurrent
+prediction requests into a single PredictionService.predict_and_analyze_batch
+call, so many users share one model invocation instead of each paying for
+their own tiny predict_proba call.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """Collects prediction requests over a short window and runs them as one batch."""
+
+    def __init__(self, service, window_ms: float = 2.0, max_batch_size: int = 64, workers: int = 1):
+        """
+        Args:
+            service: PredictionService used to score each batch
+            window_ms: How long the first request of a batch waits for company
+            max_batch_size: Batch size that triggers an immediate flush
+            workers: Number of threads running model calls
+        """
+        self.service = service
+        self.window_seconds = window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self.workers = max(1, workers)
+        self._executor = None
+        self._pending: List[Tuple[Dict[str, float], asyncio.Future]] = []
+        self._flush_handle = None
+        self._loop = None
+
+    async def predict_and_analyze(self, user_scores: Dict[str, float]) -> Dict[str, Any]:
+        """Queues one user's scores and waits for its result from the next batch."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Batches are bound to a single event loop (one per uvicorn worker)
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((user_scores, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Hands every pending request to a worker thread as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            self._loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[Dict[str, float], asyncio.Future]]) -> None:
+        """Scores a batch in the executor and resolves each caller's future."""
+        users_scores = [user_scores for user_scores, _ in batch]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prediction-batch")
+        try:
+            results = await self._loop.run_in_executor(
+                self._executor, self.service.predict_and_analyze_batch, users_scores
+            )
+        except Exception as e:
+            logger.error(f"Error in batched prediction: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug(f"Scored prediction batch of {len(batch)} requests")
+        for (_, future), result in zip(batch, results):
+            # Callers that disconnected have already cancelled their future
+            if not future.done():
+                future.set_result(result)
+
+    def shutdown(self) -> None:
+        """Stops the worker threads once queued batches have finished."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
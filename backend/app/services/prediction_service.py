@@ -5,19 +5,50 @@ This module provides a PredictionService class that uses trained models
 and related components to make predictions and analysis for new user data.
 """
 import logging
-import pandas as pd
 import numpy as np
 import joblib
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from ..core.cache import LRUCache
+from ..core.metrics import metrics
+from ..ml.artifact_registry import ArtifactRegistry, ArtifactRegistryError
+from ..ml.compact_model import COMPACT_MANIFEST, compact_dir, load_compact_model
+from ..ml.tree_ensemble import TreeEnsemble
 
 logger = logging.getLogger(__name__)
 
+# Above this many rows LightGBM's native loop beats the NumPy tree engine
+NUMPY_ENGINE_MAX_ROWS = 32
+
+cache_hits_total = metrics.counter("prediction_cache_hits_total", "Predictions answered from the probability cache")
+cache_misses_total = metrics.counter("prediction_cache_misses_total", "Distinct score vectors sent to the model")
+cache_entries = metrics.gauge("prediction_cache_entries", "Entries in the active model's probability cache")
+
 class PredictionService:
     """Loads model components and manages prediction logic."""
 
-    def __init__(self, artifacts_path: Path = None):
-        """Loads all required model components (artifacts)."""
+    def __init__(self, artifacts_path: Path = None, version: Optional[str] = None, load_mode: str = "pickle",
+                 engine: str = "native", cache_size: int = 0, cache_ttl_seconds: float = 0):
+        """
+        Loads all required model components (artifacts).
+
+        Components come from the artifact registry manifest (CURRENT unless a
+        version is given). Trees without a registered version fall back to the
+        latest timestamped files.
+
+        Args:
+            artifacts_path: Artifacts directory (defaults to backend/artifacts)
+            version: Registered artifact version to load
+            load_mode: 'pickle' unpickles the sklearn objects; 'compact' loads the
+                compact export (LightGBM text model + memory-mapped NumPy arrays)
+            engine: 'native' calls the model's predict_proba; 'numpy' evaluates the
+                trees compiled into NumPy arrays (falls back to native when the
+                model cannot be compiled)
+            cache_size: Max cached probability vectors (0 disables the cache).
+                The cache lives on this instance, so a reloaded model starts empty
+            cache_ttl_seconds: Expiry of cached entries (0 keeps them until evicted)
+        """
         if artifacts_path is None:
             # Navigate to backend/artifacts from current file location
             self.artifacts_path = Path(__file__).resolve().parents[2] / "artifacts"
@@ -25,154 +56,284 @@ class PredictionService:
             self.artifacts_path = artifacts_path
 
         logger.info("Initializing PredictionService, loading components...")
+        self.tree_ensemble = None
+        self._probability_cache = LRUCache(cache_size, cache_ttl_seconds) if cache_size > 0 else None
         try:
-            # Try to load optimized LightGBM model first
-            lightgbm_files = list(self.artifacts_path.glob('lightgbm_optimized_*.pkl'))
-            if lightgbm_files:
-                # Use the latest LightGBM model
-                latest_lightgbm = max(lightgbm_files, key=lambda x: x.stat().st_mtime)
-                self.model = joblib.load(latest_lightgbm)
-                logger.info(f"✓ Optimized LightGBM model loaded: {latest_lightgbm.name}")
-            else:
-                # Fallback: use legacy model
-                self.model = joblib.load(self.artifacts_path / 'best_model.joblib')
-                logger.warning("⚠ Optimized model not found, using legacy model")
-            
-            self.scaler = joblib.load(self.artifacts_path / 'scaler.joblib')
-            
-            # Load label encoder from optimized model
-            encoder_files = list(self.artifacts_path.glob('label_encoder_*.pkl'))
-            if encoder_files:
-                latest_encoder = max(encoder_files, key=lambda x: x.stat().st_mtime)
-                self.le = joblib.load(latest_encoder)
-                logger.info(f"✓ Optimized label encoder loaded: {latest_encoder.name}")
+            registry = ArtifactRegistry(self.artifacts_path)
+            if version is None:
+                version = registry.current_version()
+
+            if version is None:
+                logger.warning("⚠ No registered artifact version, loading latest files by modification time")
+                self._load_latest_artifacts()
+                self.model_version = "unregistered"
+            elif load_mode == "compact" and (compact_dir(self.artifacts_path, version) / COMPACT_MANIFEST).exists():
+                components = load_compact_model(compact_dir(self.artifacts_path, version),
+                                                load_booster=engine != "numpy")
+                self.model = components["model"]
+                self.tree_ensemble = components["tree_ensemble"] if engine == "numpy" else None
+                self.le = components["le"]
+                self.scaler = components["scaler"]
+                self.grup_ortalamalari = components["grup_ortalamalari"]
+                self.model_version = components["version"]
+                logger.info(f"✓ Compact model for version {self.model_version} loaded (memory-mapped)")
             else:
-                self.le = joblib.load(self.artifacts_path / 'label_encoder.joblib')
-                logger.warning("⚠ Optimized encoder not found, using legacy encoder")
-            
-            self.grup_ortalamalari = joblib.load(self.artifacts_path / 'grup_ortalamalari.joblib')
+                if load_mode == "compact":
+                    logger.warning(f"⚠ No compact export for version {version}, unpickling artifacts instead")
+                resolved = registry.resolve(version)
+                paths = resolved["paths"]
+                self.model = joblib.load(paths["model"])
+                self.le = joblib.load(paths["encoder"])
+                self.scaler = joblib.load(paths["scaler"])
+                self.grup_ortalamalari = joblib.load(paths["group_means"])
+                self.model_version = resolved["version"]
+                logger.info(f"✓ Artifact version {self.model_version} loaded: {paths['model'].name}")
+
+            if engine == "numpy" and self.tree_ensemble is None:
+                self._compile_tree_ensemble()
+            self.engine = "numpy" if self.tree_ensemble is not None else "native"
+
             self.feature_names = list(list(self.grup_ortalamalari.values())[0].keys())
+            self._build_feature_index()
+            self._build_group_means_matrix()
             logger.info("All components loaded successfully.")
             logger.debug(f"Feature names from model: {self.feature_names}")
         except FileNotFoundError as e:
             logger.error(f"Required model file not found: {e.filename}")
             logger.error("Please ensure you have run the model training script (gridsearch or baseline) first.")
             raise
+        except ArtifactRegistryError as e:
+            logger.error(f"Could not resolve model artifacts: {e}")
+            raise
 
-    def _validate_input(self, user_scores: Dict[str, float]) -> List[float]:
-        """Validates input user scores and orders them as expected by the model."""
+    def _load_latest_artifacts(self) -> None:
+        """Legacy loading: picks the newest model and encoder files by st_mtime."""
+        # Try to load optimized LightGBM model first
+        lightgbm_files = list(self.artifacts_path.glob('lightgbm_optimized_*.pkl'))
+        if lightgbm_files:
+            # Use the latest LightGBM model
+            latest_lightgbm = max(lightgbm_files, key=lambda x: x.stat().st_mtime)
+            self.model = joblib.load(latest_lightgbm)
+            logger.info(f"✓ Optimized LightGBM model loaded: {latest_lightgbm.name}")
+        else:
+            # Fallback: use legacy model
+            self.model = joblib.load(self.artifacts_path / 'best_model.joblib')
+            logger.warning("⚠ Optimized model not found, using legacy model")
+
+        self.scaler = joblib.load(self.artifacts_path / 'scaler.joblib')
+
+        # Load label encoder from optimized model
+        encoder_files = list(self.artifacts_path.glob('label_encoder_*.pkl'))
+        if encoder_files:
+            latest_encoder = max(encoder_files, key=lambda x: x.stat().st_mtime)
+            self.le = joblib.load(latest_encoder)
+            logger.info(f"✓ Optimized label encoder loaded: {latest_encoder.name}")
+        else:
+            self.le = joblib.load(self.artifacts_path / 'label_encoder.joblib')
+            logger.warning("⚠ Optimized encoder not found, using legacy encoder")
+
+        self.grup_ortalamalari = joblib.load(self.artifacts_path / 'grup_ortalamalari.joblib')
+
+    def _compile_tree_ensemble(self) -> None:
+        """Compiles the loaded LightGBM model (scaler folded in) for the NumPy engine."""
+        booster = getattr(self.model, "booster_", None)
+        if booster is None:
+            logger.warning(f"⚠ NumPy engine supports LightGBM only, using native {type(self.model).__name__}")
+            return
+        try:
+            self.tree_ensemble = TreeEnsemble.from_lightgbm(booster, self.scaler)
+            logger.info(f"✓ Compiled {len(self.tree_ensemble.roots)} trees for the NumPy engine")
+        except ValueError as e:
+            logger.warning(f"⚠ Model cannot be compiled for the NumPy engine, using native: {e}")
+
+    def _predict_proba(self, scores_matrix: np.ndarray) -> np.ndarray:
+        """Class probabilities for raw (unscaled) score rows."""
+        if self.tree_ensemble is not None and (self.model is None or len(scores_matrix) <= NUMPY_ENGINE_MAX_ROWS):
+            return self.tree_ensemble.predict_proba(scores_matrix)
+        return self.model.predict_proba(self.scaler.transform(scores_matrix))
+
+    def _cached_predict_proba(self, scores_matrix: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities through the LRU cache.
+
+        Entries are keyed by the exact score row, so a cached result is the
+        one the model returns for that row. /responses rounds competency
+        averages to 0.1, so repeated submissions share keys; repeated
+        /responses/result requests of a user repeat the same row.
+        Duplicate rows within a batch are scored once.
+        """
+        if self._probability_cache is None:
+            return self._predict_proba(scores_matrix)
+
+        probabilities = np.empty((len(scores_matrix), len(self.le.classes_)), dtype=np.float64)
+        missing: Dict[Any, List[int]] = {}
+        for position, row in enumerate(scores_matrix):
+            key = (self.model_version, row.tobytes())
+            cached = self._probability_cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(position)
+            else:
+                probabilities[position] = cached
+
+        if missing:
+            computed = self._predict_proba(scores_matrix[[positions[0] for positions in missing.values()]])
+            for (key, positions), row_probabilities in zip(missing.items(), computed):
+                self._probability_cache.set(key, row_probabilities.copy())
+                probabilities[positions] = row_probabilities
+
+        cache_hits_total.inc(len(scores_matrix) - len(missing))
+        cache_misses_total.inc(len(missing))
+        cache_entries.set(len(self._probability_cache))
+        return probabilities
+
+    def _build_feature_index(self) -> None:
+        """Precomputes exact and normalized (stripped, lower-case) feature name -> column lookups."""
+        self._feature_positions = {feature: index for index, feature in enumerate(self.feature_names)}
+        self._normalized_feature_positions = {}
+        for index, feature in enumerate(self.feature_names):
+            self._normalized_feature_positions.setdefault(feature.strip().lower(), index)
+
+    def _fill_row(self, user_scores: Dict[str, float], row: np.ndarray) -> None:
+        """
+        Validates input user scores and writes them into a preallocated float64 row
+        in the order expected by the model.
+        """
         if not isinstance(user_scores, dict):
             raise TypeError("Input must be in 'dict' format.")
-        
-        logger.debug("_validate_input called")
-        logger.debug(f"User scores keys: {list(user_scores.keys())}")
-        logger.debug(f"Expected features: {self.feature_names}")
-        
-        ordered_scores = []
+
+        # Fast path: every feature is present under its exact name
+        ordered_scores = [user_scores.get(feature) for feature in self.feature_names]
+        if None in ordered_scores:
+            # Single pass over the incoming keys; an exact match wins, otherwise the
+            # first key that matches after cleaning (case-insensitive, stripped)
+            cleaned_matches = {}
+            for user_key, user_val in user_scores.items():
+                index = self._normalized_feature_positions.get(str(user_key).strip().lower())
+                if index is not None and index not in cleaned_matches:
+                    cleaned_matches[index] = user_val
+            ordered_scores = [
+                score if score is not None else cleaned_matches.get(index)
+                for index, score in enumerate(ordered_scores)
+            ]
+
         missing_keys = []
-        
-        # Handle missing or mismatched competency names
-        for feature in self.feature_names:
-            score = user_scores.get(feature)
-            
-            # If exact match not found, try cleaning and matching
-            if score is None:
-                # Try to find similar key (case-insensitive, stripped)
-                feature_clean = feature.strip().lower()
-                for user_key, user_val in user_scores.items():
-                    user_key_clean = str(user_key).strip().lower()
-                    if user_key_clean == feature_clean:
-                        score = user_val
-                        logger.debug(f"Matched '{feature}' with '{user_key}'")
-                        break
-            
+        for index, score in enumerate(ordered_scores):
             if score is None:
-                missing_keys.append(feature)
+                missing_keys.append(self.feature_names[index])
                 # Use default score instead of raising error
-                score = 0.5
-                logger.debug(f"Missing feature '{feature}', using default 0.5")
+                ordered_scores[index] = 0.5
             elif not isinstance(score, (int, float)):
-                raise ValueError(f"'{feature}' score must be numeric.")
-            
-            ordered_scores.append(score)
-            
+                raise ValueError(f"'{self.feature_names[index]}' score must be numeric.")
+
         if missing_keys:
             logger.warning(f"⚠️  Missing keys: {missing_keys}")
             logger.warning("⚠️  This will cause identical results for all users!")
-        
-        logger.debug(f"Ordered scores: {ordered_scores}")
-        return ordered_scores
 
-    def predict_and_analyze(self, user_scores: Dict[str, float]) -> Dict[str, Any]:
-        """Performs complete prediction and analysis using user scores."""
-        try:
-            scores_array = np.array(self._validate_input(user_scores)).reshape(1, -1)
-        except (ValueError, TypeError) as e:
-            logger.error(f"Error in _validate_input: {e}")
-            return {"error": str(e)}
+        row[:] = ordered_scores
+
+    def _validate_input(self, user_scores: Dict[str, float]) -> List[float]:
+        """Validates input user scores and orders them as expected by the model."""
+        row = np.empty(len(self.feature_names), dtype=np.float64)
+        self._fill_row(user_scores, row)
+        return row.tolist()
+
+    def _build_group_means_matrix(self) -> None:
+        """Lays out group averages as a (n_classes, n_features) matrix in label-encoder order."""
+        classes = list(self.le.classes_)
+        self._group_means_matrix = np.full((len(classes), len(self.feature_names)), 0.5, dtype=np.float64)
+        self._group_means_available = np.zeros(len(classes), dtype=bool)
+        for class_index, class_name in enumerate(classes):
+            meslek_ortalamalari = self.grup_ortalamalari.get(class_name)
+            if meslek_ortalamalari is None:
+                continue
+            self._group_means_available[class_index] = True
+            for feature_index, feature in enumerate(self.feature_names):
+                self._group_means_matrix[class_index, feature_index] = float(meslek_ortalamalari.get(feature, 0.5))
+
+    def _build_results(self, scores_matrix: np.ndarray, probabilities: np.ndarray) -> List[Dict[str, Any]]:
+        """Builds prediction payloads for every row of a scored batch."""
+        classes = self.le.classes_
+        uyum_matrix = np.rint(probabilities * 100).astype(np.int64)
+        # Stable descending order keeps ties in class order, like sorted(..., reverse=True)
+        uyum_order = np.argsort(-uyum_matrix, axis=1, kind="stable")
+        winner_indices = np.argmax(probabilities, axis=1)
+        group_means = self._group_means_matrix[winner_indices]
+        differences = scores_matrix - group_means
 
+        results = []
+        for row_index, winner_index in enumerate(winner_indices.tolist()):
+            kazanan_meslek = classes[winner_index]
+            if not self._group_means_available[winner_index]:
+                logger.error(f"Error building yetkinlik_karsilastirmasi: no group averages for '{kazanan_meslek}'")
+                results.append({"error": f"Error building comparison: {str(KeyError(kazanan_meslek))}"})
+                continue
+
+            uyum_row = uyum_matrix[row_index].tolist()
+            uyum_skorlari = [
+                {"meslek": classes[class_index], "uyum": uyum_row[class_index]}
+                for class_index in uyum_order[row_index].tolist()
+            ]
+
+            # Python round() keeps the rounding identical to the single-user payload
+            yetkinlik_karsilastirmasi = [
+                {
+                    "yetkinlik": feature,
+                    "kullanici_skoru": round(user_score, 1),
+                    "grup_ortalamasi": round(grup_ort, 1),
+                    "fark": round(fark, 1)
+                }
+                for feature, user_score, grup_ort, fark in zip(
+                    self.feature_names,
+                    scores_matrix[row_index].tolist(),
+                    group_means[row_index].tolist(),
+                    differences[row_index].tolist()
+                )
+            ]
+
+            results.append({
+                "uyum_skorlari": uyum_skorlari,
+                "kazanan_meslek": kazanan_meslek,
+                "yetkinlik_karsilastirmasi": yetkinlik_karsilastirmasi
+            })
+        return results
+
+    def predict_and_analyze_batch(self, users_scores: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Performs prediction and analysis for many users with a single model call.
+
+        Each item of the returned list is identical to what predict_and_analyze
+        returns for the corresponding input, including per-item error payloads.
+        """
+        results: List[Dict[str, Any]] = [None] * len(users_scores)
+        scores_matrix = np.empty((len(users_scores), len(self.feature_names)), dtype=np.float64)
+        valid_indices = []
+        for index, user_scores in enumerate(users_scores):
+            try:
+                self._fill_row(user_scores, scores_matrix[len(valid_indices)])
+                valid_indices.append(index)
+            except (ValueError, TypeError) as e:
+                logger.error(f"Error in _validate_input: {e}")
+                results[index] = {"error": str(e)}
+
+        if not valid_indices:
+            return results
+
+        scores_matrix = scores_matrix[:len(valid_indices)]
         try:
-            scores_scaled = self.scaler.transform(scores_array)
-            probabilities = self.model.predict_proba(scores_scaled)[0]
+            probabilities = self._cached_predict_proba(scores_matrix)
         except Exception as e:
             logger.error(f"Error in model prediction: {e}")
-            return {"error": f"Model prediction error: {str(e)}"}
-        
-        uyum_skorlari = [
-            {"meslek": class_name, "uyum": round(prob * 100)}
-            for class_name, prob in zip(self.le.classes_, probabilities)
-        ]
-        
-        try:
-            winner_index = int(np.argmax(probabilities))
-            kazanan_meslek = self.le.classes_[winner_index]
-            meslek_ortalamalari = self.grup_ortalamalari[kazanan_meslek]
-
-            # Build competency comparison with safe key lookup
-            yetkinlik_karsilastirmasi = []
-            for feature in self.feature_names:
-                try:
-                    # Try to find matching key in user_scores (case-insensitive)
-                    user_score = user_scores.get(feature)
-                    if user_score is None:
-                        feature_clean = feature.strip().lower()
-                        for user_key, user_val in user_scores.items():
-                            if str(user_key).strip().lower() == feature_clean:
-                                user_score = user_val
-                                break
-                    
-                    # If still not found, use default
-                    if user_score is None:
-                        user_score = 0.5
-                        logger.debug(f"Using default score 0.5 for feature '{feature}' in comparison")
-                    
-                    # Safe access to profession averages
-                    grup_ort = meslek_ortalamalari.get(feature, 0.5)
-                    
-                    yetkinlik_karsilastirmasi.append({
-                        "yetkinlik": feature,
-                        "kullanici_skoru": round(float(user_score), 1),
-                        "grup_ortalamasi": round(float(grup_ort), 1),
-                        "fark": round(float(user_score) - float(grup_ort), 1)
-                    })
-                except Exception as e:
-                    logger.error(f"Error processing feature '{feature}': {e}")
-                    # Add with default values
-                    yetkinlik_karsilastirmasi.append({
-                        "yetkinlik": feature,
-                        "kullanici_skoru": 0.5,
-                        "grup_ortalamasi": 0.5,
-                        "fark": 0.0
-                    })
-        except Exception as e:
-            logger.error(f"Error building yetkinlik_karsilastirmasi: {e}")
-            return {"error": f"Error building comparison: {str(e)}"}
-
-        return {
-            "uyum_skorlari": sorted(uyum_skorlari, key=lambda x: x['uyum'], reverse=True),
-            "kazanan_meslek": kazanan_meslek,
-            "yetkinlik_karsilastirmasi": yetkinlik_karsilastirmasi
-        }
+            for index in valid_indices:
+                results[index] = {"error": f"Model prediction error: {str(e)}"}
+            return results
+
+        for index, result in zip(valid_indices, self._build_results(scores_matrix, probabilities)):
+            results[index] = result
+        return results
+
+    def predict_and_analyze(self, user_scores: Dict[str, float]) -> Dict[str, Any]:
+        """Performs complete prediction and analysis using user scores."""
+        return self.predict_and_analyze_batch([user_scores])[0]
 
 if __name__ == '__main__':
     pass
\ No newline at end of file
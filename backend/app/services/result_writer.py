@@ -0,0 +1,163 @@
+"""
+Yetria Career Guidance Platform - Assessment Result Writer
+
+This module provides an AssessmentResultWriter that persists assessment
+results on background threads, so POST /responses can answer as soon as
+the prediction is ready instead of waiting for the select, JSON encoding
+and commit of save_user_assessment_result.
+
+Pending writes are keyed by userid: a newer result for a user replaces
+one that has not been written yet, and a user is never written by two
+threads at once, so the last submitted result is the one that ends up
+stored. Failed writes are retried with exponential backoff.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.metrics import metrics
+from ..crud.assessment_result_crud import save_user_assessment_result
+
+logger = logging.getLogger(__name__)
+
+queue_depth = metrics.gauge("assessment_result_queue_depth", "Assessment results waiting to be written")
+write_seconds = metrics.histogram("assessment_result_write_seconds", "Time to write one assessment result")
+writes_total = metrics.counter("assessment_result_writes_total", "Assessment results written")
+writes_coalesced_total = metrics.counter("assessment_result_writes_coalesced_total",
+                                         "Pending results replaced by a newer one for the same user")
+write_retries_total = metrics.counter("assessment_result_write_retries_total", "Assessment result writes retried")
+write_failures_total = metrics.counter("assessment_result_write_failures_total",
+                                       "Assessment results dropped after the last retry")
+
+
+class AssessmentResultWriter:
+    """Bounded, per-user coalescing queue of assessment results written by worker threads."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_queue_size: int = 1000,
+        workers: int = 2,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.2
+    ):
+        """
+        Args:
+            session_factory: Creates the database session for each write
+            max_queue_size: Users with a pending write before submit() refuses new ones
+            workers: Number of writer threads
+            max_retries: Attempts after the first failed write
+            retry_backoff_seconds: Delay before the first retry, doubled for each further one
+        """
+        self.session_factory = session_factory
+        self.max_queue_size = max(1, max_queue_size)
+        self.workers = max(1, workers)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._pending: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._in_flight = set()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._stopping = False
+
+    def submit(self, user_id: int, prediction_result: Dict[str, Any]) -> bool:
+        """
+        Queues a user's result for writing.
+
+        Returns:
+            bool: False when the queue is full or shut down; the caller should write it itself
+        """
+        with self._condition:
+            if self._stopping:
+                return False
+            if user_id in self._pending:
+                writes_coalesced_total.inc()
+            elif len(self._pending) >= self.max_queue_size:
+                return False
+            self._pending[user_id] = prediction_result
+            queue_depth.set(len(self._pending))
+            self._start_workers()
+            self._condition.notify()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued result has been written; returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._in_flight, timeout)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Stops accepting results and waits for the workers to drain the queue."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        with self._condition:
+            if self._pending:
+                logger.warning(f"Shutting down with {len(self._pending)} unwritten assessment results")
+            self._threads = []
+
+    def _start_workers(self) -> None:
+        # Called with the condition held; threads are started on first use
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"assessment-result-writer-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _next(self):
+        """Takes the oldest pending result whose user is not being written; None when stopping and empty."""
+        with self._condition:
+            while True:
+                for user_id in self._pending:
+                    if user_id not in self._in_flight:
+                        result = self._pending.pop(user_id)
+                        self._in_flight.add(user_id)
+                        queue_depth.set(len(self._pending))
+                        return user_id, result
+                if self._stopping and not self._pending:
+                    return None
+                self._condition.wait()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            user_id, result = item
+            try:
+                self._write(user_id, result)
+            finally:
+                with self._condition:
+                    self._in_flight.discard(user_id)
+                    self._condition.notify_all()
+
+    def _write(self, user_id: int, prediction_result: Dict[str, Any]) -> None:
+        """Writes one result, retrying with exponential backoff."""
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            db = None
+            try:
+                db = self.session_factory()
+                save_user_assessment_result(db=db, user_id=user_id, prediction_result=prediction_result)
+                write_seconds.observe(time.perf_counter() - started)
+                writes_total.inc()
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    write_failures_total.inc()
+                    logger.error(f"Dropping assessment result for user {user_id} after "
+                                 f"{attempt + 1} attempts: {e}")
+                    return
+                write_retries_total.inc()
+                logger.warning(f"Assessment result write for user {user_id} failed, retrying: {e}")
+            finally:
+                if db is not None:
+                    db.close()
+            time.sleep(self.retry_backoff_seconds * (2 ** attempt))
@@ -0,0 +1,92 @@
+"""
+Yetria Career Guidance Platform - Scenario Catalogue
+
+This module keeps the GET /scenarios payloads pre-rendered: the JSON bytes
+of the full scenario list and of each stage (one indexed scenariostage
+query per stage), with a strong ETag derived from the bytes so clients can
+revalidate with If-None-Match.
+
+The catalogue is re-rendered in the background when the scenario index
+version changes and at least every SCENARIO_INDEX_TTL_SECONDS. Because
+the ETag is a hash of the content, every worker hands out the same ETag
+for the same catalogue.
+"""
+import hashlib
+import json
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..api import schemas
+from ..core.cache import SnapshotCache
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..crud.scenario_crud import STAGE_COUNT, get_all_scenarios
+from .scenario_index import ScenarioIndexCache, scenario_index
+
+logger = logging.getLogger(__name__)
+
+catalogue_builds_total = metrics.counter("scenario_catalogue_builds_total", "Scenario catalogue renders")
+
+
+def render_json(content) -> bytes:
+    """Serializes like FastAPI's JSONResponse."""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class CatalogueSnapshot:
+    """Rendered bodies and ETags for one version of the scenario data."""
+
+    def __init__(self, version: int, scenarios_by_stage: Dict[Optional[int], list]):
+        """
+        Args:
+            version: Scenario index version the snapshot was rendered for
+            scenarios_by_stage: Scenario dicts per stage, all scenarios under None
+        """
+        self.version = version
+        self._entries: Dict[Optional[int], Tuple[bytes, str]] = {}
+        for stage, scenarios in scenarios_by_stage.items():
+            body = render_json(scenarios)
+            self._entries[stage] = (body, strong_etag(body))
+
+    def get(self, stage: Optional[int] = None) -> Tuple[bytes, str]:
+        """Returns (JSON body, ETag) for one stage, or for all scenarios when stage is None."""
+        return self._entries[stage]
+
+
+class ScenarioCatalogue(SnapshotCache[CatalogueSnapshot]):
+    """Holds the current CatalogueSnapshot and re-renders it in the background when scenario data changes."""
+
+    name = "scenario-catalogue"
+
+    def __init__(self, index: ScenarioIndexCache, ttl_seconds: float = 0):
+        super().__init__(ttl_seconds)
+        self.index = index
+
+    @property
+    def version(self) -> int:
+        # Follows the scenario index, which tracks scenario data changes
+        return self.index.version
+
+    def build(self, db: Session, version: int) -> CatalogueSnapshot:
+        started = time.perf_counter()
+        scenarios_by_stage = {
+            stage: [schemas.Scenario(**scenario).model_dump() for scenario in get_all_scenarios(db, stage)]
+            for stage in (None, *range(1, STAGE_COUNT + 1))
+        }
+        snapshot = CatalogueSnapshot(version, scenarios_by_stage)
+
+        catalogue_builds_total.inc()
+        logger.info(f"Scenario catalogue v{version} rendered: {len(scenarios_by_stage[None])} scenarios "
+                    f"({(time.perf_counter() - started) * 1000:.1f}ms)")
+        return snapshot
+
+
+# Process-wide scenario catalogue
+scenario_catalogue = ScenarioCatalogue(scenario_index, ttl_seconds=settings.SCENARIO_INDEX_TTL_SECONDS)
@@ -0,0 +1,116 @@
+"""
+Yetria Career Guidance Platform - Scenario Index
+
+This module keeps a process-wide, read-only snapshot of the scenario data
+that request handlers look up on every call:
+
+- (scenario_id, option letter) -> option id, competency and score
+- option id -> the same entry
+- scenario_id -> option ids in letter order
+- all competency names
+
+The snapshot is built with one ordered query and rebuilt in the background
+when Scenario, ScenarioOption, Competency or ScenarioStage rows change
+(see core.cache for the invalidation contract; SCENARIO_INDEX_TTL_SECONDS).
+Requests keep using the previous snapshot meanwhile.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.cache import SnapshotCache, track_model_changes
+from ..core.config import settings
+from ..core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TRACKED_MODELS = (models.Scenario, models.ScenarioOption, models.Competency, models.ScenarioStage)
+
+index_builds_total = metrics.counter("scenario_index_builds_total", "Scenario index snapshots built")
+index_build_seconds = metrics.histogram("scenario_index_build_seconds", "Time to build a scenario index snapshot")
+
+
+@dataclass(frozen=True)
+class OptionEntry:
+    scenariooptionid: int
+    scenarioid: int
+    competencyid: int
+    competency_name: str
+    score: float
+
+
+class ScenarioIndex:
+    """Immutable lookup tables for one version of the scenario data."""
+
+    def __init__(self, version: int, rows: List[Tuple]):
+        """
+        Args:
+            version: Data version the snapshot was built for
+            rows: (competencyid, competency name, scenarioid, scenariooptionid, score)
+                ordered by scenarioid, scenariooptionid; scenario/option columns
+                are None for competencies without scenarios
+        """
+        self.version = version
+        self.options: Dict[Tuple[int, str], OptionEntry] = {}
+        self.options_by_id: Dict[int, OptionEntry] = {}
+        self.option_ids_by_scenario: Dict[int, Tuple[int, ...]] = {}
+        competency_names: Dict[int, str] = {}
+
+        option_ids: Dict[int, List[int]] = {}
+        for competencyid, competency_name, scenarioid, scenariooptionid, score in rows:
+            competency_names[competencyid] = competency_name
+            if scenarioid is None:
+                continue
+            ids = option_ids.setdefault(scenarioid, [])
+            if scenariooptionid is None:
+                continue
+            letter = chr(65 + len(ids))  # A=65, B=66, C=67, D=68
+            ids.append(scenariooptionid)
+            entry = OptionEntry(scenariooptionid, scenarioid, competencyid, competency_name, score)
+            self.options[(scenarioid, letter)] = entry
+            self.options_by_id[scenariooptionid] = entry
+
+        self.option_ids_by_scenario = {scenarioid: tuple(ids) for scenarioid, ids in option_ids.items()}
+        self.competency_names: List[str] = [competency_names[cid] for cid in sorted(competency_names)]
+
+    def get_option(self, scenario_id: int, option_letter: str) -> Optional[OptionEntry]:
+        return self.options.get((scenario_id, option_letter))
+
+
+class ScenarioIndexCache(SnapshotCache[ScenarioIndex]):
+    """Holds the current ScenarioIndex and rebuilds it in the background when scenario data changes."""
+
+    name = "scenario-index"
+
+    def build(self, db: Session, version: int) -> ScenarioIndex:
+        started = time.perf_counter()
+        rows = db.query(
+            models.Competency.competencyid,
+            models.Competency.name,
+            models.Scenario.scenarioid,
+            models.ScenarioOption.scenariooptionid,
+            models.ScenarioOption.score
+        ).outerjoin(
+            models.Scenario, models.Scenario.competencyid == models.Competency.competencyid
+        ).outerjoin(
+            models.ScenarioOption, models.ScenarioOption.scenarioid == models.Scenario.scenarioid
+        ).order_by(
+            models.Scenario.scenarioid, models.ScenarioOption.scenariooptionid
+        ).all()
+        index = ScenarioIndex(version, rows)
+
+        elapsed = time.perf_counter() - started
+        index_builds_total.inc()
+        index_build_seconds.observe(elapsed)
+        logger.info(f"Scenario index v{index.version} built: {len(index.options)} options, "
+                    f"{len(index.option_ids_by_scenario)} scenarios ({elapsed * 1000:.1f}ms)")
+        return index
+
+
+# Process-wide scenario index
+scenario_index = ScenarioIndexCache(ttl_seconds=settings.SCENARIO_INDEX_TTL_SECONDS)
+track_model_changes(TRACKED_MODELS, scenario_index.invalidate)
@@ -4,10 +4,10 @@ Converts user responses to competency scores for ML model
 """
 
 import logging
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from typing import List, Dict
-from .. import models
 from ..api import schemas
+from .scenario_index import scenario_index
 
 logger = logging.getLogger(__name__)
 
@@ -32,28 +32,10 @@ def transform_responses_to_scores(db: Session, responses: List[schemas.ResponseI
     for i, resp in enumerate(responses, 1):
         logger.debug(f"  {i}. Scenario {resp.scenario_id} -> Option '{resp.option_letter}'")
     
-    # Get all scenario options with their scores and competency information
-    all_options = db.query(models.ScenarioOption).options(
-        joinedload(models.ScenarioOption.scenario).joinedload(models.Scenario.competency)
-    ).all()
-    
-    logger.debug(f"Found {len(all_options)} scenario options in database")
-    
-    # Create a mapping from (scenario_id, option_letter) to (competency_name, score)
-    score_map = {}
-    for opt in all_options:
-        # Generate letter for this option based on its position
-        scenario_options = db.query(models.ScenarioOption).filter(
-            models.ScenarioOption.scenarioid == opt.scenarioid
-        ).order_by(models.ScenarioOption.scenariooptionid).all()
-        
-        option_index = scenario_options.index(opt)
-        letter = chr(65 + option_index)  # A=65, B=66, C=67, D=68
-        
-        key = (opt.scenarioid, letter)
-        score_map[key] = (opt.scenario.competency.name, opt.score)
-    
-    logger.debug(f"Created score map with {len(score_map)} entries")
+    # (scenario_id, option_letter) -> (competency_name, score) lookups come from the
+    # process-wide snapshot, rebuilt only when scenario data changes
+    index = scenario_index.get(db)
+    logger.debug(f"Using scenario index v{index.version} with {len(index.options)} entries")
     
     # Calculate competency scores based on user responses
     competency_scores = {}
@@ -61,10 +43,10 @@ def transform_responses_to_scores(db: Session, responses: List[schemas.ResponseI
     
     logger.debug("Processing user responses:")
     for response in responses:
-        key = (response.scenario_id, response.option_letter)
+        option = index.get_option(response.scenario_id, response.option_letter)
         
-        if key in score_map:
-            competency_name, score = score_map[key]
+        if option is not None:
+            competency_name, score = option.competency_name, option.score
             competency_scores[competency_name] = competency_scores.get(competency_name, 0) + score
             competency_counts[competency_name] = competency_counts.get(competency_name, 0) + 1
             logger.debug(f"  ✓ Scenario {response.scenario_id} option '{response.option_letter}' -> {competency_name} = {score}")
@@ -83,8 +65,7 @@ def transform_responses_to_scores(db: Session, responses: List[schemas.ResponseI
         logger.debug(f"  - {comp_name}: {score}")
     
     # Get actual competency names from database (dynamic approach)
-    db_competencies = db.query(models.Competency.name).distinct().all()
-    db_competency_names = [comp[0] for comp in db_competencies]
+    db_competency_names = list(dict.fromkeys(index.competency_names))
     logger.debug(f"All competencies in database: {db_competency_names}")
     
     missing_competencies = [comp for comp in db_competency_names if comp not in final_scores]
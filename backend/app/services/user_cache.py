@@ -0,0 +1,91 @@
+"""
+Yetria Career Guidance Platform - User Cache
+
+Most authenticated routes only need the identity in the access token
+(dependencies.get_current_claims). This module caches the full User row
+for the routes that do need it (GET /users/me), keyed by userid.
+
+Cached users are detached copies holding the column values only: callers
+may read them but must not modify them or add them to a session.
+
+Entries are dropped when that user is updated or deleted (update_user,
+delete_user, password rehash; bulk statements clear everything; see
+core.cache for the invalidation contract; USER_CACHE_TTL_SECONDS).
+"""
+import threading
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..core.cache import LRUCache, track_model_changes
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..crud.user_crud import get_user_by_id
+
+user_cache_hits_total = metrics.counter("user_cache_hits_total", "Users served from the user cache")
+user_cache_misses_total = metrics.counter("user_cache_misses_total", "Users loaded from the database")
+
+
+def _detached_copy(user: models.User) -> models.User:
+    return models.User(**{attr.key: getattr(user, attr.key) for attr in inspect(models.User).column_attrs})
+
+
+class UserCache:
+    """userid -> detached User copy, invalidated when that user changes."""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 0):
+        """
+        Args:
+            max_size: Users kept (0 disables caching)
+            ttl_seconds: Entry lifetime (0 = until invalidated)
+        """
+        self._users = LRUCache(max_size, ttl_seconds)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """Drops one user, or every user when user_id is None; loads that started earlier are not stored."""
+        with self._lock:
+            self._version += 1
+            if user_id is None:
+                self._users.clear()
+            else:
+                self._users.pop(user_id)
+
+    def get(self, db: Session, user_id: int) -> Optional[models.User]:
+        user = self._users.get(user_id)
+        if user is not None:
+            user_cache_hits_total.inc()
+            return user
+
+        user_cache_misses_total.inc()
+        version = self._version
+        db_user = get_user_by_id(db, user_id)
+        if db_user is None:
+            return None
+        user = _detached_copy(db_user)
+        with self._lock:
+            if version == self._version:
+                self._users.set(user_id, user)
+        return user
+
+
+# Process-wide user cache
+user_cache = UserCache(max_size=settings.USER_CACHE_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+
+
+def _invalidate_changed_users(user_ids: Optional[set]) -> None:
+    if user_ids is None:
+        user_cache.invalidate()
+    else:
+        for user_id in user_ids:
+            user_cache.invalidate(user_id)
+
+
+# New users are not cached yet
+track_model_changes(
+    [models.User], _invalidate_changed_users,
+    where=lambda user, state: state != "new", key=lambda user: user.userid
+)
@@ -0,0 +1,3 @@
+"""
+Benchmark Scripts Package - Performance Measurements for Services and Endpoints
+"""
\ No newline at end of file
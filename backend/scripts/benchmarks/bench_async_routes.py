@@ -0,0 +1,189 @@
+"""
+YETRIA - Hot Route Concurrency Benchmark
+
+Starts the API with uvicorn on a temporary SQLite database seeded with
+scenarios, courses, occupations and mentors plus benchmark users who have
+answered every scenario, then drives the hot routes from C concurrent
+clients for each concurrency level:
+
+- GET  /api/v1/scenarios
+- GET  /api/v1/responses/result
+- GET  /api/v1/mentors/recommend
+- POST /api/v1/courses/recommendations
+
+and reports requests per second with p50/p99 latency per level (errors
+count non-200 replies and dropped connections). Run it on
+a tree from before the async routes to compare with sync handlers capped
+by Starlette's threadpool (40 threads).
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_async_routes.py [seconds_per_level] [port]
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_async_routes.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+CONCURRENCY_LEVELS = (1, 16, 64, 256)
+N_USERS = 32
+N_SCENARIOS = 16
+N_COURSES = 500
+N_MENTORS = 60
+COMPETENCIES = ["Analitik Düşünme", "Duygusal Dayanıklılık", "Empati", "Hızlı ve Soğukkanlı Karar Alma",
+                "Sayısal Zeka", "Stres Yönetimi", "Takım Çalışması", "Teknoloji Adaptasyonu"]
+OCCUPATIONS = ["Bilgisayar Mühendisi", "Doktor"]
+COURSE_TOPICS = ["takım çalışması", "stres yönetimi", "analitik düşünme", "problem çözme", "empati"]
+PASSWORD = "benchmark-password"
+STARTUP_TIMEOUT_SECONDS = 120
+
+
+def seed(database_url):
+    """Creates the tables and seeds the catalogue data and N_USERS users (one shared password hash)."""
+    os.environ["DATABASE_URL"] = database_url
+    from app import models
+    from app.core.database import SessionLocal, engine
+    from app.core.security import get_password_hash
+
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        for cid, name in enumerate(COMPETENCIES, 1):
+            db.add(models.Competency(competencyid=cid, name=name))
+        option_id = 1
+        for sid in range(1, N_SCENARIOS + 1):
+            db.add(models.Scenario(scenarioid=sid, title=f"Scenario {sid}", description="Benchmark scenario",
+                                   competencyid=(sid - 1) % len(COMPETENCIES) + 1))
+            for k in range(4):
+                db.add(models.ScenarioOption(scenariooptionid=option_id, scenarioid=sid,
+                                             optiontext=f"Option {k}", score=float(k + 2)))
+                option_id += 1
+        for oid, title in enumerate(OCCUPATIONS, 1):
+            db.add(models.Occupation(occupationid=oid, title=title))
+            for cid in range(1, len(COMPETENCIES) + 1):
+                db.add(models.OccupationProfile(occupationid=oid, competencyid=cid, idealscore=3.0 + (cid % 3) * 0.5))
+        passwordhash = get_password_hash(PASSWORD)
+        for i in range(1, N_MENTORS + 1):
+            db.add(models.User(userid=10_000 + i, name=f"Mentor {i}", email=f"mentor{i}@example.com",
+                               passwordhash=passwordhash, usertypeid=2))
+            db.add(models.MentorProfile(mentorprofileid=i, userid=10_000 + i, occupationid=i % len(OCCUPATIONS) + 1,
+                                        company="Company", title="Mentor"))
+        for i in range(1, N_COURSES + 1):
+            db.add(models.Course(courseid=i, title=f"Course {i} {COURSE_TOPICS[i % len(COURSE_TOPICS)]}",
+                                 description=None, courseurl="https://example.com"))
+        for i in range(N_USERS):
+            db.add(models.User(name=f"User {i}", email=f"bench{i}@example.com", passwordhash=passwordhash, usertypeid=1))
+        db.commit()
+    finally:
+        db.close()
+
+
+def wait_until_ready(base_url, server):
+    started = time.perf_counter()
+    while time.perf_counter() - started < STARTUP_TIMEOUT_SECONDS:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/ready", timeout=1).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise TimeoutError("Server did not become ready")
+
+
+def prepare_users(base_url):
+    """Logs every benchmark user in and submits answers to all scenarios; returns their auth headers."""
+    headers = []
+    answers = [{"scenario_id": sid, "option_letter": "ABCD"[sid % 4]} for sid in range(1, N_SCENARIOS + 1)]
+    with httpx.Client(timeout=60) as client:
+        for i in range(N_USERS):
+            token = client.post(f"{base_url}/auth/login",
+                                json={"email": f"bench{i}@example.com", "password": PASSWORD}).json()["access_token"]
+            user_headers = {"Authorization": f"Bearer {token}"}
+            client.post(f"{base_url}/responses", json=answers, headers=user_headers).raise_for_status()
+            headers.append(user_headers)
+    return headers
+
+
+def hot_requests(base_url, headers):
+    return [
+        ("GET", f"{base_url}/scenarios", None),
+        ("GET", f"{base_url}/responses/result", None),
+        ("GET", f"{base_url}/mentors/recommend?occupation_title={OCCUPATIONS[0]}&limit=10", None),
+        ("POST", f"{base_url}/courses/recommendations", {"competency_keywords": ["teamwork", "empathy"], "limit": 7}),
+    ]
+
+
+async def run_level(base_url, all_headers, concurrency, seconds):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + seconds
+    requests = hot_requests(base_url, all_headers)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+        async def worker(n):
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                method, url, body = requests[n % len(requests)]
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, json=body, headers=all_headers[n % len(all_headers)])
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.TransportError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+                n += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, statistics.median(latencies), p99, errors
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8767
+    base_url = f"http://127.0.0.1:{port}/api/v1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench_routes.db"
+        seed(database_url)
+        env = {**os.environ, "DATABASE_URL": database_url}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=backend_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_until_ready(base_url, server)
+            headers = prepare_users(base_url)
+
+            print("=" * 72)
+            print(f"Hot routes under concurrency ({seconds:.0f}s per level, {os.cpu_count()} CPU(s))")
+            print("=" * 72)
+            print(f"  {'clients':>7}  {'req/s':>8}  {'p50 ms':>8}  {'p99 ms':>8}  {'errors':>6}")
+            for concurrency in CONCURRENCY_LEVELS:
+                rps, p50, p99, errors = asyncio.run(run_level(base_url, headers, concurrency, seconds))
+                print(f"  {concurrency:>7}  {rps:8.0f}  {p50 * 1000:8.1f}  {p99 * 1000:8.1f}  {errors:>6}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+YETRIA - Auth Dependency Benchmark
+
+Measures the per-request cost of identifying the caller
+(dependencies.get_current_claims on a bearer token):
+- with the verified-token cache (every request after the first in a session)
+- without it (jwt.decode: HMAC check plus JSON parsing, and the shared
+  revocation lookup, on every request)
+- for a revoked token (logout)
+
+Tokens carry the user claims; the database (a temporary SQLite file) is
+only read for the revocation lookup on cache misses.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_auth_dependency.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_auth_dependency.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+# Point the app at a temporary database before its engine is created
+temp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'bench_auth.db')}"
+
+from fastapi import HTTPException
+
+from app import models
+from app.api.dependencies import get_current_claims
+from app.core import security
+from app.core.database import SessionLocal, engine
+from app.crud.revoked_token_crud import revoke_access_token
+
+N_SESSIONS = 1000
+
+
+def per_call_us(tokens, iterations):
+    started = time.perf_counter()
+    for i in range(iterations):
+        get_current_claims(tokens[i % len(tokens)])
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    models.RevokedToken.__table__.create(bind=engine, checkfirst=True)
+
+    tokens = [
+        security.create_access_token(
+            security.user_token_claims(SimpleNamespace(email=f"user{i}@example.com", userid=i, name=f"User {i}", usertypeid=1)),
+            expires_delta=timedelta(minutes=30)
+        )
+        for i in range(N_SESSIONS)
+    ]
+
+    cached_cache = security.token_cache
+    security.token_cache = security.TokenCache(0)
+    uncached = per_call_us(tokens, iterations)
+
+    security.token_cache = cached_cache
+    per_call_us(tokens, N_SESSIONS)  # first request of each session
+    cached = per_call_us(tokens, iterations)
+
+    db = SessionLocal()
+    try:
+        revoke_access_token(db, tokens[0])
+    finally:
+        db.close()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        try:
+            get_current_claims(tokens[0])
+        except HTTPException:
+            pass
+    revoked = (time.perf_counter() - started) / iterations * 1e6
+
+    print("=" * 72)
+    print(f"get_current_claims per request ({N_SESSIONS} active tokens, {iterations} calls)")
+    print("=" * 72)
+    print(f"  jwt.decode + revocation read {uncached:8.1f} us")
+    print(f"  verified-token cache         {cached:8.1f} us   ({uncached / cached:.1f}x faster)")
+    print(f"  revoked token (rejected)     {revoked:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
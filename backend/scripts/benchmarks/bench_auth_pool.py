@@ -0,0 +1,178 @@
+"""
+YETRIA - Auth Pool Load Benchmark
+
+Starts the API with uvicorn on a temporary SQLite database seeded with
+scenarios and benchmark users, then hammers POST /api/v1/auth/login from
+many concurrent clients (backing off for Retry-After on 429) while a probe requests GET /api/v1/scenarios
+every PROBE_INTERVAL seconds. Reports:
+- login throughput and status codes (429 = refused by the auth pool)
+- /scenarios latency when idle and while the login load runs
+
+Password hashing runs on the bounded auth pool (AUTH_HASH_WORKERS,
+AUTH_HASH_MAX_PENDING), so logins beyond its capacity are refused quickly
+and unrelated routes keep their latency. Run the script on a tree from
+before the auth pool to see sync bcrypt handlers filling Starlette's
+threadpool instead.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_auth_pool.py [clients] [seconds] [port]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_auth_pool.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+N_USERS = 200
+N_SCENARIOS = 16
+PASSWORD = "benchmark-password"
+PROBE_INTERVAL = 0.05
+STARTUP_TIMEOUT_SECONDS = 60
+
+
+def seed(database_url):
+    """Creates the tables and seeds competencies, scenarios and N_USERS users sharing one password hash."""
+    os.environ["DATABASE_URL"] = database_url
+    from app import models
+    from app.core.database import SessionLocal, engine
+    from app.core.security import get_password_hash
+
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        for cid in range(1, 9):
+            db.add(models.Competency(competencyid=cid, name=f"Competency {cid}"))
+        option_id = 1
+        for sid in range(1, N_SCENARIOS + 1):
+            db.add(models.Scenario(scenarioid=sid, title=f"Scenario {sid}", description="Benchmark scenario",
+                                   competencyid=(sid - 1) % 8 + 1))
+            for k in range(4):
+                db.add(models.ScenarioOption(scenariooptionid=option_id, scenarioid=sid,
+                                             optiontext=f"Option {k}", score=float(k + 2)))
+                option_id += 1
+        passwordhash = get_password_hash(PASSWORD)
+        for i in range(N_USERS):
+            db.add(models.User(name=f"User {i}", email=f"bench{i}@example.com", passwordhash=passwordhash, usertypeid=1))
+        db.commit()
+    finally:
+        db.close()
+
+
+def wait_until_up(base_url, server):
+    started = time.perf_counter()
+    while time.perf_counter() - started < STARTUP_TIMEOUT_SECONDS:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError("Server did not start")
+
+
+def probe(base_url, token, stop, latencies):
+    """Requests /scenarios every PROBE_INTERVAL until stop is set, appending latencies in seconds."""
+    headers = {"Authorization": f"Bearer {token}"}
+    with httpx.Client(timeout=60) as client:
+        while not stop.is_set():
+            started = time.perf_counter()
+            response = client.get(f"{base_url}/scenarios", headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+            time.sleep(PROBE_INTERVAL)
+
+
+def login_client(base_url, index, stop, statuses, lock):
+    with httpx.Client(timeout=60) as client:
+        n = index
+        while not stop.is_set():
+            response = client.post(f"{base_url}/auth/login",
+                                   json={"email": f"bench{n % N_USERS}@example.com", "password": PASSWORD})
+            with lock:
+                statuses[response.status_code] += 1
+            n += 1
+            if response.status_code == 429:
+                # Well-behaved clients back off as asked
+                time.sleep(float(response.headers.get("Retry-After", "1")))
+
+
+def run_probe(base_url, token, seconds):
+    stop, latencies = threading.Event(), []
+    thread = threading.Thread(target=probe, args=(base_url, token, stop, latencies))
+    thread.start()
+    time.sleep(seconds)
+    stop.set()
+    thread.join()
+    return latencies
+
+
+def run_load(base_url, token, clients, seconds):
+    stop, latencies, statuses, lock = threading.Event(), [], Counter(), threading.Lock()
+    threads = [threading.Thread(target=login_client, args=(base_url, i, stop, statuses, lock)) for i in range(clients)]
+    threads.append(threading.Thread(target=probe, args=(base_url, token, stop, latencies)))
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, statuses, time.perf_counter() - started
+
+
+def describe(latencies):
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"n={len(ordered):4d}  p50 {statistics.median(ordered) * 1000:7.1f} ms  "
+            f"p95 {p95 * 1000:7.1f} ms  max {ordered[-1] * 1000:7.1f} ms")
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else 8766
+    base_url = f"http://127.0.0.1:{port}/api/v1"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench_auth.db"
+        seed(database_url)
+        env = {**os.environ, "DATABASE_URL": database_url}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+            cwd=backend_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            wait_until_up(base_url, server)
+            token = httpx.post(f"{base_url}/auth/login", timeout=30,
+                               json={"email": "bench0@example.com", "password": PASSWORD}).json()["access_token"]
+
+            print("=" * 72)
+            print(f"Auth pool load benchmark: {clients} login clients for {seconds:.0f}s, "
+                  f"{os.cpu_count()} CPU(s)")
+            print("=" * 72)
+            print(f"  /scenarios idle          {describe(run_probe(base_url, token, 3.0))}")
+            latencies, statuses, elapsed = run_load(base_url, token, clients, seconds)
+            print(f"  /scenarios under load    {describe(latencies)}")
+            print(f"\n  logins accepted          {statuses[200] / elapsed:7.1f} /s")
+            print(f"  responses by status      {dict(sorted(statuses.items()))}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+YETRIA - Batch Prediction Benchmark
+
+Compares the per-user prediction path with the batched prediction path
+and with a raw LightGBM predict_proba call on the same matrix.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_batch_prediction.py [n_users]
+"""
+
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_batch_prediction.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.services.prediction_service import PredictionService
+
+
+def load_cohort(service, n_users):
+    """Builds n_users score dicts from the training data."""
+    df = pd.read_csv(backend_path / "data" / "model_training_data.csv")
+    df = pd.concat([df] * (n_users // len(df) + 1), ignore_index=True).head(n_users)
+    return [{feature: float(row[feature]) for feature in service.feature_names} for _, row in df.iterrows()]
+
+
+def timed(func):
+    """Returns elapsed seconds for a single call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    service = PredictionService()
+    cohort = load_cohort(service, n_users)
+    matrix = service.scaler.transform(pd.DataFrame(cohort)[service.feature_names].to_numpy())
+
+    single = timed(lambda: [service.predict_and_analyze(scores) for scores in cohort])
+    batch = timed(lambda: service.predict_and_analyze_batch(cohort))
+    raw = timed(lambda: service.model.predict_proba(matrix))
+
+    print("=" * 60)
+    print(f"Batch prediction benchmark ({n_users} users)")
+    print("=" * 60)
+    for name, elapsed in (("predict_and_analyze loop", single),
+                          ("predict_and_analyze_batch", batch),
+                          ("raw predict_proba", raw)):
+        print(f"{name:<28} {elapsed * 1000:10.1f} ms  {n_users / elapsed:12.0f} users/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+YETRIA - Cold Start Benchmark
+
+Starts the API with uvicorn in a fresh process and measures, from process
+start:
+- time to the first 200 from /api/v1/health (liveness)
+- time to the first 200 from /api/v1/ready (model loaded and warmed up,
+  i.e. the first prediction has run)
+- optionally, time to the first real /api/v1/responses/result for a user
+  that already has saved responses (pass their bearer token)
+
+For comparison it also times the old eager path in a separate process:
+importing the app and loading the model before anything can be served.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_cold_start.py [port] [bearer_token]
+"""
+
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_cold_start.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+TIMEOUT_SECONDS = 120
+
+
+def get_status(url, token=None):
+    """Returns the HTTP status of a GET, or None if the server is not accepting connections yet."""
+    request = urllib.request.Request(url)
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError):
+        return None
+
+
+def wait_for(url, started, server, token=None):
+    """Polls url until it answers 200 and returns seconds since started."""
+    while time.perf_counter() - started < TIMEOUT_SECONDS:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        if get_status(url, token) == 200:
+            return time.perf_counter() - started
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} did not become available within {TIMEOUT_SECONDS}s")
+
+
+def measure_server(port, token=None):
+    base_url = f"http://127.0.0.1:{port}/api/v1"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=backend_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        timings = {
+            "first health": wait_for(f"{base_url}/health", started, server),
+            "ready (warm-up prediction done)": wait_for(f"{base_url}/ready", started, server),
+        }
+        if token:
+            timings["first /responses/result"] = wait_for(f"{base_url}/responses/result", started, server, token)
+        return timings
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def measure_eager_import():
+    """Seconds to import the app and load the model in one step, as the app did at import time before."""
+    code = (
+        "import time, warnings; warnings.filterwarnings('ignore'); t = time.perf_counter(); "
+        "import app.main; from app.services.model_manager import model_manager; model_manager.load(); "
+        "print(time.perf_counter() - t)"
+    )
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=backend_path, capture_output=True, text=True, env=os.environ, check=True
+    ).stdout
+    return time.perf_counter() - started, float(output.strip().splitlines()[-1])
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    token = sys.argv[2] if len(sys.argv) > 2 else None
+
+    print("=" * 72)
+    print("Cold start benchmark")
+    print("=" * 72)
+    for label, seconds in measure_server(port, token).items():
+        print(f"  {label:<34} {seconds * 1000:8.0f} ms")
+
+    total, in_process = measure_eager_import()
+    print("\nEager import + model load (previous startup path)")
+    print(f"  {'process start -> model loaded':<34} {total * 1000:8.0f} ms")
+    print(f"  {'of which import + load':<34} {in_process * 1000:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
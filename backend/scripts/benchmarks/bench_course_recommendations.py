@@ -0,0 +1,124 @@
+"""
+YETRIA - Course Recommendation Benchmark
+
+Compares the previous full-scan implementation of
+get_courses_by_competency_keywords (load every Course, lowercase title and
+description, substring checks per request) with the inverted course index
+(posting-list merge + heap top-k) on a synthetic catalogue in a temporary
+SQLite database. Checks that both return the same courses in the same
+order for a set of competency combinations and exits with code 1 when
+they differ. This is a benchmark run by hand, not a regression test; no
+test suite runs it.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_course_recommendations.py [n_courses] [requests]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_course_recommendations.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.crud.course_crud import get_courses_by_competency_keywords
+from app.services.course_index import COMPETENCY_COURSE_KEYWORDS, course_index
+
+FILLER = ["giriş", "ileri", "temelleri", "uygulamalı", "kariyer", "liderlik", "iletişim", "yazılım", "veri",
+          "tasarım", "finans", "pazarlama", "introduction", "advanced", "workshop", "bootcamp", "masterclass"]
+KEYWORDS = [keyword for words in COMPETENCY_COURSE_KEYWORDS.values() for keyword in words]
+LIMIT = 7
+
+
+def legacy_get_courses_by_competency_keywords(db, competency_keywords, limit=7):
+    """Previous implementation: full scan with substring checks per request."""
+    if not competency_keywords:
+        return []
+    course_scores = {}
+    for course in db.query(models.Course).all():
+        score = 0
+        course_text = f"{course.title} {course.description or ''}".lower()
+        for competency in competency_keywords:
+            for keyword in COMPETENCY_COURSE_KEYWORDS.get(competency, []):
+                if keyword.lower() in course_text:
+                    score += 1
+        if score > 0:
+            course_scores[course.courseid] = {'course': course, 'score': score}
+    sorted_courses = sorted(course_scores.values(), key=lambda x: x['score'], reverse=True)
+    return [item['course'] for item in sorted_courses[:limit]]
+
+
+def seed(engine, n_courses, rng):
+    def text(n_words):
+        words = [rng.choice(FILLER) for _ in range(n_words)]
+        if rng.random() < 0.3:
+            # Keywords sometimes appear inflected ("yönetimi"), which substring matching must catch
+            words.insert(rng.randrange(len(words) + 1), rng.choice(KEYWORDS) + rng.choice(["", "", "i", "si"]))
+        return " ".join(words).capitalize()
+
+    rows = [
+        {"courseid": i, "title": text(4), "description": text(12) if rng.random() < 0.8 else None,
+         "courseurl": f"https://example.com/course/{i}"}
+        for i in range(1, n_courses + 1)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(models.Course), rows)
+
+
+def run(fn, Session, request_sets):
+    db = Session()
+    try:
+        start = time.perf_counter()
+        results = [[course.courseid for course in fn(db, competencies, LIMIT)] for competencies in request_sets]
+        return time.perf_counter() - start, results
+    finally:
+        db.close()
+
+
+def main():
+    n_courses = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(42)
+
+    temp_dir = tempfile.mkdtemp()
+    engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'courses.db')}")
+    models.Base.metadata.create_all(bind=engine, tables=[models.Course.__table__])
+    Session = sessionmaker(bind=engine, autoflush=False)
+    seed(engine, n_courses, rng)
+
+    competencies = list(COMPETENCY_COURSE_KEYWORDS)
+    request_sets = [rng.sample(competencies, rng.randint(1, 3)) for _ in range(n_requests)]
+
+    db = Session()
+    build_start = time.perf_counter()
+    course_index.rebuild(db)
+    build_time = time.perf_counter() - build_start
+    db.close()
+
+    legacy_time, expected = run(legacy_get_courses_by_competency_keywords, Session, request_sets)
+    index_time, results = run(get_courses_by_competency_keywords, Session, request_sets)
+
+    print("=" * 72)
+    print(f"Course recommendations: {n_courses} courses, {n_requests} requests (top {LIMIT})")
+    print("=" * 72)
+    print(f"  index build (once):  {build_time * 1000:9.1f} ms")
+    print(f"  full scan:           {legacy_time / n_requests * 1000:9.2f} ms/request")
+    print(f"  inverted index:      {index_time / n_requests * 1000:9.2f} ms/request")
+    print(f"  speedup: {legacy_time / index_time:.0f}x, identical results: {results == expected}")
+    engine.dispose()
+    if results != expected:
+        print("❌ the inverted index and the full scan return different courses")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+YETRIA - Feature Mapping Micro-Benchmark
+
+Measures the per-request cost of mapping an incoming score dict onto the
+model's feature order: the previous per-feature key rescan (done once for
+validation and again for the comparison) against the precompiled
+feature index that fills a preallocated float64 row.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_feature_mapping.py [iterations]
+"""
+
+import logging
+import sys
+import timeit
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_feature_mapping.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.services.prediction_service import PredictionService
+
+logger = logging.getLogger(__name__)
+
+
+def legacy_lookup(feature_names, user_scores):
+    """Previous behaviour: rescan every key with strip().lower() on each miss."""
+    logger.debug("_validate_input called")
+    logger.debug(f"User scores keys: {list(user_scores.keys())}")
+    logger.debug(f"Expected features: {feature_names}")
+    ordered_scores = []
+    for feature in feature_names:
+        score = user_scores.get(feature)
+        if score is None:
+            feature_clean = feature.strip().lower()
+            for user_key, user_val in user_scores.items():
+                if str(user_key).strip().lower() == feature_clean:
+                    score = user_val
+                    break
+        ordered_scores.append(0.5 if score is None else score)
+    logger.debug(f"Ordered scores: {ordered_scores}")
+    return ordered_scores
+
+
+def legacy_mapping(feature_names, user_scores):
+    """Validation pass plus the second lookup pass of the comparison loop."""
+    row = np.array(legacy_lookup(feature_names, user_scores)).reshape(1, -1)
+    legacy_lookup(feature_names, user_scores)
+    return row
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    service = PredictionService()
+    features = service.feature_names
+    exact_keys = {feature: 3.5 for feature in features}
+    messy_keys = {f"  {feature.lower()} ": 3.5 for feature in features}
+    row = np.empty(len(features), dtype=np.float64)
+
+    print("=" * 60)
+    print(f"Feature mapping micro-benchmark ({iterations} iterations)")
+    print("=" * 60)
+    for label, user_scores in (("exact keys", exact_keys), ("messy keys", messy_keys)):
+        before = timeit.timeit(lambda: legacy_mapping(features, user_scores), number=iterations)
+        after = timeit.timeit(lambda: service._fill_row(user_scores, row), number=iterations)
+        print(f"{label:<12} before {before / iterations * 1e6:7.2f} us   "
+              f"after {after / iterations * 1e6:7.2f} us   ({before / after:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
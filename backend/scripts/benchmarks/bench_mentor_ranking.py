@@ -0,0 +1,86 @@
+"""
+YETRIA - Mentor Ranking Benchmark
+
+Builds a synthetic MentorRanker (occupations x competencies ideal-score
+matrix, mentors with partial self-assessments) and times scoring one
+student against every mentor in one vectorized pass,
+plus ranking one occupation's mentor list. Scores are checked against a
+plain per-mentor Python loop.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_mentor_ranking.py [n_mentors] [n_occupations]
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_mentor_ranking.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.services.mentor_ranking import MentorRanker, SCORE_RANGE
+
+N_COMPETENCIES = 8
+BUDGET_MS = 1.0
+
+
+def build_ranker(n_mentors, n_occupations, rng):
+    ideal = rng.uniform(2.5, 5.0, size=(n_occupations, N_COMPETENCIES))
+    ideal[rng.random(ideal.shape) < 0.1] = np.nan  # some ideal scores unset
+    occupation_of = rng.integers(0, n_occupations, size=n_mentors)
+    mentor_scores = ideal[occupation_of].copy()
+    assessed = rng.random(mentor_scores.shape) < 0.3  # mentors' own answers override
+    mentor_scores[assessed] = rng.uniform(1.0, 5.0, size=assessed.sum())
+    ranker = MentorRanker(list(range(1, N_COMPETENCIES + 1)), list(range(1, n_occupations + 1)), ideal,
+                          list(range(1, n_mentors + 1)), mentor_scores)
+    return ranker, occupation_of
+
+
+def reference_score(profile, student):
+    pairs = [(p, s) for p, s in zip(profile, student) if not (math.isnan(p) or math.isnan(s))]
+    if not pairs:
+        return float("nan")
+    rms = math.sqrt(sum((p - s) ** 2 for p, s in pairs) / len(pairs))
+    return min(100.0, max(0.0, 100.0 * (1.0 - rms / SCORE_RANGE)))
+
+
+def timed(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    n_mentors = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_occupations = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rng = np.random.default_rng(42)
+    ranker, occupation_of = build_ranker(n_mentors, n_occupations, rng)
+    student = ranker.student_vector({cid: float(rng.uniform(1, 5)) for cid in range(1, N_COMPETENCIES + 1)})
+
+    mentor_ms, mentor_scores = timed(lambda: ranker.score_mentors(student), 200)
+    mentors = [{"mentorprofileid": mid} for mid, occ in zip(ranker.mentor_ids, occupation_of) if occ == 0]
+    rank_ms, ranked = timed(lambda: ranker.rank(mentors, student), 200)
+
+    expected = np.array([reference_score(profile, student) for profile in ranker.mentor_scores])
+    max_diff = float(np.nanmax(np.abs(expected - mentor_scores)))
+    ordered = all(a["matchscore"] >= b["matchscore"] for a, b in zip(ranked, ranked[1:]))
+
+    print("=" * 72)
+    print(f"Mentor ranking: {n_mentors} mentors, {n_occupations} occupations x {N_COMPETENCIES} competencies")
+    print("=" * 72)
+    print(f"  score all mentors:      {mentor_ms:7.3f} ms")
+    print(f"  rank one occupation:    {rank_ms:7.3f} ms ({len(mentors)} mentors)")
+    print(f"  max diff vs loop:       {max_diff:.2e}, ranked in order: {ordered}")
+    within = mentor_ms < BUDGET_MS
+    print(f"\n  {'✓' if within else '❌'} full candidate set scored within {BUDGET_MS:.0f} ms budget: {within}")
+
+
+if __name__ == "__main__":
+    main()
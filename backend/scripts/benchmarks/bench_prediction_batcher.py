@@ -0,0 +1,76 @@
+"""
+YETRIA - Prediction Batcher Benchmark
+
+Simulates concurrent /responses predictions and compares one model call per
+request (threadpool, as sync routes do) with the PredictionBatcher.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_prediction_batcher.py [concurrency] [requests_per_client]
+"""
+
+import asyncio
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import anyio
+import numpy as np
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_prediction_batcher.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.services.prediction_service import PredictionService
+from app.services.prediction_batcher import PredictionBatcher
+
+
+async def run_clients(predict, payloads, concurrency, requests_per_client):
+    """Runs concurrent clients and returns (elapsed seconds, per-request latencies)."""
+    latencies = []
+
+    async def client(client_index):
+        for request_index in range(requests_per_client):
+            payload = payloads[(client_index * requests_per_client + request_index) % len(payloads)]
+            start = time.perf_counter()
+            await predict(payload)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    return time.perf_counter() - start, np.array(latencies)
+
+
+def report(name, elapsed, latencies):
+    """Prints throughput and latency percentiles."""
+    p50, p99 = np.percentile(latencies * 1000, [50, 99])
+    print(f"{name:<12} {len(latencies) / elapsed:10.0f} req/s   p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    requests_per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    service = PredictionService()
+    rng = np.random.default_rng(42)
+    payloads = [
+        {feature: round(float(value), 1) for feature, value in zip(service.feature_names, row)}
+        for row in rng.uniform(1, 5, size=(1000, len(service.feature_names)))
+    ]
+    batcher = PredictionBatcher(service, window_ms=2, max_batch_size=64)
+
+    async def unbatched(payload):
+        return await anyio.to_thread.run_sync(service.predict_and_analyze, payload)
+
+    print("=" * 60)
+    print(f"Prediction batcher benchmark ({concurrency} clients x {requests_per_client} requests)")
+    print("=" * 60)
+    report("unbatched", *asyncio.run(run_clients(unbatched, payloads, concurrency, requests_per_client)))
+    report("batched", *asyncio.run(run_clients(batcher.predict_and_analyze, payloads, concurrency, requests_per_client)))
+    batcher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+YETRIA - Prediction Cache Benchmark
+
+Replays simulated prediction traffic through PredictionService with and
+without the probability cache, checks that every cached result equals the
+uncached one and reports the hit rate.
+
+Each simulated user submits once (competency averages of option scores
+rounded to 0.1, as submit_responses_and_predict computes them) and then
+fetches /responses/result a few more times (unrounded averages, as
+get_result_from_saved_responses computes them). Different users almost
+never share a vector, so hits come from the same user asking again.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_prediction_cache.py [n_users] [result_fetches_per_user]
+"""
+
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_prediction_cache.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.core.metrics import metrics
+from app.services.prediction_service import PredictionService
+
+
+ANSWERS_PER_COMPETENCY = 3
+
+
+def simulate_traffic(feature_names, n_users, result_fetches, seed=42):
+    """Returns (request stream, distinct vectors across users)."""
+    rng = np.random.default_rng(seed)
+    # Each simulated user leans towards a profile; answers scatter around it
+    profiles = rng.uniform(2.0, 4.5, size=(n_users, len(feature_names)))
+    noise = rng.normal(0, 0.8, size=profiles.shape + (ANSWERS_PER_COMPETENCY,))
+    averages = np.clip(np.rint(profiles[:, :, None] + noise), 1, 5).mean(axis=2)
+    results = [{name: float(value) for name, value in zip(feature_names, row)} for row in averages]
+    submissions = [{name: round(value, 1) for name, value in user.items()} for user in results]
+
+    requests = submissions + [user for user in results for _ in range(result_fetches)]
+    rng.shuffle(requests)
+    return requests, len({tuple(user.values()) for user in submissions + results})
+
+
+def run(service, submissions):
+    start = time.perf_counter()
+    results = [service.predict_and_analyze(user_scores) for user_scores in submissions]
+    return time.perf_counter() - start, results
+
+
+def main():
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    result_fetches = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    warnings.filterwarnings("ignore")
+
+    uncached = PredictionService()
+    cached = PredictionService(cache_size=4096)
+    requests, distinct = simulate_traffic(uncached.feature_names, n_users, result_fetches)
+
+    uncached_time, expected = run(uncached, requests)
+    cached_time, results = run(cached, requests)
+    hits = metrics.counter("prediction_cache_hits_total").value
+    misses = metrics.counter("prediction_cache_misses_total").value
+
+    print("=" * 72)
+    print(f"Prediction cache: {n_users} users ({distinct} distinct vectors), "
+          f"{len(requests)} predictions")
+    print("=" * 72)
+    print(f"  uncached: {uncached_time:6.2f}s ({uncached_time / len(requests) * 1e6:6.0f}us/prediction)")
+    print(f"  cached:   {cached_time:6.2f}s ({cached_time / len(requests) * 1e6:6.0f}us/prediction)")
+    print(f"  hit rate: {hits / (hits + misses):.1%} ({hits} hits, {misses} misses)")
+    print(f"  results identical: {results == expected}")
+
+
+if __name__ == "__main__":
+    main()
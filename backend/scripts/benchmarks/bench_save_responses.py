@@ -0,0 +1,184 @@
+"""
+YETRIA - save_user_responses Benchmark
+
+Compares the previous per-scenario implementation of save_user_responses
+(SELECT + DELETE per scenario, one ordered SELECT per letter, ORM add_all)
+with the set-based one (cached letter map, one DELETE, one multi-row
+INSERT ... ON CONFLICT DO NOTHING). Reports statements per call and
+latency for 4-scenario stage submissions and checks that both leave the
+same rows behind.
+
+By default it runs on a temporary SQLite file. Pass a SQLAlchemy URL to
+run on PostgreSQL; it creates the tables and seeds benchmark rows, so
+point it at an empty scratch database.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_save_responses.py [database_url] [submissions]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_save_responses.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.api import schemas
+from app.crud.response_crud import save_user_responses
+from app.services.scenario_index import scenario_index
+
+N_COMPETENCIES = 8
+SCENARIOS_PER_COMPETENCY = 2
+OPTIONS_PER_SCENARIO = 4
+STAGE_SIZE = 4
+
+
+def legacy_convert_option_letter(db, scenario_id, option_letter):
+    """Previous implementation: one ordered query per letter."""
+    options = db.query(models.ScenarioOption).filter(
+        models.ScenarioOption.scenarioid == scenario_id
+    ).order_by(models.ScenarioOption.scenariooptionid).all()
+    if not options:
+        raise ValueError(f"No options found for scenario {scenario_id}")
+    option_index = ord(option_letter.upper()) - ord('A')
+    if option_index < 0 or option_index >= len(options):
+        raise ValueError(f"Option letter {option_letter} out of range for scenario {scenario_id}")
+    return options[option_index].scenariooptionid
+
+
+def legacy_save_user_responses(db, responses, user_id):
+    """Previous implementation: SELECT + DELETE per scenario, then ORM inserts."""
+    try:
+        unique_responses = {response.scenario_id: response for response in responses}
+        for scenario_id in unique_responses.keys():
+            option_ids = [row[0] for row in db.query(models.ScenarioOption.scenariooptionid).
+                          filter(models.ScenarioOption.scenarioid == scenario_id).all()]
+            if option_ids:
+                db.query(models.UserResponse).filter(
+                    models.UserResponse.userid == user_id,
+                    models.UserResponse.scenariooptionid.in_(option_ids)
+                ).delete(synchronize_session=False)
+        db_responses = [
+            models.UserResponse(
+                userid=user_id,
+                scenariooptionid=legacy_convert_option_letter(db, response.scenario_id, response.option_letter)
+            )
+            for response in unique_responses.values()
+        ]
+        if db_responses:
+            db.add_all(db_responses)
+        db.commit()
+        return len(db_responses)
+    except Exception:
+        db.rollback()
+        raise
+
+
+def seed(Session):
+    """Creates competencies, scenarios with options and two users; returns (scenario ids, user ids)."""
+    db = Session()
+    try:
+        competencies = [models.Competency(name=f"Bench Competency {i}") for i in range(N_COMPETENCIES)]
+        db.add_all(competencies)
+        db.flush()
+        scenarios = [
+            models.Scenario(title=f"Bench {c.competencyid}-{j}", description="Benchmark scenario",
+                            competencyid=c.competencyid)
+            for c in competencies for j in range(SCENARIOS_PER_COMPETENCY)
+        ]
+        db.add_all(scenarios)
+        db.flush()
+        db.add_all([
+            models.ScenarioOption(scenarioid=s.scenarioid, optiontext=f"Option {k}", score=float(k + 1))
+            for s in scenarios for k in range(OPTIONS_PER_SCENARIO)
+        ])
+        suffix = f"{time.time_ns()}"
+        users = [models.User(name="Bench", email=f"bench-{name}-{suffix}@example.com", passwordhash="x",
+                             usertypeid=1) for name in ("legacy", "bulk")]
+        db.add_all(users)
+        db.commit()
+        return [s.scenarioid for s in scenarios], [u.userid for u in users]
+    finally:
+        db.close()
+
+
+def make_stages(scenario_ids, submissions, seed_value=7):
+    rng = random.Random(seed_value)
+    stages = []
+    for _ in range(submissions):
+        start = rng.randrange(0, len(scenario_ids) - STAGE_SIZE + 1, STAGE_SIZE)
+        stages.append([
+            schemas.ResponseIn(scenario_id=scenario_id, option_letter=rng.choice("ABCD"))
+            for scenario_id in scenario_ids[start:start + STAGE_SIZE]
+        ])
+    return stages
+
+
+def run(save, Session, stages, user_id, statement_counter):
+    db = Session()
+    try:
+        save(db, stages[0], user_id)  # warm-up (and scenario index build)
+        statement_counter[0] = 0
+        start = time.perf_counter()
+        for stage in stages:
+            save(db, stage, user_id)
+        elapsed = time.perf_counter() - start
+        statements = statement_counter[0]
+        answers = sorted(
+            option_id for (option_id,) in db.query(models.UserResponse.scenariooptionid)
+            .filter(models.UserResponse.userid == user_id).all()
+        )
+        return elapsed, statements, answers
+    finally:
+        db.close()
+
+
+def main():
+    temp_dir = None
+    if len(sys.argv) > 1 and "://" in sys.argv[1]:
+        database_url = sys.argv[1]
+        args = sys.argv[2:]
+    else:
+        temp_dir = tempfile.mkdtemp()
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+        args = sys.argv[1:]
+    submissions = int(args[0]) if args else 500
+
+    engine = create_engine(database_url)
+    models.Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    statement_counter = [0]
+    event.listen(engine, "before_cursor_execute",
+                 lambda *args: statement_counter.__setitem__(0, statement_counter[0] + 1))
+
+    scenario_ids, (legacy_user, bulk_user) = seed(Session)
+    scenario_index.invalidate()
+    stages = make_stages(scenario_ids, submissions)
+
+    print("=" * 72)
+    print(f"save_user_responses on {engine.dialect.name}: {submissions} stage submissions of {STAGE_SIZE} scenarios")
+    print("=" * 72)
+    figures = {}
+    for name, save, user_id in (("legacy", legacy_save_user_responses, legacy_user),
+                                ("set-based", save_user_responses, bulk_user)):
+        elapsed, statements, answers = run(save, Session, stages, user_id, statement_counter)
+        figures[name] = (elapsed, answers)
+        print(f"  {name:<10} {statements / submissions:5.1f} statements/call  "
+              f"{elapsed / submissions * 1000:7.2f} ms/call")
+
+    speedup = figures["legacy"][0] / figures["set-based"][0]
+    print(f"\n  speedup: {speedup:.1f}x, same stored answers: {figures['legacy'][1] == figures['set-based'][1]}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+YETRIA - NumPy Tree Engine Check & Benchmark
+
+Checks that the NumPy tree engine (PREDICTION_ENGINE=numpy) reproduces the
+native LightGBM probabilities on data/model_training_data.csv, both when
+compiled from the pickled model and when loaded from the compact export
+(memory-mapped, without LightGBM), then compares per-call latency.
+
+Exits with status 1 if any probability differs by more than the tolerance
+or any predict_and_analyze result differs.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_tree_engine.py
+"""
+
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_tree_engine.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.services.prediction_service import PredictionService
+
+TOLERANCE = 1e-12
+
+
+def time_call(func, repeats):
+    """Median seconds per call."""
+    func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples))
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    native = PredictionService(engine="native")
+    compiled = PredictionService(engine="numpy")
+    compact = PredictionService(load_mode="compact", engine="numpy")
+
+    data = pd.read_csv(backend_path / "data" / "model_training_data.csv")
+    X = data[native.feature_names].to_numpy(dtype=np.float64)
+    expected = native.model.predict_proba(native.scaler.transform(X))
+
+    print("=" * 72)
+    print(f"Equivalence on data/model_training_data.csv ({len(X)} rows)")
+    print("=" * 72)
+    ok = True
+    for name, service in (("numpy (compiled)", compiled), ("numpy (compact)", compact)):
+        probabilities = service.tree_ensemble.predict_proba(X)
+        max_diff = float(np.abs(probabilities - expected).max())
+        same_class = bool((probabilities.argmax(axis=1) == expected.argmax(axis=1)).all())
+        rows = [dict(zip(native.feature_names, row)) for row in X.tolist()]
+        same_results = all(service.predict_and_analyze(r) == native.predict_and_analyze(r) for r in rows)
+        ok &= max_diff <= TOLERANCE and same_class and same_results
+        print(f"  {name:<18} max |dp| = {max_diff:.2e}  same class: {same_class}  "
+              f"same predict_and_analyze: {same_results}")
+    print(f"  LightGBM booster loaded by compact service: {compact.model is not None}")
+
+    print("\nMedian latency per call")
+    print(f"  {'rows':>6}{'native':>12}{'numpy':>12}{'speedup':>10}")
+    for n_rows in (1, 8, 32, 64, 256):
+        batch = X[:n_rows]
+        repeats = max(20, 2000 // n_rows)
+        native_time = time_call(lambda: native.model.predict_proba(native.scaler.transform(batch)), repeats)
+        numpy_time = time_call(lambda: compiled.tree_ensemble.predict_proba(batch), repeats)
+        print(f"  {n_rows:>6}{native_time * 1e6:>10.0f}us{numpy_time * 1e6:>10.0f}us{native_time / numpy_time:>9.1f}x")
+
+    payload = dict(zip(native.feature_names, X[0].tolist()))
+    native_time = time_call(lambda: native.predict_and_analyze(payload), 2000)
+    numpy_time = time_call(lambda: compiled.predict_and_analyze(payload), 2000)
+    print(f"\n  predict_and_analyze (1 user): native {native_time * 1e6:.0f}us, numpy {numpy_time * 1e6:.0f}us "
+          f"({native_time / numpy_time:.1f}x)")
+
+    if not ok:
+        print("\n❌ NumPy engine does not match the native model")
+        sys.exit(1)
+    print("\n✓ NumPy engine matches the native model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+YETRIA - Worker Memory Benchmark
+
+Starts N worker processes that each load the prediction model, the way N
+uvicorn workers do, and reports per-worker memory for MODEL_LOAD_MODE
+'pickle' (joblib artifacts) and 'compact' (memory-mapped export).
+
+RSS counts shared pages in every process; PSS splits them between the
+processes mapping them, so the PSS sum is the real physical footprint.
+"model private" is the private memory added by loading the model after
+numpy/lightgbm are imported, i.e. the part each worker holds on its own.
+
+A third scenario loads the model once in a parent process and forks the
+workers from it (gunicorn --preload style), so library code and model
+pages start out shared copy-on-write.
+
+Requires Linux (/proc/<pid>/smaps_rollup) and an exported compact model
+(python scripts/ml/export_compact_model.py).
+
+Usage:
+    cd backend
+    python scripts/benchmarks/bench_worker_memory.py [n_workers]
+"""
+
+import multiprocessing as mp
+import sys
+import warnings
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/bench_worker_memory.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+
+def read_memory_kb(pid="self"):
+    """Returns Rss/Pss/Private (kB) from /proc/<pid>/smaps_rollup."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                values[parts[0].rstrip(":")] = int(parts[1])
+    values["Private"] = values.pop("Private_Clean") + values.pop("Private_Dirty")
+    return values
+
+
+def import_ml_stack():
+    """Imports the libraries every worker needs regardless of load mode."""
+    warnings.filterwarnings("ignore")
+    sys.path.insert(0, str(backend_path))
+    import lightgbm  # noqa: F401
+    from app.services.prediction_service import PredictionService
+    return PredictionService
+
+
+def warm(service):
+    service.predict_and_analyze(dict(zip(service.feature_names, [3.5] * len(service.feature_names))))
+
+
+def worker(load_mode, results, release):
+    """Loads the model and reports how much private memory that took."""
+    PredictionService = import_ml_stack()
+    before = read_memory_kb()
+    service = PredictionService(load_mode=load_mode)
+    warm(service)
+    after = read_memory_kb()
+    results.put(after["Private"] - before["Private"])
+    release.wait()
+
+
+def forked_worker(service, results, release):
+    """Serves from the model inherited from the preloading parent."""
+    before = read_memory_kb()
+    warm(service)
+    after = read_memory_kb()
+    results.put(after["Private"] - before["Private"])
+    release.wait()
+
+
+def measure(load_mode, n_workers):
+    """Runs n_workers loaders concurrently and returns their memory figures."""
+    if load_mode == "preload+fork":
+        ctx = mp.get_context("fork")
+        import gc
+        service = import_ml_stack()(load_mode="compact")
+        gc.freeze()
+        target, args = forked_worker, (service,)
+    else:
+        ctx = mp.get_context("spawn")
+        target, args = worker, (load_mode,)
+
+    results, release = ctx.Queue(), ctx.Event()
+    processes = [ctx.Process(target=target, args=args + (results, release)) for _ in range(n_workers)]
+    for process in processes:
+        process.start()
+    deltas = [results.get() for _ in processes]
+    memory = [read_memory_kb(process.pid) for process in processes]
+    release.set()
+    for process in processes:
+        process.join()
+    return {
+        "model_private_kb": sum(deltas) / n_workers,
+        "rss_kb": sum(m["Rss"] for m in memory) / n_workers,
+        "pss_total_kb": sum(m["Pss"] for m in memory),
+    }
+
+
+def main():
+    n_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    print("=" * 72)
+    print(f"Worker memory benchmark ({n_workers} workers)")
+    print("=" * 72)
+    print(f"{'mode':<14}{'model private/worker':>22}{'RSS/worker':>14}{'PSS total':>14}")
+    figures = {}
+    for load_mode in ("pickle", "compact", "preload+fork"):
+        figures[load_mode] = measure(load_mode, n_workers)
+        f = figures[load_mode]
+        print(f"{load_mode:<14}{f['model_private_kb'] / 1024:>19.1f} MB"
+              f"{f['rss_kb'] / 1024:>11.1f} MB{f['pss_total_kb'] / 1024:>11.1f} MB")
+
+    for load_mode in ("compact", "preload+fork"):
+        saved = figures["pickle"]["pss_total_kb"] - figures[load_mode]["pss_total_kb"]
+        print(f"{load_mode:<14} saves {saved / 1024:6.1f} MB across {n_workers} workers "
+              f"({saved / n_workers / 1024:.1f} MB per worker) vs pickle")
+
+
+if __name__ == "__main__":
+    main()
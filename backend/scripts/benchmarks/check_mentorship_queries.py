@@ -0,0 +1,183 @@
+"""
+YETRIA - Mentorship Listing Query-Count Check
+
+Manual check for GET /mentorship/requests (not run by any test suite; the
+repo has none), to run after changing the listing or the auth dependency.
+It seeds students with 1, 10 and 200 requests on a temporary SQLite
+database and asserts that list_student_requests issues the same number of
+statements (one) for each of them, per page, and that a request to the
+endpoint itself issues exactly two whatever the student's history length:
+the listing query plus the revoked-token lookup get_current_claims makes
+on a token cache miss (every call here uses a fresh token).
+It also compares the rows with the previous per-request lookup
+(MentorProfile, User and MatchStatus per row) and checks that walking
+the keyset pages returns every request exactly once.
+
+Exits with code 1 on any failure.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/check_mentorship_queries.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/check_mentorship_queries.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+# Point the app at a temporary database before its engine is created
+temp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'check.db')}"
+
+from app import models
+from app.core import security
+from app.core.database import SessionLocal, engine
+from app.crud.mentorship_crud import list_student_requests
+from app.main import app
+
+REQUEST_COUNTS = (1, 10, 200)
+PAGE_SIZE = 25
+N_MENTORS = 12
+# The listing query plus the revoked-token lookup of a token cache miss
+ENDPOINT_STATEMENTS = 2
+
+
+def legacy_list_requests(db, student_user_id):
+    """Previous implementation: three lookups per request row."""
+    result = []
+    for req in db.query(models.MentorMatch).filter(models.MentorMatch.studentuserid == student_user_id).all():
+        mentor_profile = db.query(models.MentorProfile).filter(
+            models.MentorProfile.mentorprofileid == req.mentorprofileid).first()
+        mentor_user = None
+        if mentor_profile:
+            mentor_user = db.query(models.User).filter(models.User.userid == mentor_profile.userid).first()
+        status = db.query(models.MatchStatus).filter(models.MatchStatus.matchstatusid == req.matchstatusid).first()
+        result.append({
+            "mentorshiprequestid": req.mentormatchid,
+            "userid": req.studentuserid,
+            "mentorprofileid": req.mentorprofileid,
+            "statusid": req.matchstatusid,
+            "createdat": req.requestdate,
+            "mentor_name": mentor_user.name if mentor_user else None,
+            "mentor_company": mentor_profile.company if mentor_profile else None,
+            "mentor_title": mentor_profile.title if mentor_profile else None,
+            "mentor_photourl": mentor_profile.photourl if mentor_profile else None,
+            "status_name": status.statusname if status else None
+        })
+    return result
+
+
+def seed(Session):
+    """Creates statuses, mentors and one student per request count; returns {count: student}."""
+    db = Session()
+    try:
+        db.add(models.Occupation(occupationid=1, title="Bench Occupation"))
+        db.add_all([models.MatchStatus(matchstatusid=i, statusname=name)
+                    for i, name in enumerate(["Talep Gönderildi", "Kabul Edildi", "Reddedildi"], 1)])
+        mentor_users = [models.User(name=f"Mentor {i}", email=f"mentor{i}@example.com", passwordhash="x",
+                                    usertypeid=2) for i in range(N_MENTORS)]
+        students = {count: models.User(name=f"Student {count}", email=f"student{count}@example.com",
+                                       passwordhash="x", usertypeid=1) for count in REQUEST_COUNTS}
+        db.add_all(mentor_users + list(students.values()))
+        db.flush()
+        profiles = [models.MentorProfile(userid=u.userid, occupationid=1, company=f"Company {i}",
+                                         title="Mentor", photourl=None) for i, u in enumerate(mentor_users)]
+        db.add_all(profiles)
+        db.flush()
+        for count, student in students.items():
+            db.add_all([
+                models.MentorMatch(studentuserid=student.userid, mentorprofileid=profiles[i % N_MENTORS].mentorprofileid,
+                                   matchstatusid=i % 3 + 1, matchscore=0.0)
+                for i in range(count)
+            ])
+        db.commit()
+        return {count: (student.userid, security.user_token_claims(student)) for count, student in students.items()}
+    finally:
+        db.close()
+
+
+def endpoint_statements(client, claims, statements):
+    """Statements issued by one GET /api/v1/mentorship/requests for the student."""
+    headers = {"Authorization": f"Bearer {security.create_access_token(claims)}"}
+    statements[0] = 0
+    response = client.get("/api/v1/mentorship/requests", headers=headers)
+    response.raise_for_status()
+    return statements[0], len(response.json())
+
+
+def main():
+    models.Base.metadata.create_all(bind=engine)
+    statements = [0]
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.__setitem__(0, statements[0] + 1))
+    students = seed(SessionLocal)
+
+    print("=" * 72)
+    print("Mentorship request listing: statements per call")
+    print("=" * 72)
+    failures = []
+    db = SessionLocal()
+    try:
+        counts = set()
+        for count, (student_id, _) in students.items():
+            expected = legacy_list_requests(db, student_id)
+            db.expire_all()
+            statements[0] = 0
+            started = time.perf_counter()
+            rows, next_cursor = list_student_requests(db, student_id)
+            elapsed = time.perf_counter() - started
+            counts.add(statements[0])
+            print(f"  {count:4d} requests: {statements[0]} statement(s), {elapsed * 1000:6.2f} ms")
+            if rows != expected or next_cursor is not None:
+                failures.append(f"rows differ from the legacy listing for {count} requests")
+
+            # Walk the keyset pages
+            paged, cursor, pages = [], None, 0
+            while True:
+                statements[0] = 0
+                page, cursor = list_student_requests(db, student_id, limit=PAGE_SIZE, after_id=cursor)
+                counts.add(statements[0])
+                paged.extend(page)
+                pages += 1
+                if cursor is None:
+                    break
+            if paged != expected:
+                failures.append(f"paging with limit={PAGE_SIZE} does not return every request once ({count} requests)")
+            print(f"  {'':4s}           {pages} page(s) of {PAGE_SIZE}")
+
+        if counts != {1}:
+            failures.append(f"statement counts vary or exceed one: {sorted(counts)}")
+
+        print("\n  GET /api/v1/mentorship/requests")
+        client = TestClient(app)
+        endpoint_counts = set()
+        for count, (_, claims) in students.items():
+            n_statements, n_rows = endpoint_statements(client, claims, statements)
+            endpoint_counts.add(n_statements)
+            print(f"  {count:4d} requests: {n_statements} statement(s) (listing + revoked-token lookup)")
+            if n_rows != count:
+                failures.append(f"endpoint returned {n_rows} of {count} requests")
+        if endpoint_counts != {ENDPOINT_STATEMENTS}:
+            failures.append(f"endpoint statement counts {sorted(endpoint_counts)}, expected {ENDPOINT_STATEMENTS} "
+                            f"(listing + revoked-token lookup) for every history length")
+    finally:
+        db.close()
+        engine.dispose()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print(f"\n✓ One listing statement per call ({ENDPOINT_STATEMENTS} per endpoint request, "
+          f"including the revoked-token lookup) regardless of history length")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+YETRIA - Scenario Catalogue ETag Check
+
+Manual check for GET /scenarios (not run by any test suite; the repo has
+none). Seeds 16 scenarios on a temporary SQLite database and checks that:
+- each stage and the full list return the same scenarios as the previous
+  per-request serialization of get_all_scenarios,
+- a matching If-None-Match (plain, weak or in a list) returns 304 and a
+  stale one returns 200,
+- editing an option's text changes the body and ETag once the catalogue
+  has been re-rendered in the background.
+
+Exits with code 1 on any failure.
+
+Usage:
+    cd backend
+    python scripts/benchmarks/check_scenario_catalogue.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/benchmarks/check_scenario_catalogue.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+# Point the app at a temporary database before its engine is created
+temp_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir, 'check.db')}"
+
+from app import models
+from app.api import schemas
+from app.core import security
+from app.core.database import SessionLocal, engine
+from app.crud.scenario_crud import STAGE_COUNT, get_all_scenarios
+from app.main import app
+
+N_SCENARIOS = 16
+N_COMPETENCIES = 8
+REFRESH_TIMEOUT_SECONDS = 5.0
+
+
+def seed(Session):
+    """Creates competencies, scenarios with four options each and a student; returns the student's claims."""
+    db = Session()
+    try:
+        db.add_all([models.Competency(competencyid=i, name=f"Competency {i}") for i in range(1, N_COMPETENCIES + 1)])
+        for scenario_id in range(1, N_SCENARIOS + 1):
+            db.add(models.Scenario(scenarioid=scenario_id, title=f"Scenario {scenario_id}",
+                                   description=f"Description {scenario_id}",
+                                   competencyid=(scenario_id - 1) % N_COMPETENCIES + 1))
+            db.add_all([models.ScenarioOption(scenarioid=scenario_id, optiontext=f"Option {scenario_id}{letter}",
+                                              score=float(score))
+                        for score, letter in enumerate("ABCD", 2)])
+        student = models.User(name="Student", email="student@example.com", passwordhash="x", usertypeid=1)
+        db.add(student)
+        db.commit()
+        return security.user_token_claims(student)
+    finally:
+        db.close()
+
+
+def legacy_scenarios(stage):
+    """Previous endpoint output: get_all_scenarios serialized through the response model."""
+    db = SessionLocal()
+    try:
+        return jsonable_encoder([schemas.Scenario(**scenario) for scenario in get_all_scenarios(db, stage)])
+    finally:
+        db.close()
+
+
+def main():
+    models.Base.metadata.create_all(bind=engine)
+    claims = seed(SessionLocal)
+    headers = {"Authorization": f"Bearer {security.create_access_token(claims)}"}
+    failures = []
+
+    print("=" * 72)
+    print("Scenario catalogue: bodies and ETag revalidation")
+    print("=" * 72)
+    with TestClient(app) as client:
+        etags = {}
+        for stage in (None, *range(1, STAGE_COUNT + 1)):
+            params = {"stage": stage} if stage is not None else {}
+            response = client.get("/api/v1/scenarios", params=params, headers=headers)
+            etag = response.headers.get("ETag")
+            etags[stage] = etag
+            if response.status_code != 200 or not etag:
+                failures.append(f"stage {stage}: status {response.status_code}, ETag {etag}")
+                continue
+            if response.json() != legacy_scenarios(stage):
+                failures.append(f"stage {stage}: body differs from the previous serialization")
+
+            for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+                revalidated = client.get("/api/v1/scenarios", params=params,
+                                         headers={**headers, "If-None-Match": if_none_match})
+                if revalidated.status_code != 304 or revalidated.headers.get("ETag") != etag:
+                    failures.append(f"stage {stage}: If-None-Match {if_none_match} returned {revalidated.status_code}")
+            stale = client.get("/api/v1/scenarios", params=params, headers={**headers, "If-None-Match": '"other"'})
+            if stale.status_code != 200:
+                failures.append(f"stage {stage}: a stale If-None-Match returned {stale.status_code}")
+            print(f"  stage {stage or 'all'}: {len(response.json())} scenarios, ETag {etag}")
+        if len(set(etags.values())) != len(etags):
+            failures.append("stages share an ETag")
+
+        db = SessionLocal()
+        try:
+            option = db.query(models.ScenarioOption).filter(models.ScenarioOption.scenarioid == 1).first()
+            option.optiontext = "Edited option"
+            db.commit()
+        finally:
+            db.close()
+
+        # The first request after the edit may still get the old catalogue while it is re-rendered
+        deadline = time.monotonic() + REFRESH_TIMEOUT_SECONDS
+        while True:
+            response = client.get("/api/v1/scenarios", params={"stage": 1},
+                                  headers={**headers, "If-None-Match": etags[1]})
+            if response.status_code == 200 or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        if response.status_code != 200 or response.headers.get("ETag") == etags[1]:
+            failures.append(f"editing an option did not change the stage 1 ETag within {REFRESH_TIMEOUT_SECONDS:.0f}s")
+        elif "Edited option" not in response.text or response.json() != legacy_scenarios(1):
+            failures.append("the re-rendered stage 1 body does not contain the edit")
+        else:
+            print(f"\n  after editing an option: stage 1 ETag {response.headers['ETag']}")
+    engine.dispose()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("\n✓ Bodies match, matching If-None-Match returns 304, edits change the ETag")
+
+
+if __name__ == "__main__":
+    main()
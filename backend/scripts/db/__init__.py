@@ -0,0 +1,3 @@
+"""
+Database Scripts Package - Schema and Derived Table Maintenance
+"""
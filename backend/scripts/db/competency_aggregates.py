@@ -0,0 +1,87 @@
+"""
+YETRIA - Competency Aggregate Maintenance Script
+
+Creates, backfills and checks the user_competency_aggregate table that
+save_user_responses keeps up to date with deltas.
+
+- create:  create the table if it does not exist
+- rebuild: recompute aggregates from scenarioresponse (all users, or --user)
+- check:   compare aggregates with the response history; exit code 1 on
+           mismatch, --fix rebuilds the users that differ
+
+Run rebuild after deploying the table. Option score and scenario
+competency edits committed through the app rebuild the affected users
+automatically; run check --fix after editing them with raw SQL.
+
+Usage:
+    cd backend
+    python scripts/db/competency_aggregates.py create
+    python scripts/db/competency_aggregates.py rebuild [--user 42 ...]
+    python scripts/db/competency_aggregates.py check [--fix]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/db/competency_aggregates.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.core.database import SessionLocal, engine
+from app.crud.competency_aggregate_crud import find_inconsistent_users, rebuild_user_aggregates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YETRIA - Competency Aggregate Maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("create", help="Create the user_competency_aggregate table")
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Recompute aggregates from scenarioresponse")
+    rebuild_parser.add_argument("--user", type=int, action="append", dest="users", help="Only rebuild this user")
+
+    check_parser = subparsers.add_parser("check", help="Compare aggregates with scenarioresponse")
+    check_parser.add_argument("--fix", action="store_true", help="Rebuild users whose aggregates differ")
+
+    args = parser.parse_args()
+
+    if args.command == "create":
+        models.UserCompetencyAggregate.__table__.create(bind=engine, checkfirst=True)
+        print("✓ user_competency_aggregate table ready")
+        return
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            started = time.perf_counter()
+            rebuild_user_aggregates(db, args.users)
+            db.commit()
+            scope = f"{len(args.users)} user(s)" if args.users else "all users"
+            print(f"✓ Rebuilt competency aggregates for {scope} in {time.perf_counter() - started:.2f}s")
+
+        elif args.command == "check":
+            bad_users = find_inconsistent_users(db)
+            if not bad_users:
+                print("✓ Competency aggregates match scenarioresponse")
+                return
+            print(f"❌ {len(bad_users)} user(s) with inconsistent aggregates: {bad_users[:20]}"
+                  f"{' ...' if len(bad_users) > 20 else ''}")
+            if args.fix:
+                rebuild_user_aggregates(db, bad_users)
+                db.commit()
+                print(f"✓ Rebuilt {len(bad_users)} user(s)")
+            else:
+                sys.exit(1)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
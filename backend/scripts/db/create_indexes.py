@@ -0,0 +1,42 @@
+"""
+YETRIA - Index Creation Script
+
+Creates indexes declared on the ORM models that existing databases were
+created without:
+
+- occupation.title (mentor recommendation lookup by occupation title)
+- mentormatch (studentuserid, mentormatchid) (mentorship request listing)
+
+Indexes that already exist are skipped.
+
+Usage:
+    cd backend
+    python scripts/db/create_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/db/create_indexes.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.core.database import engine
+
+TABLES = (models.Occupation, models.MentorMatch)
+
+
+def main():
+    try:
+        for model in TABLES:
+            for index in model.__table__.indexes:
+                index.create(bind=engine, checkfirst=True)
+                print(f"✓ {index.name} on {model.__tablename__}({', '.join(c.name for c in index.columns)})")
+    except Exception as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
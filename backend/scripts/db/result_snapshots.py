@@ -0,0 +1,61 @@
+"""
+YETRIA - Result Snapshot Maintenance Script
+
+Creates and clears the user_result_snapshot table that GET /responses/result
+serves from. Snapshots are tagged with the model version and a fingerprint
+of the user's competency aggregates and are recomputed automatically when
+either changes, so clearing is only needed after changes neither covers
+(e.g. editing group averages without registering a new artifact version).
+
+Usage:
+    cd backend
+    python scripts/db/result_snapshots.py create
+    python scripts/db/result_snapshots.py clear [--user 42 ...]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/db/result_snapshots.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.core.database import SessionLocal, engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YETRIA - Result Snapshot Maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("create", help="Create the user_result_snapshot table")
+
+    clear_parser = subparsers.add_parser("clear", help="Delete stored snapshots")
+    clear_parser.add_argument("--user", type=int, action="append", dest="users", help="Only clear this user")
+
+    args = parser.parse_args()
+
+    if args.command == "create":
+        models.UserResultSnapshot.__table__.create(bind=engine, checkfirst=True)
+        print("✓ user_result_snapshot table ready")
+        return
+
+    db = SessionLocal()
+    try:
+        query = db.query(models.UserResultSnapshot)
+        if args.users:
+            query = query.filter(models.UserResultSnapshot.userid.in_(args.users))
+        deleted = query.delete(synchronize_session=False)
+        db.commit()
+        print(f"✓ Cleared {deleted} result snapshot(s)")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+YETRIA - Scenario Stage Maintenance Script
+
+Creates and seeds the scenariostage table that assigns scenarios to
+assessment stages. Until it is seeded the API falls back to consecutive
+blocks of 4 scenarios in scenarioid order.
+
+- create: create the table and its (stage, position) index
+- seed:   store the current layout (4 scenarios per stage in scenarioid
+          order); --replace overwrites existing assignments
+- show:   print the stages with their scenarios
+
+Usage:
+    cd backend
+    python scripts/db/scenario_stages.py create
+    python scripts/db/scenario_stages.py seed [--replace]
+    python scripts/db/scenario_stages.py show
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/db/scenario_stages.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app import models
+from app.core.database import SessionLocal, engine
+from app.crud.scenario_crud import STAGE_COUNT, SCENARIOS_PER_STAGE
+
+
+def seed(db, replace: bool) -> None:
+    if db.query(models.ScenarioStage).first() is not None:
+        if not replace:
+            print("⚠️  scenariostage is already seeded; use --replace to overwrite it")
+            return
+        db.query(models.ScenarioStage).delete(synchronize_session=False)
+
+    scenario_ids = [sid for (sid,) in db.query(models.Scenario.scenarioid).order_by(models.Scenario.scenarioid).
+                    limit(STAGE_COUNT * SCENARIOS_PER_STAGE).all()]
+    db.add_all([
+        models.ScenarioStage(scenarioid=sid, stage=i // SCENARIOS_PER_STAGE + 1, position=i % SCENARIOS_PER_STAGE + 1)
+        for i, sid in enumerate(scenario_ids)
+    ])
+    db.commit()
+    print(f"✓ Assigned {len(scenario_ids)} scenarios to stages")
+
+
+def show(db) -> None:
+    rows = db.query(models.ScenarioStage.stage, models.ScenarioStage.position, models.Scenario.scenarioid,
+                    models.Scenario.title).join(
+        models.Scenario, models.Scenario.scenarioid == models.ScenarioStage.scenarioid
+    ).order_by(models.ScenarioStage.stage, models.ScenarioStage.position).all()
+    if not rows:
+        print("scenariostage is empty (using scenarioid order)")
+    for stage, position, scenarioid, title in rows:
+        print(f"  stage {stage} #{position}: scenario {scenarioid} - {title}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YETRIA - Scenario Stage Maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("create", help="Create the scenariostage table")
+    seed_parser = subparsers.add_parser("seed", help="Assign scenarios to stages in scenarioid order")
+    seed_parser.add_argument("--replace", action="store_true", help="Overwrite existing assignments")
+    subparsers.add_parser("show", help="Print stage assignments")
+
+    args = parser.parse_args()
+
+    if args.command == "create":
+        models.ScenarioStage.__table__.create(bind=engine, checkfirst=True)
+        print("✓ scenariostage table ready")
+        return
+
+    db = SessionLocal()
+    try:
+        if args.command == "seed":
+            seed(db, args.replace)
+        elif args.command == "show":
+            show(db)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
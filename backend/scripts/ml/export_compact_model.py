@@ -0,0 +1,30 @@
+"""
+YETRIA - Compact Model Export Script
+
+Exports a registered artifact version to artifacts/compact_<version>/
+(LightGBM text model + NumPy arrays) for MODEL_LOAD_MODE=compact, where
+worker processes memory-map the arrays instead of unpickling sklearn objects.
+
+Usage:
+    cd backend
+    python scripts/ml/export_compact_model.py [version]
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/ml/export_compact_model.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.ml.compact_model import export_compact_model
+
+
+def main():
+    version = sys.argv[1] if len(sys.argv) > 1 else None
+    target = export_compact_model(backend_path / "artifacts", version)
+    print(f"✓ Compact model written to {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+YETRIA - Artifact Registry Management Script
+
+Lists, registers, activates, verifies and prunes the versioned artifact
+manifests that PredictionService loads from artifacts/.
+
+Usage:
+    cd backend
+    python scripts/ml/manage_artifacts.py list
+    python scripts/ml/manage_artifacts.py register artifacts/model_metadata_<version>.json [--no-activate]
+    python scripts/ml/manage_artifacts.py activate <version>
+    python scripts/ml/manage_artifacts.py verify [<version>]
+    python scripts/ml/manage_artifacts.py prune --keep 3 [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend root to Python path
+backend_path = Path(__file__).resolve().parents[2]  # scripts/ml/manage_artifacts.py -> backend/
+sys.path.insert(0, str(backend_path))
+
+from app.ml.artifact_registry import ArtifactRegistry, ArtifactRegistryError
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YETRIA - Artifact Registry Management")
+    parser.add_argument("--artifacts-dir", type=str, default=str(backend_path / "artifacts"))
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List registered versions")
+
+    register_parser = subparsers.add_parser("register", help="Register a training run from its metadata file")
+    register_parser.add_argument("metadata_path", type=str)
+    register_parser.add_argument("--model-type", type=str, default="lightgbm", choices=["lightgbm", "catboost"])
+    register_parser.add_argument("--scaler", type=str, default=None)
+    register_parser.add_argument("--group-means", type=str, default=None)
+    register_parser.add_argument("--no-activate", action="store_true")
+
+    activate_parser = subparsers.add_parser("activate", help="Point CURRENT at a registered version")
+    activate_parser.add_argument("version", type=str)
+
+    verify_parser = subparsers.add_parser("verify", help="Check artifact hashes of a version")
+    verify_parser.add_argument("version", type=str, nargs="?", default=None)
+
+    prune_parser = subparsers.add_parser("prune", help="Remove artifacts of old versions")
+    prune_parser.add_argument("--keep", type=int, default=3)
+    prune_parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    registry = ArtifactRegistry(Path(args.artifacts_dir))
+
+    try:
+        if args.command == "list":
+            current = registry.current_version()
+            for version in registry.list_versions():
+                manifest = registry.load_manifest(version)
+                marker = "*" if version == current else " "
+                print(f"{marker} {version}  {manifest['model_type']:<9} {manifest['artifacts']['model']['file']}")
+        elif args.command == "register":
+            manifest = registry.register_from_metadata(
+                Path(args.metadata_path),
+                model_type=args.model_type,
+                scaler_path=Path(args.scaler) if args.scaler else None,
+                group_means_path=Path(args.group_means) if args.group_means else None,
+                activate=not args.no_activate
+            )
+            print(f"✓ Registered version {manifest['version']}")
+        elif args.command == "activate":
+            registry.activate(args.version)
+            print(f"✓ CURRENT -> {args.version}")
+        elif args.command == "verify":
+            resolved = registry.resolve(args.version, verify=True)
+            print(f"✓ Version {resolved['version']}: all artifact hashes match")
+        elif args.command == "prune":
+            removed = registry.prune(keep=args.keep, dry_run=args.dry_run)
+            action = "Would remove" if args.dry_run else "Removed"
+            for path in removed:
+                print(f"{action}: {path.name}")
+            print(f"{len(removed)} file(s)")
+    except ArtifactRegistryError as e:
+        print(f"❌ ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()